@@ -2,16 +2,139 @@ import disnake
 from disnake.ext import commands, tasks
 import database
 import asyncio
-from datetime import datetime, timedelta, timezone
-import calendar
-import pytz
+from datetime import date, datetime, timedelta, timezone, time, tzinfo
+from collections import OrderedDict, defaultdict
+from typing import Optional
 import functools
+import heapq
+import bisect
+import itertools
 import os
-from utils.timezone_utils import timezone_manager
+import re
+import json
+import aiofiles
+from utils.timezone_utils import timezone_manager, WEEKDAY_NAMES
+from utils.rsvp_migration import get_todays_rsvps_comprehensive
 import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 # Specific user IDs that have access to all admin commands
-ADMIN_USER_IDS = [300157754012860425, 1354616827380236409]
+ADMIN_USER_IDS = frozenset({300157754012860425, 1354616827380236409})
+
+# custom_id of ScheduleDayModal / EditEventModal: "<schedule|edit>_modal_<day>_<guild_id>"
+SCHEDULE_MODAL_CUSTOM_ID_RE = re.compile(r"^(schedule|edit)_modal_([a-z]+)_(\d+)$")
+
+# Discord rejects embeds whose field values exceed this many characters
+EMBED_FIELD_VALUE_LIMIT = 1024
+
+# Longest the posting scheduler sleeps before re-reading posting times, so
+# changes made outside the bot (e.g. directly in the database) are picked up
+POST_SCHEDULER_MAX_SLEEP_SECONDS = 15 * 60
+# Posting minutes missed by a late wake-up are still posted for up to this long afterwards; older
+# ones (e.g. a posting time set to earlier today) wait for the next day instead
+POST_CATCH_UP_WINDOW = timedelta(hours=1)
+
+# File that persists duplicate-prevention timestamps across restarts
+DUPLICATE_TRACKING_FILE = os.getenv('DUPLICATE_TRACKING_FILE', os.path.join('data', 'duplicate_tracking.json'))
+# Tracking entries older than this are dropped when loading, since duplicate checks only look at the current minute
+DUPLICATE_TRACKING_MAX_AGE = timedelta(days=1)
+
+# Color of the daily event post embed
+DAILY_EMBED_COLOR = disnake.Color.blue().value
+
+# Reminder dispatch table: (reminder type, settings flag, fixed time of day or None, minutes before the event)
+REMINDER_WINDOWS = (
+    ('4pm', 'reminder_4pm', time(16, 0), None),
+    ('1_hour', 'reminder_1_hour', None, 60),
+    ('15_minutes', 'reminder_15_minutes', None, 15),
+)
+# Each window covers its start minute plus the next four, so the 5-minute reminder check lands in it once
+REMINDER_WINDOW_MINUTES = 5
+# /debug_reminders label for each reminder type
+REMINDER_WINDOW_LABELS = {
+    '4pm': "4:00 PM",
+    '1_hour': "1 hour before",
+    '15_minutes': "15 minutes before",
+}
+
+# Reminder embed (title, color, footer) by reminder type; None is the fallback for unknown types
+REMINDER_VARIANTS = {
+    '4pm': ("📢 Afternoon Event Reminder", disnake.Color.blue(), "Don't forget to RSVP if you haven't already!"),
+    '1_hour': ("🔔 Event Reminder - 1 Hour", disnake.Color.orange(), "Don't forget to RSVP if you haven't already!"),
+    '15_minutes': ("🚨 Final Reminder - 15 Minutes", disnake.Color.red(), "Last chance to join!"),
+    None: ("📢 Event Reminder", disnake.Color.blue(), "Event reminder"),
+}
+
+# /list_commands embed payload; the content is static, so it is joined once at import
+LIST_COMMANDS_EMBED = {
+    "type": "rich",
+    "title": "📋 Available Commands",
+    "description": "\n".join((
+        "__**🚀 Getting Started**__",
+        "**📅 `/setup_weekly_schedule`** - Plan your week! Tell me what events you want (like Monday raids, Tuesday training, etc.) and I'll post them automatically every day.",
+        "",
+        "**📢 `/set_event_channel`** - Pick which channel I should post events in. This is where your team will see daily announcements and click buttons to say if they're coming.",
+        "",
+        "**⏰ `/set_event_time`** - What time do your events usually start? This helps me send reminders at the right times.",
+        "",
+        "**📅 `/set_posting_time`** - What time should I create the daily RSVP posts? (Default: 9:00 AM Eastern). This is when the post appears each day.",
+        "",
+        "__**📋 Managing Your Events**__",
+        "**📋 `/view_schedule`** - Show me this week's event plan. See what's happening each day at a glance.",
+        "",
+        "**✏️ `/edit_event`** - Change or add events for any day. Maybe Monday changed from 'Raids' to 'PvP Night'? I've got you covered!",
+        "",
+        "**🔔 `/configure_reminders`** - Want reminders? I can ping everyone about tonight's event, or remind them an hour before it starts.",
+        "",
+        "__**👥 See Who's Coming**__",
+        "**👥 `/view_rsvps`** - Who's joining today's event? See the list of people coming, maybe coming, or can't make it.",
+        "",
+        "**📊 `/view_yesterday_rsvps`** - Check who showed up yesterday. Great for seeing attendance trends!",
+        "",
+        "**📈 `/midweek_rsvp_report`** - Get a detailed mid-week RSVP report (Monday-Wednesday). Shows actual member names who RSVPed Yes/No/Maybe/Mobile, plus participation stats and attendance patterns.",
+        "",
+        "**📊 `/weekly_rsvp_report`** - Get a comprehensive weekly RSVP report (Monday-Sunday). Shows member names, attendance analysis, participation trends, and identifies most active attendees.",
+        "",
+        "__**🔧 Help & Support**__",
+        "**📋 `/list_commands`** - Show this help menu again anytime.",
+        "",
+        "**🔧 `/list_help`** - Show troubleshooting, maintenance, and advanced diagnostic commands.",
+    )),
+    "color": disnake.Color.blue().value,
+}
+
+# Permissions the bot needs in the event channel to post event embeds
+POSTING_PERMISSIONS = disnake.Permissions(send_messages=True, embed_links=True)
+
+# Discord bulk delete accepts at most 100 messages, none older than 14 days
+BULK_DELETE_MAX_MESSAGES = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14)
+# Columns of old daily posts that cleanup needs to delete their messages
+OLD_POST_CLEANUP_COLUMNS = 'guild_id,channel_id,message_id'
+# Concurrent single-message deletes per channel for messages too old to bulk delete; disnake paces them per route
+MESSAGE_DELETE_CONCURRENCY = 5
+
+# Cap on concurrent per-guild/per-channel Discord work in background tasks to stay clear of 429s
+MAX_CONCURRENT_GUILD_TASKS = 16
+
+# Concurrent fetch_user calls when resolving RSVPs from users no longer in the guild; replaces fixed sleeps between calls
+USER_FETCH_CONCURRENCY = 5
+
+# RSVP view response fields list names up to this many users, and just the count beyond it
+RSVP_LIST_DISPLAY_LIMIT = 15
+# Past this many users the no-response names can't fit in an embed's 25-field/6000-character limits,
+# so RSVP views show just the count instead of enumerating them
+NO_RESPONSE_LIST_MAX_USERS = 100
+
+# Users fetched from the API are kept for this long, up to this many, so repeat RSVP views don't refetch them
+FETCHED_USER_CACHE_TTL_SECONDS = 3600
+FETCHED_USER_CACHE_MAX_SIZE = 10_000
+
+# How often the scheduler runs its periodic jobs alongside daily posting
+REMINDER_CHECK_INTERVAL = timedelta(minutes=5)
+CLEANUP_OLD_POSTS_INTERVAL = timedelta(hours=24)
 
 
 def check_admin_or_specific_user(inter: disnake.ApplicationCommandInteraction) -> bool:
@@ -24,6 +147,83 @@ def check_admin_or_specific_user(inter: disnake.ApplicationCommandInteraction) -
         return True
     return False
 
+def admin_only():
+    """
+    Command check that rejects users failing check_admin_or_specific_user before the command runs.
+    The user is told here, so ScheduleCog.cog_slash_command_error ignores the resulting CheckFailure.
+    """
+    async def predicate(inter: disnake.ApplicationCommandInteraction) -> bool:
+        if check_admin_or_specific_user(inter):
+            return True
+        await safe_respond(inter, "❌ You don't have permission to use this command.")
+        return False
+    return commands.check(predicate)
+
+@functools.lru_cache(maxsize=128)
+def parse_time_string(time_str: str) -> time:
+    """
+    Parse an "HH:MM:SS" time string as stored in guild settings.
+    Uses the fast ISO parser and only falls back to strptime for non-ISO input (e.g. "9:00:00").
+    Results are memoized since guilds share a handful of distinct time strings.
+    """
+    try:
+        return time.fromisoformat(time_str)
+    except ValueError:
+        return datetime.strptime(time_str, '%H:%M:%S').time()
+
+def reminder_window_start(fixed_time: Optional[time], minutes_before: Optional[int], event_time: time) -> int:
+    """Minute of the day a REMINDER_WINDOWS entry's window opens for an event at event_time"""
+    if fixed_time is not None:
+        return fixed_time.hour * 60 + fixed_time.minute
+    return event_time.hour * 60 + event_time.minute - minutes_before
+
+def format_12_hour_time(hour: int, minute: int) -> str:
+    """Format an hour and minute as "HH:MM AM/PM" with plain arithmetic instead of a locale-dependent strftime"""
+    suffix = 'PM' if hour >= 12 else 'AM'
+    return f"{hour % 12 or 12:02d}:{minute:02d} {suffix}"
+
+def format_schedule_day(event_data: Optional[dict]) -> str:
+    """Format one day of the weekly schedule as a /view_schedule field value"""
+    if not event_data:
+        return "No event scheduled"
+    return (
+        f"**Event:** {event_data.get('event_name', 'N/A')}\n"
+        f"**Outfit:** {event_data.get('outfit', 'N/A')}\n"
+        f"**Vehicle:** {event_data.get('vehicle', 'N/A')}"
+    )
+
+def truncate_text(text: str, limit: int = 100) -> str:
+    """Cut text to at most limit characters, adding '...' when anything was cut"""
+    preview = text[:limit + 1]
+    if len(preview) > limit:
+        return preview[:limit] + "..."
+    return preview
+
+async def safe_respond(inter: disnake.Interaction, content: str, ephemeral: bool = True) -> bool:
+    """
+    Send a message for an interaction, as the initial response or as a followup if it was already acknowledged.
+    Failures are logged rather than raised, since this is used on error paths. Returns whether the message was sent.
+    """
+    try:
+        if inter.response.is_done():
+            await inter.followup.send(content, ephemeral=ephemeral)
+        else:
+            await inter.response.send_message(content, ephemeral=ephemeral)
+        return True
+    except disnake.HTTPException as e:
+        logger.warning("Failed to respond to interaction %s: %s", inter.id, e)
+        return False
+
+@functools.lru_cache(maxsize=8)
+def get_start_of_week(date_ordinal: int, tz: tzinfo) -> datetime:
+    """
+    Get midnight on the Monday of the week containing a date, in the given timezone.
+    Keyed by the date's ordinal so every check on the same day shares one result.
+    """
+    day = date.fromordinal(date_ordinal)
+    monday = day - timedelta(days=day.weekday())
+    return datetime.combine(monday, time(), tzinfo=tz)
+
 class ScheduleDayModal(disnake.ui.Modal):
     def __init__(self, day: str, guild_id: int):
         self.day = day
@@ -114,40 +314,16 @@ class NextDayButton(disnake.ui.View):
         try:
             # Check if interaction has already been acknowledged
             if inter.response.is_done():
-                await inter.followup.send(
-                    "❌ Unable to continue setup due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
+                await safe_respond(inter, "❌ Unable to continue setup due to interaction timing issue. Please try again.")
                 return
             
             await inter.response.send_modal(modal)
         except disnake.HTTPException as e:
-            # If the interaction has already been acknowledged, send a followup
-            try:
-                await inter.followup.send(
-                    "❌ Unable to continue setup due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
-            except:
-                print(f"Failed to send followup message for NextDayButton: {e}")
-            
+            await safe_respond(inter, "❌ Unable to continue setup due to interaction timing issue. Please try again.")
             print(f"Error sending modal in NextDayButton: {e}")
         except Exception as e:
             # Handle any other errors
-            try:
-                if not inter.response.is_done():
-                    await inter.response.send_message(
-                        "❌ An error occurred while continuing setup. Please try again.",
-                        ephemeral=True
-                    )
-                else:
-                    await inter.followup.send(
-                        "❌ An error occurred while continuing setup. Please try again.",
-                        ephemeral=True
-                    )
-            except:
-                print(f"Failed to send error message for NextDayButton: {e}")
-            
+            await safe_respond(inter, "❌ An error occurred while continuing setup. Please try again.")
             print(f"Unexpected error in NextDayButton: {e}")
     
     async def on_timeout(self):
@@ -186,12 +362,14 @@ class RSVPView(disnake.ui.View):
             inter: The Discord message interaction
             response_type: The type of RSVP response (yes, no, maybe, mobile)
         """
+        guild_id = inter.guild.id
+        
         try:
-            # Defer the interaction response immediately to prevent timeout
+            # Defer the interaction response before any database work so a slow
+            # query can't push us past Discord's 3-second acknowledgement window
             await inter.response.defer(ephemeral=True)
             
             user_id = inter.author.id
-            guild_id = inter.guild.id
             
             # Get guild settings to check event time
             guild_settings = await database.get_guild_settings(guild_id)
@@ -206,7 +384,7 @@ class RSVPView(disnake.ui.View):
                 event_time_str = guild_settings['event_time']
                 try:
                     # Parse the time and combine with today's date
-                    event_time = datetime.strptime(event_time_str, '%H:%M:%S').time()
+                    event_time = parse_time_string(event_time_str)
                     event_datetime = datetime.combine(today_date, event_time)
                     event_datetime_local = timezone_manager.localize(event_datetime)
                     
@@ -231,14 +409,7 @@ class RSVPView(disnake.ui.View):
             success = await database.save_rsvp_response(self.post_id, user_id, guild_id, response_type)
             
             if success:
-                # Additional cache invalidation for immediate effect
-                try:
-                    from core.cache_manager import invalidate_rsvp_cache_for_guild
-                    await invalidate_rsvp_cache_for_guild(guild_id)
-                except Exception as cache_error:
-                    # Log but don't fail the RSVP
-                    print(f"Warning: Additional cache invalidation failed: {cache_error}")
-                
+                # save_rsvp_response already invalidated the RSVP cache for this guild
                 response_emoji = {"yes": "✅", "no": "❌", "maybe": "❓", "mobile": "📱"}[response_type]
                 await inter.followup.send(
                     f"{response_emoji} **RSVP Updated!**\n"
@@ -253,30 +424,20 @@ class RSVPView(disnake.ui.View):
                 
         except disnake.NotFound:
             # Interaction has expired or been deleted
-            print(f"RSVP interaction expired for user {inter.author.id} in guild {inter.guild.id}")
+            print(f"RSVP interaction expired for user {inter.author.id} in guild {guild_id}")
         except disnake.HTTPException as e:
             # Handle HTTP errors (rate limits, etc.)
             print(f"HTTP error in RSVP handling: {e}")
         except Exception as e:
             # Handle any other unexpected errors
             print(f"Unexpected error in RSVP handling: {e}")
-            try:
-                # Try to send error message if interaction is still valid
-                await inter.followup.send(
-                    "❌ An error occurred while processing your RSVP. Please try again later.",
-                    ephemeral=True
-                )
-            except:
-                # If we can't send a message, just log the error
-                pass
+            await safe_respond(inter, "❌ An error occurred while processing your RSVP. Please try again later.")
 
 class ScheduleCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         # Track guild setup progress: guild_id -> current_day_index
         self.current_setups = {}
-        # Days of the week in order
-        self.days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
         
         # Use configured timezone for event times
         self.timezone_manager = timezone_manager
@@ -285,24 +446,71 @@ class ScheduleCog(commands.Cog):
         self.last_posted_times = {}  # guild_id -> datetime
         
         # Track last reminder times per guild to prevent duplicates
-        self.last_reminder_times = {}  # (guild_id, reminder_type) -> datetime
+        self.last_reminder_times = {}  # guild_id -> {reminder_type: datetime}
+        
+        # Both dicts are written through to disk so a restart mid-minute doesn't re-post
+        self._duplicate_tracking_lock = asyncio.Lock()
+        self._load_duplicate_tracking()
+        
+        # Cache current-week setup checks until the schedule changes or a new week begins
+        self._week_setup_cache = {}  # (guild_id, (iso_year, iso_week)) -> bool
+        
+        # Date each guild's admins were last told the week isn't set up; one entry per guild, so no pruning needed
+        self._admin_notified_dates = {}  # guild_id -> date
+        
+        # Wake the posting scheduler early when a guild's posting time or channel changes
+        self._post_schedule_changed = asyncio.Event()
+        # Last minute the posting scheduler checked, so each post time fires once
+        self._last_post_check_minute = None
+        # (hour, minute) -> guild IDs posting then; rebuilt each time the scheduler computes its next wake-up
+        self._post_time_index = None
+        
+        # Guild-agnostic parts of today's event embed: ((date, day_name), embed dict)
+        self._daily_embed_template = None
+        
+        # Users fetched from the Discord API for RSVP views, least recently used first
+        self._fetched_users = OrderedDict()  # user_id -> (fetched at on the event loop clock, disnake.User)
+        
+        # Non-bot member IDs per guild for RSVP views; dropped whenever the guild's membership changes
+        self._non_bot_member_ids = {}  # guild_id -> frozenset of user IDs
+        
+        # The bot's own member object per guild for permission checks; dropped when the bot's member is updated
+        self._bot_members = {}  # guild_id -> disnake.Member
+        
+        # Bound concurrent Discord calls when background tasks fan out across guilds
+        self._guild_task_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GUILD_TASKS)
         
-        # Start the daily posting task
-        self.daily_posting_task.start()
-        # Start the reminder checking task
-        self.reminder_check_task.start()
-        # Start the cleanup task
-        self.cleanup_old_posts_task.start()
+        # Periodic jobs run by the scheduler: name -> (coroutine function, interval)
+        self._periodic_job_handlers = {
+            'reminders': (self.check_and_send_reminders, REMINDER_CHECK_INTERVAL),
+            'cleanup': (self._cleanup_old_posts_job, CLEANUP_OLD_POSTS_INTERVAL),
+        }
+        # Heap of (next run on the event loop clock, job name); seeded when the scheduler starts
+        self._periodic_jobs = []
+        # Running periodic jobs; each runs in its own task so a slow job can't delay daily posting
+        self._periodic_job_tasks = {}  # job name -> asyncio.Task
+        
+        # One task schedules daily posting, reminder checks and old post cleanup
+        self.scheduler_task.start()
     
     def cog_unload(self):
-        self.daily_posting_task.cancel()
-        self.reminder_check_task.cancel()
-        self.cleanup_old_posts_task.cancel()
+        self.scheduler_task.cancel()
+        for task in self._periodic_job_tasks.values():
+            task.cancel()
     
     # DRY Helper Methods
-    def _log_with_prefix(self, prefix: str, message: str):
-        """Helper method to standardize logging with prefixes"""
-        print(f"[{prefix}] {message}")
+    async def cog_slash_command_error(self, inter: disnake.ApplicationCommandInteraction, error: Exception):
+        """Ignore admin_only() check failures, which already replied to the user; log any other command error"""
+        if isinstance(error, commands.CheckFailure):
+            return
+        logger.error("Unhandled error in /%s", inter.application_command.name, exc_info=error)
+    
+    def _log_with_prefix(self, prefix: str, message: str, *args, level: int = logging.INFO, exc_info: bool = False):
+        """Helper method to standardize logging with prefixes; extra args are %-formatted only if the level is enabled"""
+        if args:
+            logger.log(level, f"[{prefix}] {message}", *args, exc_info=exc_info)
+        else:
+            logger.log(level, "[%s] %s", prefix, message, exc_info=exc_info)
     
     async def _cleanup_orphaned_guild(self, guild_id: int, log_prefix: str = "SYSTEM"):
         """
@@ -330,9 +538,10 @@ class ScheduleCog(commands.Cog):
         except Exception as e:
             self._log_with_prefix(log_prefix, f"Error cleaning up guild {guild_id}: {e}")
     
-    async def _validate_guild_and_channel(self, guild_id: int, log_prefix: str = "SYSTEM") -> tuple:
+    async def _validate_guild_and_channel(self, guild_id: int, log_prefix: str = "SYSTEM", guild_settings: Optional[dict] = None) -> tuple:
         """
         Helper method to validate guild and channel existence.
+        Pass guild_settings when the caller already has them to skip the settings lookup.
         Returns: (guild, channel, guild_settings) or (None, None, None) if validation fails
         """
         # Get guild
@@ -342,7 +551,8 @@ class ScheduleCog(commands.Cog):
             return None, None, None
         
         # Get guild settings
-        guild_settings = await database.get_guild_settings(guild_id)
+        if guild_settings is None:
+            guild_settings = await database.get_guild_settings(guild_id)
         if not guild_settings or not guild_settings.get('event_channel_id'):
             self._log_with_prefix(log_prefix, f"Guild {guild_id} has no event channel configured, skipping")
             return guild, None, guild_settings
@@ -355,6 +565,169 @@ class ScheduleCog(commands.Cog):
         
         return guild, channel, guild_settings
     
+    def _get_non_bot_member_ids(self, guild: disnake.Guild) -> frozenset:
+        """Helper method to get the IDs of a guild's non-bot members, cached until its membership changes"""
+        member_ids = self._non_bot_member_ids.get(guild.id)
+        if member_ids is None:
+            member_ids = frozenset(member.id for member in guild.members if not member.bot)
+            self._non_bot_member_ids[guild.id] = member_ids
+        return member_ids
+    
+    async def _resolve_users(self, guild: disnake.Guild, user_ids) -> dict:
+        """
+        Helper method to resolve user IDs to members, falling back to the Discord API for non-members.
+        Fetched users are cached (see FETCHED_USER_CACHE_TTL_SECONDS); remaining API fetches run
+        concurrently, bounded by USER_FETCH_CONCURRENCY. Users that can't be fetched are omitted.
+        Returns: {user_id: disnake.Member or disnake.User}
+        """
+        loop_time = asyncio.get_running_loop().time()
+        users = {}
+        misses = []
+        for user_id in user_ids:
+            member = guild.get_member(user_id)
+            if member:
+                users[user_id] = member
+                continue
+            
+            cached = self._fetched_users.get(user_id)
+            if cached and loop_time - cached[0] < FETCHED_USER_CACHE_TTL_SECONDS:
+                self._fetched_users.move_to_end(user_id)
+                users[user_id] = cached[1]
+            else:
+                misses.append(user_id)
+        
+        if misses:
+            semaphore = asyncio.Semaphore(USER_FETCH_CONCURRENCY)
+            
+            async def fetch(user_id: int):
+                async with semaphore:
+                    return await self.bot.fetch_user(user_id)
+            
+            results = await asyncio.gather(*(fetch(user_id) for user_id in misses), return_exceptions=True)
+            for user_id, result in zip(misses, results):
+                if not isinstance(result, Exception):
+                    users[user_id] = result
+                    self._fetched_users[user_id] = (loop_time, result)
+                    self._fetched_users.move_to_end(user_id)
+            while len(self._fetched_users) > FETCHED_USER_CACHE_MAX_SIZE:
+                self._fetched_users.popitem(last=False)
+        
+        return users
+    
+    async def _send_rsvp_summary(self, inter: disnake.ApplicationCommandInteraction, command_name: str, event_date: date,
+                                 fetch_rsvps, *, day_label: str, color: disnake.Color, attendance_labels: tuple,
+                                 no_posts_message: str, show_date: bool = False):
+        """
+        Helper method implementing view_rsvps and view_yesterday_rsvps: defers, fetches the day's posts and
+        RSVPs concurrently, and replies with the summary embed. fetch_rsvps is called with the guild ID.
+        """
+        guild_id = inter.guild.id
+        
+        # Defer the response immediately; member resolution can outlast the 3-second window
+        try:
+            await inter.response.defer(ephemeral=True)
+        except disnake.errors.NotFound:
+            # Interaction has already expired, can't proceed
+            print(f"Interaction expired for {command_name} in guild {guild_id}")
+            return
+        except Exception as e:
+            print(f"Error deferring interaction for {command_name}: {e}")
+            return
+        
+        # Get all posts for the day (handles both automatic and manual posts) and the aggregated
+        # RSVP responses from all of them concurrently
+        posts, rsvps = await asyncio.gather(
+            database.get_all_daily_posts_for_date(guild_id, event_date),
+            fetch_rsvps(guild_id)
+        )
+        if not posts:
+            await inter.edit_original_response(content=no_posts_message)
+            return
+        
+        # Use the most recent post for event details (they should all be the same event)
+        post_data = posts[-1]  # Most recent post
+        description = f"**{post_data['event_data']['event_name']}**"
+        if show_date:
+            description += f"\n📅 {event_date.strftime('%B %d, %Y')}"
+        
+        embed = await self._build_rsvp_summary_embed(
+            inter.guild, posts, rsvps, command_name,
+            title=f"📋 RSVP Summary - {day_label}'s Event",
+            description=description,
+            color=color,
+            attendance_labels=attendance_labels
+        )
+        
+        await inter.edit_original_response(embed=embed)
+    
+    async def _build_rsvp_summary_embed(self, guild: disnake.Guild, posts: list, rsvps: list, command_name: str,
+                                        title: str, description: str, color: disnake.Color,
+                                        attendance_labels: tuple) -> disnake.Embed:
+        """
+        Helper method to build the RSVP summary embed shared by view_rsvps and view_yesterday_rsvps.
+        attendance_labels is the (yes, no) field label pair, since only those differ between the two.
+        """
+        # Non-bot member IDs are cached per guild, so the member list is only walked after membership changes
+        member_ids = self._get_non_bot_member_ids(guild)
+        
+        # Find users who haven't RSVPed
+        rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
+        no_rsvp_user_ids = member_ids - rsvp_user_ids
+        
+        # Bucket responder IDs by type with one dict lookup per RSVP
+        buckets = {'yes': [], 'no': [], 'maybe': [], 'mobile': []}
+        for rsvp in rsvps:
+            bucket = buckets.get(rsvp['response_type'])
+            if bucket is not None:
+                bucket.append(rsvp['user_id'])
+        
+        # Only buckets short enough to be listed need names; larger ones just show their count.
+        # Responders still in the guild resolve from the member cache; only users who left need the API
+        listed_user_ids = {
+            user_id for user_ids in buckets.values() if len(user_ids) <= RSVP_LIST_DISPLAY_LIMIT
+            for user_id in user_ids
+        }
+        self._log_with_prefix("RATE-LIMIT", "Processing %d RSVP responses and %d no-response users for %s",
+                              len(rsvps), len(no_rsvp_user_ids), command_name, level=logging.DEBUG)
+        users_by_id = await self._resolve_users(guild, listed_user_ids)
+        
+        if len(posts) > 1:
+            title += f" ({len(posts)} posts)"
+        embed = disnake.Embed(title=title, description=description, color=color)
+        
+        yes_label, no_label = attendance_labels
+        for response_type, label in (('yes', yes_label), ('maybe', "❓ Maybe"), ('mobile', "📱 Mobile"), ('no', no_label)):
+            user_ids = buckets[response_type]
+            if not user_ids:
+                continue
+            if len(user_ids) > RSVP_LIST_DISPLAY_LIMIT:
+                value = f"{len(user_ids)} users (too many to list)"
+            else:
+                names = []
+                for user_id in user_ids:
+                    user = users_by_id.get(user_id)
+                    names.append(f"{user.display_name} ({user.name})" if user else f"Unknown User ({user_id})")
+                value = "\n".join(names)
+            embed.add_field(name=f"{label} ({len(user_ids)})", value=value, inline=False)
+        
+        if len(no_rsvp_user_ids) > NO_RESPONSE_LIST_MAX_USERS:
+            embed.add_field(
+                name=f"⏰ No Response ({len(no_rsvp_user_ids)})",
+                value=f"{len(no_rsvp_user_ids)} users (too many to list)",
+                inline=False
+            )
+        elif no_rsvp_user_ids:
+            # Users who haven't RSVPed are all current members
+            no_rsvp_users = [
+                f"{member.display_name} ({member.name})"
+                for member in map(guild.get_member, no_rsvp_user_ids) if member
+            ]
+            self.add_no_response_fields(embed, no_rsvp_users, "⏰ No Response")
+        
+        total_responses = sum(len(user_ids) for user_ids in buckets.values())
+        embed.set_footer(text=f"Total responses: {total_responses}/{len(member_ids)} members")
+        return embed
+    
     def _split_user_list_into_fields(self, embed: disnake.Embed, users: list, field_name: str, emoji: str, day_name: str, inline: bool = True):
         """
         Helper method to split long user lists into multiple embed fields if needed.
@@ -418,178 +791,482 @@ class ScheduleCog(commands.Cog):
             return True
         return False
     
-    def _format_time_display(self, event_datetime_local: datetime, event_datetime_utc: datetime) -> tuple:
-        """Helper method to format time displays consistently"""
-        local_time_display, _ = self.timezone_manager.format_time_display(event_datetime_local, include_utc=False)
-        utc_time_display = event_datetime_utc.strftime("%I:%M %p UTC")
-        return local_time_display, utc_time_display
+    def _load_duplicate_tracking(self):
+        """Helper method to seed the duplicate-prevention dicts from disk, dropping stale entries"""
+        try:
+            with open(DUPLICATE_TRACKING_FILE) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self._log_with_prefix("SYSTEM", f"Could not load duplicate tracking from {DUPLICATE_TRACKING_FILE}: {e}")
+            return
+        
+        if not isinstance(data, dict):
+            self._log_with_prefix("SYSTEM", "Ignoring duplicate tracking in %s: expected a JSON object", DUPLICATE_TRACKING_FILE, level=logging.WARNING)
+            return
+        
+        # Malformed entries are skipped one by one so a bad file can't stop the cog from loading
+        cutoff = datetime.now(timezone.utc) - DUPLICATE_TRACKING_MAX_AGE
+        skipped = 0
+        try:
+            last_posted_times = dict(data.get('last_posted_times') or {})
+            last_reminder_times = dict(data.get('last_reminder_times') or {})
+        except (TypeError, ValueError):
+            last_posted_times, last_reminder_times = {}, {}
+            skipped += 1
+        
+        for guild_id, posted_at in last_posted_times.items():
+            try:
+                posted_at = datetime.fromisoformat(posted_at)
+                if posted_at > cutoff:
+                    self.last_posted_times[int(guild_id)] = posted_at
+            except (TypeError, ValueError):
+                skipped += 1
+        for guild_id, reminders in last_reminder_times.items():
+            try:
+                guild_reminder_times = {}
+                for reminder_type, sent_at in reminders.items():
+                    sent_at = datetime.fromisoformat(sent_at)
+                    if sent_at > cutoff:
+                        guild_reminder_times[reminder_type] = sent_at
+                if guild_reminder_times:
+                    self.last_reminder_times[int(guild_id)] = guild_reminder_times
+            except (AttributeError, TypeError, ValueError):
+                skipped += 1
+        
+        if skipped:
+            self._log_with_prefix("SYSTEM", "Skipped %d malformed duplicate tracking entries in %s", skipped, DUPLICATE_TRACKING_FILE, level=logging.WARNING)
+    
+    def _prune_duplicate_tracking(self):
+        """Helper method to drop stale duplicate-prevention entries so the dicts don't grow with guild churn"""
+        cutoff = datetime.now(timezone.utc) - DUPLICATE_TRACKING_MAX_AGE
+        for guild_id in [guild_id for guild_id, posted_at in self.last_posted_times.items() if posted_at <= cutoff]:
+            del self.last_posted_times[guild_id]
+        for guild_id in list(self.last_reminder_times):
+            guild_reminder_times = self.last_reminder_times[guild_id]
+            for reminder_type in [reminder_type for reminder_type, sent_at in guild_reminder_times.items() if sent_at <= cutoff]:
+                del guild_reminder_times[reminder_type]
+            if not guild_reminder_times:
+                del self.last_reminder_times[guild_id]
+    
+    async def _save_duplicate_tracking(self):
+        """Helper method to write the duplicate-prevention dicts to disk atomically"""
+        self._prune_duplicate_tracking()
+        data = {
+            'last_posted_times': {
+                str(guild_id): posted_at.isoformat() for guild_id, posted_at in self.last_posted_times.items()
+            },
+            'last_reminder_times': {
+                str(guild_id): {reminder_type: sent_at.isoformat() for reminder_type, sent_at in reminders.items()}
+                for guild_id, reminders in self.last_reminder_times.items()
+            },
+        }
+        try:
+            async with self._duplicate_tracking_lock:
+                directory = os.path.dirname(DUPLICATE_TRACKING_FILE)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                temp_path = f"{DUPLICATE_TRACKING_FILE}.tmp"
+                async with aiofiles.open(temp_path, 'w') as f:
+                    await f.write(json.dumps(data))
+                os.replace(temp_path, DUPLICATE_TRACKING_FILE)
+        except OSError as e:
+            self._log_with_prefix("SYSTEM", f"Could not save duplicate tracking to {DUPLICATE_TRACKING_FILE}: {e}")
+    
+    async def _record_last_posted(self, guild_id: int, posted_minute: datetime):
+        """Helper method to record a guild's daily post for duplicate prevention"""
+        self.last_posted_times[guild_id] = posted_minute
+        await self._save_duplicate_tracking()
+    
+    async def _record_last_reminder(self, guild_id: int, reminder_type: str, sent_minute: datetime):
+        """Helper method to record a sent reminder for duplicate prevention"""
+        self.last_reminder_times.setdefault(guild_id, {})[reminder_type] = sent_minute
+        await self._save_duplicate_tracking()
+    
+    def _at_time(self, base_datetime: datetime, target_time) -> datetime:
+        """Helper method to move a timezone-aware datetime to a given time of day on the same date"""
+        return datetime.combine(base_datetime.date(), time(target_time.hour, target_time.minute), tzinfo=base_datetime.tzinfo)
+    
+    def _add_embed_fields(self, embed: disnake.Embed, fields: list) -> disnake.Embed:
+        """Helper method to add (name, value, inline) fields in one pass, truncating values Discord would reject"""
+        for name, value, inline in fields:
+            if len(value) > EMBED_FIELD_VALUE_LIMIT:
+                value = value[:EMBED_FIELD_VALUE_LIMIT - 3] + "..."
+            embed.add_field(name=name, value=value, inline=inline)
+        return embed
+    
+    def _get_daily_embed_template(self, today_local: datetime, day_name: str) -> dict:
+        """
+        Helper method to get the guild-agnostic parts of today's event embed as a dict.
+        Built once per day and shared by every guild's post; callers must not mutate it.
+        """
+        cache_key = (today_local.date(), day_name)
+        if self._daily_embed_template is None or self._daily_embed_template[0] != cache_key:
+            # Built as a plain dict in Discord's embed payload shape; no Embed object is needed
+            template = {
+                "type": "rich",
+                "title": f"🎯 Today's Event - {day_name.capitalize()}",
+                "color": DAILY_EMBED_COLOR,
+                "fields": [
+                    {"name": "📅 Date", "value": today_local.strftime("%A, %B %d, %Y"), "inline": False},
+                ],
+                "footer": {"text": "RSVP below to let everyone know if you're attending!"},
+            }
+            self._daily_embed_template = (cache_key, template)
+        return self._daily_embed_template[1]
+    
+    def _format_event_time(self, event_datetime: datetime) -> str:
+        """Helper method to format an aware event time as Discord timestamps, rendered in each viewer's local timezone"""
+        unix_timestamp = int(event_datetime.timestamp())
+        return f"<t:{unix_timestamp}:t> (<t:{unix_timestamp}:R>)"
     
     async def _check_bot_permissions(self, channel: disnake.TextChannel, guild_id: int, log_prefix: str = "SYSTEM") -> bool:
         """
         Helper method to check bot permissions in a channel.
         Returns: True if permissions are sufficient, False otherwise
         """
-        bot_member = channel.guild.get_member(self.bot.user.id)
-        if not bot_member:
+        bot_permissions = self._get_bot_permissions(channel)
+        if bot_permissions is None:
             self._log_with_prefix(log_prefix, f"Bot member not found in guild {guild_id}")
             return False
         
-        if not channel.permissions_for(bot_member).send_messages:
-            self._log_with_prefix(log_prefix, f"Bot doesn't have permission to send messages in channel {channel.id} for guild {guild_id}")
-            return False
+        if bot_permissions.is_superset(POSTING_PERMISSIONS):
+            return True
         
-        if not channel.permissions_for(bot_member).embed_links:
+        if not bot_permissions.send_messages:
+            self._log_with_prefix(log_prefix, f"Bot doesn't have permission to send messages in channel {channel.id} for guild {guild_id}")
+        else:
             self._log_with_prefix(log_prefix, f"Bot doesn't have permission to embed links in channel {channel.id} for guild {guild_id}")
-            return False
-        
-        return True
+        return False
+    
+    def _get_bot_member(self, guild: disnake.Guild) -> Optional[disnake.Member]:
+        """Helper method to get the bot's member object in a guild, cached until the bot's member is updated"""
+        bot_member = self._bot_members.get(guild.id)
+        if bot_member is None:
+            bot_member = guild.get_member(self.bot.user.id)
+            if bot_member is not None:
+                self._bot_members[guild.id] = bot_member
+        return bot_member
     
-    @tasks.loop(minutes=1)  # Check every minute
-    async def daily_posting_task(self):
-        """Check if it's time to post daily events for each guild based on their posting time"""
+    def _get_bot_permissions(self, channel: disnake.TextChannel) -> Optional[disnake.Permissions]:
+        """Helper method to resolve the bot's permissions in a channel once; None if the bot member isn't cached"""
+        bot_member = self._get_bot_member(channel.guild)
+        if not bot_member:
+            return None
+        return channel.permissions_for(bot_member)
+    
+    @tasks.loop()  # Sleeps until the next posting time or periodic job instead of polling
+    async def scheduler_task(self):
+        """Sleep until the next guild posting time or periodic job is due, then run whatever is due"""
         try:
+            # Clear before computing so a change made while we compute still wakes us
+            self._post_schedule_changed.clear()
+            
             now_local = self.timezone_manager.now()
+            current_minute = now_local.replace(second=0, microsecond=0)
+            if self._last_post_check_minute is None:
+                # On startup the current minute still counts as upcoming
+                self._last_post_check_minute = current_minute - timedelta(minutes=1)
+            else:
+                self._last_post_check_minute = max(self._last_post_check_minute, current_minute - POST_CATCH_UP_WINDOW)
+            
+            await self._refresh_post_time_index()
+            next_post_local = self._get_next_post_time(self._last_post_check_minute)
+            if next_post_local is None:
+                delay = POST_SCHEDULER_MAX_SLEEP_SECONDS
+                self._log_with_prefix("TASK", "No guild posting times configured, waiting for a schedule change", level=logging.DEBUG)
+            else:
+                delay = min(max((next_post_local - now_local).total_seconds(), 0), POST_SCHEDULER_MAX_SLEEP_SECONDS)
+                self._log_with_prefix("TASK", "Next daily post check at %s %s", next_post_local.strftime('%Y-%m-%d %H:%M'), self.timezone_manager.display_name, level=logging.DEBUG)
             
-            self._log_with_prefix("TASK", f"Daily posting task running at {now_local.strftime('%H:%M:%S')} {self.timezone_manager.display_name} (seconds: {now_local.second})")
+            loop = asyncio.get_running_loop()
+            if self._periodic_jobs:
+                delay = min(delay, max(self._periodic_jobs[0][0] - loop.time(), 0))
+            
+            try:
+                await asyncio.wait_for(self._post_schedule_changed.wait(), timeout=delay)
+                self._log_with_prefix("TASK", "Posting schedule changed, recomputing next wake-up")
+                return
+            except asyncio.TimeoutError:
+                pass
             
-            # Always call the posting check - let the check function handle duplicate prevention
-            self._log_with_prefix("TASK", "Calling check_and_post_daily_events()")
+            self._start_due_periodic_jobs()
             
-            # Get all guilds with schedules and check their posting times
-            await self.check_and_post_daily_events()
+            # Post for every indexed minute that has arrived, not just the current one, so a
+            # wake-up that lands late (e.g. a busy event loop) still posts for the minute it was due
+            now_local = self.timezone_manager.now()
+            while next_post_local is not None and next_post_local <= now_local:
+                self._last_post_check_minute = next_post_local
+                await self.check_and_post_daily_events(next_post_local)
+                next_post_local = self._get_next_post_time(self._last_post_check_minute)
             
         except Exception as e:
-            print(f"[TASK] Error in daily_posting_task: {e}")
-            traceback.print_exc()
+            self._log_with_prefix("TASK", "Error in scheduler_task: %s", e, level=logging.ERROR, exc_info=True)
+            # Avoid a tight error loop now that the task has no fixed interval
+            await asyncio.sleep(60)
     
-    @daily_posting_task.before_loop
-    async def before_daily_posting(self):
+    @scheduler_task.before_loop
+    async def before_scheduler(self):
         await self.bot.wait_until_ready()
+        # Every periodic job runs once as soon as the bot is ready
+        now = asyncio.get_running_loop().time()
+        self._periodic_jobs = [(now, name) for name in self._periodic_job_handlers]
+        heapq.heapify(self._periodic_jobs)
     
-    @tasks.loop(minutes=5)  # Check every 5 minutes instead of every minute
-    async def reminder_check_task(self):
-        """Check if it's time to send reminders for events"""
-        now_local = self.timezone_manager.now()
-        
-        # Now that we run every 5 minutes, always check
-        print(f"[REMINDER] Checking reminders at {now_local.strftime('%H:%M:%S')} {self.timezone_manager.display_name}")
-        await self.check_and_send_reminders()
+    def _start_due_periodic_jobs(self):
+        """Helper method to start the scheduler's due periodic jobs in their own tasks and queue their next run"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._periodic_jobs and self._periodic_jobs[0][0] <= now:
+            due, name = heapq.heappop(self._periodic_jobs)
+            handler, interval = self._periodic_job_handlers[name]
+            
+            # Schedule from the due time so runs don't drift (reminder windows are exactly one
+            # interval wide), skipping whole intervals already missed so a late start can't
+            # trigger back-to-back catch-up runs
+            interval_seconds = interval.total_seconds()
+            missed_intervals = int((now - due) // interval_seconds)
+            heapq.heappush(self._periodic_jobs, (due + (missed_intervals + 1) * interval_seconds, name))
+            
+            running_task = self._periodic_job_tasks.get(name)
+            if running_task and not running_task.done():
+                self._log_with_prefix("TASK", "Previous %s job still running, skipping this run", name, level=logging.WARNING)
+                continue
+            self._periodic_job_tasks[name] = asyncio.create_task(self._run_periodic_job(name, handler))
     
-    @reminder_check_task.before_loop
-    async def before_reminder_check(self):
-        await self.bot.wait_until_ready()
+    async def _run_periodic_job(self, name: str, handler):
+        """Helper method to run one periodic job, logging rather than raising its errors"""
+        try:
+            await handler()
+        except Exception as e:
+            self._log_with_prefix("TASK", "Error in %s job: %s", name, e, level=logging.ERROR, exc_info=True)
     
-    @tasks.loop(hours=24)  # Run once per day
-    async def cleanup_old_posts_task(self):
+    async def _cleanup_old_posts_job(self):
         """Clean up old daily posts to keep channels clean"""
         try:
             # Get yesterday's date as cutoff using configured timezone (delete posts older than yesterday)
             yesterday = self.timezone_manager.today() - timedelta(days=1)
             
             # Get all old posts
-            old_posts = await database.get_old_daily_posts(yesterday)
+            old_posts = await database.get_old_daily_posts(yesterday, columns=OLD_POST_CLEANUP_COLUMNS)
             
             if not old_posts:
                 return  # No old posts to clean up
             
-            print(f"[RATE-LIMIT] Cleanup task processing {len(old_posts)} old posts")
+            self._log_with_prefix("RATE-LIMIT", "Cleanup task processing %d old posts", len(old_posts), level=logging.DEBUG)
             
-            deleted_count = 0
-            failed_count = 0
-            
-            for post_data in old_posts:
-                try:
-                    guild_id = post_data['guild_id']
-                    channel_id = post_data['channel_id']
-                    message_id = post_data['message_id']
-                    post_id = post_data['id']
-                    
-                    # Get the guild and channel
-                    guild = self.bot.get_guild(guild_id)
-                    if not guild:
-                        # Guild not found, clean up orphaned data
-                        await self._cleanup_orphaned_guild(guild_id, "CLEANUP")
-                        continue
-                    
-                    channel = guild.get_channel(channel_id)
-                    if not channel:
-                        # Channel not found, skip this post
-                        print(f"Channel {channel_id} not found in guild {guild_id}, skipping cleanup")
-                        continue
-                    
-                    # Try to delete the message from Discord only
-                    try:
-                        message = await channel.fetch_message(message_id)
-                        await message.delete()
-                        print(f"Deleted old event message {message_id} from guild {guild_id}")
-                        deleted_count += 1
-                        
-                        # Add rate limiting delay after each Discord API call
-                        await asyncio.sleep(0.5)  # 500ms delay between deletions
-                        
-                    except disnake.NotFound:
-                        # Message already deleted or not found
-                        print(f"Message {message_id} not found in guild {guild_id}, already cleaned up")
-                        deleted_count += 1
-                    except disnake.Forbidden:
-                        # Bot doesn't have permission to delete the message
-                        print(f"Bot doesn't have permission to delete message {message_id} in guild {guild_id}")
-                        failed_count += 1
-                    except Exception as e:
-                        print(f"Error deleting message {message_id} in guild {guild_id}: {e}")
-                        failed_count += 1
-                    
-                    # Note: We do NOT delete from database to preserve RSVP data
-                    
-                except Exception as e:
-                    print(f"Error cleaning up post {post_data.get('id', 'unknown')}: {e}")
-                    failed_count += 1
+            deleted_count, failed_count = await self._delete_old_post_messages(old_posts)
             
             if deleted_count > 0 or failed_count > 0:
-                print(f"Cleanup completed: {deleted_count} Discord messages deleted, {failed_count} failed")
+                self._log_with_prefix("CLEANUP", "Cleanup completed: %d Discord messages deleted, %d failed", deleted_count, failed_count)
                 
         except Exception as e:
-            print(f"Error in cleanup_old_posts_task: {e}")
+            self._log_with_prefix("CLEANUP", "Error in _cleanup_old_posts_job: %s", e, level=logging.ERROR, exc_info=True)
     
-    @cleanup_old_posts_task.before_loop
-    async def before_cleanup_old_posts(self):
-        await self.bot.wait_until_ready()
+    async def _delete_old_post_messages(self, old_posts: list) -> tuple:
+        """
+        Helper method to delete old event messages from Discord, one bulk delete per channel.
+        Database rows are kept to preserve RSVP data.
+        Returns: (deleted_count, failed_count)
+        """
+        posts_by_channel = defaultdict(list)
+        for post_data in old_posts:
+            posts_by_channel[(post_data['guild_id'], post_data['channel_id'])].append(post_data['message_id'])
+        
+        orphaned_guild_ids = set()
+        
+        async def cleanup_channel(guild_id: int, channel_id: int, message_ids: list) -> tuple:
+            try:
+                guild = self.bot.get_guild(guild_id)
+                if not guild:
+                    # Guild not found, clean up orphaned data once per guild
+                    if guild_id not in orphaned_guild_ids:
+                        orphaned_guild_ids.add(guild_id)
+                        await self._cleanup_orphaned_guild(guild_id, "CLEANUP")
+                    return 0, 0
+                
+                channel = guild.get_channel(channel_id)
+                if not channel:
+                    self._log_with_prefix("CLEANUP", "Channel %s not found in guild %s, skipping cleanup", channel_id, guild_id, level=logging.WARNING)
+                    return 0, 0
+                
+                async with self._guild_task_semaphore:
+                    return await self._delete_channel_messages(channel, message_ids)
+                
+            except Exception as e:
+                self._log_with_prefix("CLEANUP", "Error cleaning up posts in channel %s for guild %s: %s", channel_id, guild_id, e, level=logging.ERROR)
+                return 0, len(message_ids)
+        
+        results = await asyncio.gather(
+            *(cleanup_channel(guild_id, channel_id, message_ids) for (guild_id, channel_id), message_ids in posts_by_channel.items())
+        )
+        deleted_count = sum(deleted for deleted, _ in results)
+        failed_count = sum(failed for _, failed in results)
+        return deleted_count, failed_count
+    
+    async def _delete_channel_messages(self, channel: disnake.TextChannel, message_ids: list) -> tuple:
+        """
+        Helper method to delete messages from one channel without fetching them first.
+        Messages under 14 days old go through bulk delete; older ones are deleted individually.
+        Returns: (deleted_count, failed_count)
+        """
+        guild_id = channel.guild.id
+        bulk_cutoff = datetime.now(timezone.utc) - BULK_DELETE_MAX_AGE
+        recent_ids = [message_id for message_id in message_ids if disnake.utils.snowflake_time(message_id) > bulk_cutoff]
+        individual_ids = [message_id for message_id in message_ids if disnake.utils.snowflake_time(message_id) <= bulk_cutoff]
+        
+        deleted_count = 0
+        failed_count = 0
+        
+        for start in range(0, len(recent_ids), BULK_DELETE_MAX_MESSAGES):
+            chunk = recent_ids[start:start + BULK_DELETE_MAX_MESSAGES]
+            try:
+                await channel.delete_messages([disnake.Object(id=message_id) for message_id in chunk])
+                self._log_with_prefix("CLEANUP", "Bulk deleted %d old event messages from channel %s in guild %s", len(chunk), channel.id, guild_id, level=logging.DEBUG)
+                deleted_count += len(chunk)
+            except disnake.NotFound:
+                # Single-message deletes surface NotFound; bulk deletes ignore unknown IDs
+                self._log_with_prefix("CLEANUP", "Message %s not found in guild %s, already cleaned up", chunk[0], guild_id, level=logging.DEBUG)
+                deleted_count += len(chunk)
+            except disnake.Forbidden:
+                self._log_with_prefix("CLEANUP", "Bot doesn't have permission to delete messages in channel %s for guild %s", channel.id, guild_id, level=logging.WARNING)
+                failed_count += len(chunk)
+            except disnake.HTTPException as e:
+                self._log_with_prefix("CLEANUP", "Bulk delete failed in channel %s for guild %s, deleting individually: %s", channel.id, guild_id, e, level=logging.WARNING)
+                individual_ids.extend(chunk)
+        
+        semaphore = asyncio.Semaphore(MESSAGE_DELETE_CONCURRENCY)
+        
+        async def delete_one(message_id: int) -> bool:
+            """Delete one message; returns whether it is gone"""
+            async with semaphore:
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                    self._log_with_prefix("CLEANUP", "Deleted old event message %s from guild %s", message_id, guild_id, level=logging.DEBUG)
+                    return True
+                except disnake.NotFound:
+                    # Message already deleted or not found
+                    self._log_with_prefix("CLEANUP", "Message %s not found in guild %s, already cleaned up", message_id, guild_id, level=logging.DEBUG)
+                    return True
+                except disnake.Forbidden:
+                    # Bot doesn't have permission to delete the message
+                    self._log_with_prefix("CLEANUP", "Bot doesn't have permission to delete message %s in guild %s", message_id, guild_id, level=logging.WARNING)
+                    return False
+                except Exception as e:
+                    self._log_with_prefix("CLEANUP", "Error deleting message %s in guild %s: %s", message_id, guild_id, e, level=logging.ERROR)
+                    return False
+        
+        # Messages too old to bulk delete go one at a time, a few concurrently
+        results = await asyncio.gather(*(delete_one(message_id) for message_id in individual_ids))
+        deleted_individually = sum(results)
+        deleted_count += deleted_individually
+        failed_count += len(results) - deleted_individually
+        
+        return deleted_count, failed_count
     
     async def post_daily_events(self):
         """Post daily events for all guilds"""
         guilds_with_schedules = await database.get_all_guilds_with_schedules()
+        settings_by_guild = await database.get_guild_settings_bulk(guilds_with_schedules)
         
-        for guild_id in guilds_with_schedules:
+        async def post_for_guild(guild_id: int):
             try:
                 guild = self.bot.get_guild(guild_id)
                 if not guild:
-                    continue
+                    return
                 
                 # Get guild settings
-                guild_settings = await database.get_guild_settings(guild_id)
+                guild_settings = settings_by_guild.get(guild_id)
                 if not guild_settings or not guild_settings.get('event_channel_id'):
-                    continue
+                    return
                 
                 channel = guild.get_channel(guild_settings['event_channel_id'])
                 if not channel:
-                    continue
+                    return
                 
                 # Post today's event
-                await self.post_todays_event(guild, channel)
+                async with self._guild_task_semaphore:
+                    await self.post_todays_event(guild, channel, guild_settings)
                 
             except Exception as e:
                 print(f"Error posting daily event for guild {guild_id}: {e}")
+        
+        await asyncio.gather(*(post_for_guild(guild_id) for guild_id in guilds_with_schedules))
     
-    async def check_and_post_daily_events(self):
-        """Check each guild's posting time and post events for guilds whose time matches now"""
-        now_local = self.timezone_manager.now()
-        current_time = now_local.time().replace(second=0, microsecond=0)
+    def _get_guild_post_time(self, guild_settings: dict) -> time:
+        """Helper method to get a guild's posting time, defaulting to 9:00 AM if unset or invalid"""
+        try:
+            return parse_time_string(guild_settings.get('post_time', '09:00:00'))
+        except ValueError:
+            return time(9, 0)
+    
+    async def _refresh_post_time_index(self):
+        """Helper method to rebuild the (hour, minute) -> guild IDs index of guilds that can be auto-posted to"""
+        guild_ids = []
+        for guild_id in await database.get_all_guilds_with_schedules():
+            if self.bot.get_guild(guild_id):
+                guild_ids.append(guild_id)
+            else:
+                await self._cleanup_orphaned_guild(guild_id, "AUTO-POST")
+        
+        settings_by_guild = await database.get_guild_settings_bulk(guild_ids)
+        post_time_index = defaultdict(set)
+        for guild_id, guild_settings in settings_by_guild.items():
+            if guild_settings.get('event_channel_id'):
+                post_time = self._get_guild_post_time(guild_settings)
+                post_time_index[(post_time.hour, post_time.minute)].add(guild_id)
+        self._post_time_index = dict(post_time_index)
+    
+    def _get_next_post_time(self, after_local: datetime) -> Optional[datetime]:
+        """
+        Helper method to find the earliest indexed posting time strictly after the given minute.
+        Returns: Timezone-aware local datetime, or None if no guild can be posted to
+        """
+        if not self._post_time_index:
+            return None
+        post_times = [time(hour, minute) for hour, minute in self._post_time_index]
+        
+        candidates = []
+        for day_offset in (0, 1):
+            post_date = after_local.date() + timedelta(days=day_offset)
+            for post_time in post_times:
+                post_local = self.timezone_manager.localize(datetime.combine(post_date, post_time))
+                if post_local > after_local:
+                    candidates.append(post_local)
+        return min(candidates) if candidates else None
+    
+    def _notify_post_schedule_changed(self):
+        """Helper method to wake the posting scheduler so it picks up new posting times"""
+        self._post_schedule_changed.set()
+    
+    async def check_and_post_daily_events(self, post_minute: Optional[datetime] = None):
+        """
+        Check each guild's posting time and post events for guilds whose time matches the given minute.
+        post_minute is the local posting minute the scheduler woke up for; defaults to the current minute.
+        """
+        now_local = post_minute or self.timezone_manager.now()
+        current_minute_key = now_local.replace(second=0, microsecond=0)
+        current_time = current_minute_key.time()
+        current_hour_minute = (current_time.hour, current_time.minute)
+        
+        if self._post_time_index is None:
+            # Build the index once rather than scanning every guild's settings on this call
+            await self._refresh_post_time_index()
+        
+        # Fast path: only guilds indexed under this minute can match, so most
+        # checks (including every check with no configured guilds) end here
+        # without touching the database; the scheduler keeps the index fresh
+        guilds_with_schedules = list(self._post_time_index.get(current_hour_minute, ()))
+        if not guilds_with_schedules:
+            self._log_with_prefix("AUTO-POST", "No guilds post at %02d:%02d", *current_hour_minute, level=logging.DEBUG)
+            return
         
-        self._log_with_prefix("AUTO-POST", f"Checking at {now_local.strftime('%H:%M:%S')} {self.timezone_manager.display_name}")
+        self._log_with_prefix("AUTO-POST", "Checking %d guilds at %s %s", len(guilds_with_schedules), now_local.strftime('%H:%M:%S'), self.timezone_manager.display_name, level=logging.DEBUG)
         
-        guilds_with_schedules = await database.get_all_guilds_with_schedules()
-        self._log_with_prefix("AUTO-POST", f"Found {len(guilds_with_schedules)} guilds with schedules")
+        settings_by_guild = await database.get_guild_settings_bulk(guilds_with_schedules)
         
+        matching_guilds = []
         for guild_id in guilds_with_schedules:
             try:
                 guild = self.bot.get_guild(guild_id)
@@ -598,64 +1275,77 @@ class ScheduleCog(commands.Cog):
                     continue
                 
                 # Get guild settings
-                guild_settings = await database.get_guild_settings(guild_id)
+                guild_settings = settings_by_guild.get(guild_id)
                 if not guild_settings or not guild_settings.get('event_channel_id'):
-                    self._log_with_prefix("AUTO-POST", f"Guild {guild_id} has no event channel, skipping")
+                    self._log_with_prefix("AUTO-POST", "Guild %s has no event channel, skipping", guild_id, level=logging.DEBUG)
                     continue
                 
                 # Get the posting time for this guild (default to 9:00 AM if not set)
                 post_time_str = guild_settings.get('post_time', '09:00:00')
-                try:
-                    guild_post_time = datetime.strptime(post_time_str, '%H:%M:%S').time()
-                except ValueError:
-                    # If there's an error parsing the time, default to 9 AM
-                    guild_post_time = datetime.strptime('09:00:00', '%H:%M:%S').time()
+                guild_post_time = self._get_guild_post_time(guild_settings)
                 
-                self._log_with_prefix("AUTO-POST", f"Guild {guild_id} posting time: {post_time_str}, current time: {current_time}")
+                self._log_with_prefix("AUTO-POST", "Guild %s posting time: %s, current time: %s", guild_id, post_time_str, current_time, level=logging.DEBUG)
                 
                 # Check if current time matches this guild's posting time
-                if current_time.hour == guild_post_time.hour and current_time.minute == guild_post_time.minute:
+                if current_hour_minute == (guild_post_time.hour, guild_post_time.minute):
                     self._log_with_prefix("AUTO-POST", f"Time match for guild {guild_id}! Attempting to post...")
-                    
-                    # Check if we already posted in this minute to prevent duplicates
-                    current_minute_key = now_local.replace(second=0, microsecond=0)
-                    if self._check_duplicate_prevention(self.last_posted_times, guild_id, current_minute_key, "AUTO-POST", f"daily post for guild {guild_id}"):
-                        continue
-                    
-                    # Check if we already posted today to prevent duplicates
-                    today = now_local.date()
-                    existing_post = await database.get_daily_post(guild_id, today)
-                    
-                    if existing_post:
-                        self._log_with_prefix("AUTO-POST", f"Guild {guild_id} already has a post for today, skipping")
-                        continue
-                    
-                    channel = guild.get_channel(guild_settings['event_channel_id'])
-                    if not channel:
-                        self._log_with_prefix("AUTO-POST", f"Guild {guild_id} event channel not found, skipping")
-                        continue
-                    
-                    # Post today's event for this guild
-                    await self.post_todays_event(guild, channel)
-                    
-                    # Update the last posted time
-                    self.last_posted_times[guild_id] = current_minute_key
-                    
-                    self._log_with_prefix("AUTO-POST", f"Successfully posted daily event for guild {guild_id} at {post_time_str}")
+                    matching_guilds.append((guild, guild_settings))
                 else:
-                    self._log_with_prefix("AUTO-POST", f"No time match for guild {guild_id}: {current_time} vs {guild_post_time}")
+                    self._log_with_prefix("AUTO-POST", "No time match for guild %s: %s vs %s", guild_id, current_time, guild_post_time, level=logging.DEBUG)
+                
+            except Exception as e:
+                print(f"[AUTO-POST] Error checking/posting daily event for guild {guild_id}: {e}")
+                traceback.print_exc()
+        
+        if matching_guilds:
+            # Check which matching guilds already posted today with one query to prevent duplicates
+            existing_posts = await database.get_daily_posts_bulk([guild.id for guild, _ in matching_guilds], now_local.date(), columns='guild_id')
+            for guild, _ in matching_guilds:
+                if guild.id in existing_posts:
+                    self._log_with_prefix("AUTO-POST", f"Guild {guild.id} already has a post for today, skipping")
+            matching_guilds = [(guild, guild_settings) for guild, guild_settings in matching_guilds if guild.id not in existing_posts]
+            
+            # Post for all matching guilds concurrently; each guild handles its own errors
+            await asyncio.gather(
+                *(self._post_for_guild(guild, guild_settings, current_minute_key) for guild, guild_settings in matching_guilds),
+                return_exceptions=True
+            )
+    
+    async def _post_for_guild(self, guild: disnake.Guild, guild_settings: dict, current_minute_key: datetime):
+        """Helper method to post today's event for one guild whose posting time has arrived and has no post yet today"""
+        guild_id = guild.id
+        post_time_str = guild_settings.get('post_time', '09:00:00')
+        
+        async with self._guild_task_semaphore:
+            try:
+                # Check if we already posted in this minute to prevent duplicates
+                if self._check_duplicate_prevention(self.last_posted_times, guild_id, current_minute_key, "AUTO-POST", f"daily post for guild {guild_id}"):
+                    return
+                
+                channel = guild.get_channel(guild_settings['event_channel_id'])
+                if not channel:
+                    self._log_with_prefix("AUTO-POST", f"Guild {guild_id} event channel not found, skipping")
+                    return
+                
+                # Post today's event for this guild
+                await self.post_todays_event(guild, channel, guild_settings)
+                
+                # Update the last posted time
+                await self._record_last_posted(guild_id, current_minute_key)
+                
+                self._log_with_prefix("AUTO-POST", f"Successfully posted daily event for guild {guild_id} at {post_time_str}")
                 
             except Exception as e:
                 print(f"[AUTO-POST] Error checking/posting daily event for guild {guild_id}: {e}")
                 traceback.print_exc()
     
-    async def post_todays_event(self, guild: disnake.Guild, channel: disnake.TextChannel):
-        """Post today's event to the specified channel"""
+    async def post_todays_event(self, guild: disnake.Guild, channel: disnake.TextChannel, guild_settings: Optional[dict] = None):
+        """Post today's event to the specified channel; guild_settings is fetched only if not passed in"""
         guild_id = guild.id
         
         # Get today's day of week (using configured timezone to determine the current day)
         today_local = self.timezone_manager.now()
-        day_name = self.timezone_manager.get_weekday_name(today_local)
+        day_name = WEEKDAY_NAMES[today_local.weekday()]
         
         # Check if current week's schedule is set up
         is_current_week_setup = await self.check_current_week_setup(guild_id)
@@ -668,66 +1358,42 @@ class ScheduleCog(commands.Cog):
         # Delete any existing posts from today before posting new ones
         await self.delete_todays_existing_posts(guild_id, channel)
         
-        # Get schedule for this guild
-        schedule = await database.get_guild_schedule(guild_id)
+        # Get schedule for this guild, along with its settings for the event time if the caller didn't have them
+        if guild_settings is None:
+            schedule, guild_settings = await asyncio.gather(
+                database.get_guild_schedule(guild_id),
+                database.get_guild_settings(guild_id)
+            )
+        else:
+            schedule = await database.get_guild_schedule(guild_id)
         
         if day_name not in schedule:
             return  # No event scheduled for today
         
         event_data = schedule[day_name]
         
-        # Get guild settings for event time
-        guild_settings = await database.get_guild_settings(guild_id)
         event_time_str = guild_settings.get('event_time', '20:00:00') if guild_settings else '20:00:00'
-        event_time = datetime.strptime(event_time_str, '%H:%M:%S').time()
+        event_time = parse_time_string(event_time_str)
         
         # Create event datetime in configured timezone
-        event_datetime_local = today_local.replace(
-            hour=event_time.hour,
-            minute=event_time.minute,
-            second=0,
-            microsecond=0
-        )
+        event_datetime_local = self._at_time(today_local, event_time)
         
-        # Convert to UTC for display
+        # Convert to UTC for the embed timestamp and Discord time display
         event_datetime_utc = self.timezone_manager.to_utc(event_datetime_local)
         
-        # Format times for display
-        local_time_display, utc_time_display = self._format_time_display(event_datetime_local, event_datetime_utc)
-        
-        # Create embed for the event
-        embed = disnake.Embed(
-            title=f"🎯 Today's Event - {day_name.capitalize()}",
-            description=f"**{event_data['event_name']}**",
-            color=disnake.Color.blue(),
-            timestamp=event_datetime_utc
-        )
-        
-        embed.add_field(
-            name="👔 Outfit/Gear",
-            value=event_data['outfit'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🚗 Vehicle",
-            value=event_data['vehicle'],
-            inline=True
-        )
-        
-        embed.add_field(
-            name="⏰ Time",
-            value=f"**{local_time_display}** / **{utc_time_display}**",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📅 Date",
-            value=today_local.strftime("%A, %B %d, %Y"),
-            inline=False
-        )
-        
-        embed.set_footer(text=f"RSVP below to let everyone know if you're attending!")
+        # Create embed for the event from the shared daily template
+        template = self._get_daily_embed_template(today_local, day_name)
+        embed = disnake.Embed.from_dict({
+            **template,
+            "description": f"**{event_data['event_name']}**",
+            "fields": [
+                {"name": "👔 Outfit/Gear", "value": event_data['outfit'], "inline": True},
+                {"name": "🚗 Vehicle", "value": event_data['vehicle'], "inline": True},
+                {"name": "⏰ Time", "value": self._format_event_time(event_datetime_utc), "inline": False},
+                *template["fields"],
+            ],
+        })
+        embed.timestamp = event_datetime_utc
         
         # Create RSVP view
         view = RSVPView("temp_id", guild_id)  # We'll update this with the real post ID
@@ -774,16 +1440,16 @@ class ScheduleCog(commands.Cog):
                 return  # No existing post to delete
             
             # Check if bot has permission to delete messages
-            bot_member = channel.guild.get_member(self.bot.user.id)
-            if not bot_member or not channel.permissions_for(bot_member).manage_messages:
+            bot_permissions = self._get_bot_permissions(channel)
+            if not bot_permissions or not bot_permissions.manage_messages:
                 print(f"Bot doesn't have permission to delete messages in channel {channel.id} for guild {guild_id}")
                 return
             
             # Try to delete the existing message from Discord
             try:
                 message_id = existing_post['message_id']
-                message = await channel.fetch_message(message_id)
-                await message.delete()
+                # Delete by ID directly; fetching the message first would cost an extra round-trip
+                await channel.get_partial_message(message_id).delete()
                 print(f"Deleted existing bot post {message_id} from channel {channel.id} in guild {guild_id}")
             except disnake.NotFound:
                 # Message already deleted or not found
@@ -802,40 +1468,66 @@ class ScheduleCog(commands.Cog):
             print(f"Error deleting today's existing posts for guild {guild_id}: {e}")
 
     async def check_current_week_setup(self, guild_id: int) -> bool:
-        """Check if the current week's schedule has been set up"""
+        """
+        Check if the current week's schedule has been set up.
+        
+        Results are cached per (guild_id, ISO week) since they only change when the
+        schedule is edited (see _invalidate_week_setup_cache) or a new week begins.
+        """
         try:
+            today_local = self.timezone_manager.now()
+            current_week = today_local.isocalendar()[:2]
+            cache_key = (guild_id, current_week)
+            
+            if cache_key in self._week_setup_cache:
+                return self._week_setup_cache[cache_key]
+            
             # Get the schedule
             schedule = await database.get_guild_schedule(guild_id)
             
             if not schedule:
-                return False
-            
-            # Check if the schedule was updated this week
-            schedule_updated = await database.get_schedule_last_updated(guild_id)
-            
-            if not schedule_updated:
-                return False
-            
-            # Get the start of the current week (Monday) using configured timezone
-            today_local = self.timezone_manager.now()
-            days_since_monday = today_local.weekday()
-            start_of_week = today_local - timedelta(days=days_since_monday)
-            start_of_week = start_of_week.replace(hour=0, minute=0, second=0, microsecond=0)
+                is_setup = False
+            else:
+                # Check if the schedule was updated this week
+                schedule_updated = await database.get_schedule_last_updated(guild_id)
+                
+                if not schedule_updated:
+                    is_setup = False
+                else:
+                    # Get the start of the current week (Monday) using configured timezone
+                    start_of_week = get_start_of_week(today_local.toordinal(), self.timezone_manager.timezone)
+                    
+                    # Check if schedule was updated this week
+                    is_setup = schedule_updated >= start_of_week
             
-            # Check if schedule was updated this week
-            return schedule_updated >= start_of_week
+            # Drop entries from previous weeks so the cache stays bounded
+            stale_keys = [key for key in self._week_setup_cache if key[1] != current_week]
+            for key in stale_keys:
+                del self._week_setup_cache[key]
             
+            self._week_setup_cache[cache_key] = is_setup
+            return is_setup
+        
         except Exception as e:
             print(f"Error checking current week setup for guild {guild_id}: {e}")
             return False
     
+    def _invalidate_week_setup_cache(self, guild_id: int):
+        """Forget cached current-week setup results for a guild after its schedule changes"""
+        stale_keys = [key for key in self._week_setup_cache if key[0] == guild_id]
+        for key in stale_keys:
+            del self._week_setup_cache[key]
+    
     async def notify_admins_no_schedule(self, guild: disnake.Guild, channel: disnake.TextChannel):
         """Notify admins that the current week's schedule hasn't been set up"""
         try:
             # Check if we've already notified today (using configured timezone)
             today = self.timezone_manager.today()
-            if await database.check_admin_notification_sent(guild.id, today):
+            if self._admin_notified_dates.get(guild.id) == today:
                 return  # Already notified today
+            if await database.check_admin_notification_sent(guild.id, today):
+                self._admin_notified_dates[guild.id] = today
+                return  # Already notified today (e.g. before a restart)
             
             # Get guild settings to find admin channel or use current channel
             guild_settings = await database.get_guild_settings(guild.id)
@@ -875,6 +1567,7 @@ class ScheduleCog(commands.Cog):
             )
             
             # Mark that we've sent the notification today
+            self._admin_notified_dates[guild.id] = today
             await database.save_admin_notification_sent(guild.id, today)
             
         except Exception as e:
@@ -883,182 +1576,135 @@ class ScheduleCog(commands.Cog):
     async def check_and_send_reminders(self):
         """Check all guilds and send reminders if needed"""
         try:
+            # Read the clock once per tick and share it with every guild's check
             now_local = self.timezone_manager.now()
-            print(f"[REMINDER] Checking reminders at {now_local.strftime('%H:%M:%S')} {self.timezone_manager.display_name}")
+            today = now_local.date()
+            current_minute_key = now_local.replace(second=0, microsecond=0)
+            # Expire old duplicate-prevention entries even on ticks that record nothing
+            self._prune_duplicate_tracking()
+            self._log_with_prefix("REMINDER", "Checking reminders at %s %s", now_local.strftime('%H:%M:%S'), self.timezone_manager.display_name, level=logging.DEBUG)
+            
+            # Get all guilds with reminders enabled (disabled guilds are filtered out by the query)
+            enabled_guilds = await database.get_guilds_needing_reminders()
+            self._log_with_prefix("REMINDER", "Found %d guilds with reminders enabled", len(enabled_guilds), level=logging.DEBUG)
+            
+            if not enabled_guilds:
+                return
             
-            # Get all guilds with reminder settings
-            guilds_data = await database.get_guilds_needing_reminders()
-            print(f"[REMINDER] Found {len(guilds_data)} guilds with reminder settings")
+            # Get today's events and their sent reminders with one query each instead of per guild
+            posts_by_guild = await database.get_daily_posts_bulk([guild_data['guild_id'] for guild_data in enabled_guilds], today)
+            sent_by_post = await database.get_sent_reminders_bulk([post['id'] for post in posts_by_guild.values()])
             
-            for guild_data in guilds_data:
+            async def check_guild(guild_data: dict):
                 guild_id = guild_data['guild_id']
-                settings = guild_data['guild_settings']
-                
-                # Skip if reminders are disabled
-                if not settings.get('reminder_enabled', True):
-                    print(f"[REMINDER] Guild {guild_id} has reminders disabled, skipping")
-                    continue
-                
-                # Get today's event (using configured timezone to determine the day)
-                today = self.timezone_manager.today()
-                post_data = await database.get_daily_post(guild_id, today)
+                post_data = posts_by_guild.get(guild_id)
                 
                 if not post_data:
-                    print(f"[REMINDER] Guild {guild_id} has no event today, skipping")
-                    continue  # No event today
+                    self._log_with_prefix("REMINDER", "Guild %s has no event today, skipping", guild_id, level=logging.DEBUG)
+                    return  # No event today
                 
                 # Check if we need to send reminders
-                await self.check_guild_reminders(guild_id, post_data, settings)
+                async with self._guild_task_semaphore:
+                    await self.check_guild_reminders(
+                        guild_id, post_data, guild_data['guild_settings'], sent_by_post.get(post_data['id'], set()),
+                        now_local, today, current_minute_key
+                    )
+            
+            # Check all guilds concurrently; check_guild_reminders logs its own per-guild errors
+            await asyncio.gather(*(check_guild(guild_data) for guild_data in enabled_guilds), return_exceptions=True)
                 
         except Exception as e:
-            print(f"[REMINDER] Error in check_and_send_reminders: {e}")
-            traceback.print_exc()
+            self._log_with_prefix("REMINDER", "Error in check_and_send_reminders: %s", e, level=logging.ERROR, exc_info=True)
     
-    async def check_guild_reminders(self, guild_id: int, post_data: dict, settings: dict):
-        """Check and send reminders for a specific guild"""
+    async def check_guild_reminders(self, guild_id: int, post_data: dict, settings: dict, sent_reminders: set,
+                                    local_now: datetime, today: date, current_minute_key: datetime):
+        """Check and send reminders for a specific guild at the tick's shared current time"""
         try:
             # Get event time from settings (stored in configured timezone)
             event_time_str = settings.get('event_time', '20:00:00')
-            event_time = datetime.strptime(event_time_str, '%H:%M:%S').time()
-            
-            # Create event datetime in configured timezone
-            today = self.timezone_manager.today()
-            local_now = self.timezone_manager.now()
-            current_minute_key = local_now.replace(second=0, microsecond=0)
-            
-            event_datetime_local = local_now.replace(
-                year=today.year, 
-                month=today.month, 
-                day=today.day,
-                hour=event_time.hour,
-                minute=event_time.minute,
-                second=0,
-                microsecond=0
-            )
+            event_time = parse_time_string(event_time_str)
+            
+            # Find the enabled reminder windows covering this minute of the day; most ticks match
+            # none, so bail out before building any datetimes
+            now_minutes = local_now.hour * 60 + local_now.minute
+            due_reminders = []
+            for reminder_type, setting_key, fixed_time, minutes_before in REMINDER_WINDOWS:
+                window_start = reminder_window_start(fixed_time, minutes_before, event_time)
+                if window_start <= now_minutes < window_start + REMINDER_WINDOW_MINUTES and settings.get(setting_key, True):
+                    due_reminders.append(reminder_type)
+            if not due_reminders:
+                return
             
-            # Convert to UTC for comparison
-            event_datetime_utc = self.timezone_manager.to_utc(event_datetime_local)
+            # Create event datetime in configured timezone
+            event_datetime_local = self._at_time(local_now, event_time)
             
-            print(f"[REMINDER] Checking reminders for guild {guild_id} at {local_now.strftime('%H:%M:%S')} {self.timezone_manager.display_name}")
-            print(f"[REMINDER] Event time: {event_time_str}, Current time: {local_now.strftime('%H:%M:%S')}")
+            self._log_with_prefix("REMINDER", "Checking reminders for guild %s at %s %s", guild_id, local_now.strftime('%H:%M:%S'), self.timezone_manager.display_name, level=logging.DEBUG)
+            self._log_with_prefix("REMINDER", "Event time: %s, Current time: %s", event_time_str, local_now.strftime('%H:%M:%S'), level=logging.DEBUG)
             
-            # Check for 4:00 PM reminder (within 5-minute window: 16:00-16:04)
-            if (settings.get('reminder_enabled', True) and 
-                settings.get('reminder_4pm', True) and
-                local_now.hour == 16 and local_now.minute < 5):  # 4:00-4:04 PM
-                
-                reminder_key = (guild_id, '4pm')
-                if self._check_duplicate_prevention(self.last_reminder_times, reminder_key, current_minute_key, "REMINDER", f"4pm reminder for guild {guild_id}"):
-                    pass  # Skip due to duplicate prevention
-                elif await database.check_reminder_sent(post_data['id'], '4pm'):
-                    self._log_with_prefix("REMINDER", f"Guild {guild_id} 4pm reminder already sent in database, skipping")
-                else:
-                    self._log_with_prefix("REMINDER", f"Sending 4pm reminder for guild {guild_id}")
-                    await self.send_reminder(guild_id, post_data, '4pm', event_datetime_utc)
-                    self.last_reminder_times[reminder_key] = current_minute_key
-            
-            # Check for 1 hour before event reminder (within 5-minute window)
-            one_hour_before = event_datetime_local - timedelta(hours=1)
-            one_hour_before_window_end = one_hour_before + timedelta(minutes=4)  # 5-minute window
-            
-            if (settings.get('reminder_1_hour', True) and 
-                one_hour_before <= local_now <= one_hour_before_window_end):
-                
-                reminder_key = (guild_id, '1_hour')
-                if self._check_duplicate_prevention(self.last_reminder_times, reminder_key, current_minute_key, "REMINDER", f"1_hour reminder for guild {guild_id}"):
-                    pass  # Skip due to duplicate prevention
-                elif await database.check_reminder_sent(post_data['id'], '1_hour'):
-                    self._log_with_prefix("REMINDER", f"Guild {guild_id} 1_hour reminder already sent in database, skipping")
-                else:
-                    self._log_with_prefix("REMINDER", f"Sending 1_hour reminder for guild {guild_id}")
-                    await self.send_reminder(guild_id, post_data, '1_hour', event_datetime_utc)
-                    self.last_reminder_times[reminder_key] = current_minute_key
-            
-            # Check for 15 minutes before event reminder (within 5-minute window)
-            fifteen_min_before = event_datetime_local - timedelta(minutes=15)
-            fifteen_min_before_window_end = fifteen_min_before + timedelta(minutes=4)  # 5-minute window
-            
-            if (settings.get('reminder_15_minutes', True) and 
-                fifteen_min_before <= local_now <= fifteen_min_before_window_end):
-                
-                reminder_key = (guild_id, '15_minutes')
-                if self._check_duplicate_prevention(self.last_reminder_times, reminder_key, current_minute_key, "REMINDER", f"15_minutes reminder for guild {guild_id}"):
-                    pass  # Skip due to duplicate prevention
-                elif await database.check_reminder_sent(post_data['id'], '15_minutes'):
-                    self._log_with_prefix("REMINDER", f"Guild {guild_id} 15_minutes reminder already sent in database, skipping")
-                else:
-                    self._log_with_prefix("REMINDER", f"Sending 15_minutes reminder for guild {guild_id}")
-                    await self.send_reminder(guild_id, post_data, '15_minutes', event_datetime_utc)
-                    self.last_reminder_times[reminder_key] = current_minute_key
+            guild_reminder_times = self.last_reminder_times.get(guild_id, {})
+            for reminder_type in due_reminders:
+                if self._check_duplicate_prevention(guild_reminder_times, reminder_type, current_minute_key, "REMINDER", f"{reminder_type} reminder for guild {guild_id}"):
+                    continue  # Skip due to duplicate prevention
+                if reminder_type in sent_reminders:
+                    self._log_with_prefix("REMINDER", "Guild %s %s reminder already sent in database, skipping", guild_id, reminder_type, level=logging.DEBUG)
+                    continue
                 
+                self._log_with_prefix("REMINDER", "Sending %s reminder for guild %s", reminder_type, guild_id)
+                await self.send_reminder(guild_id, post_data, reminder_type, event_datetime_local, settings, local_now)
+                await self._record_last_reminder(guild_id, reminder_type, current_minute_key)
+            
         except Exception as e:
-            print(f"Error checking reminders for guild {guild_id}: {e}")
+            self._log_with_prefix("REMINDER", "Error checking reminders for guild %s: %s", guild_id, e, level=logging.ERROR)
     
-    async def send_reminder(self, guild_id: int, post_data: dict, reminder_type: str, event_datetime_utc: datetime):
-        """Send a reminder for an event"""
+    async def send_reminder(self, guild_id: int, post_data: dict, reminder_type: str, event_datetime: datetime,
+                            guild_settings: Optional[dict] = None, sent_at: Optional[datetime] = None):
+        """
+        Send a reminder for an event.
+        guild_settings from the reminder query saves a settings lookup; sent_at is the tick's shared current time.
+        """
         try:
-            self._log_with_prefix("REMINDER", f"Attempting to send {reminder_type} reminder for guild {guild_id}")
+            self._log_with_prefix("REMINDER", "Attempting to send %s reminder for guild %s", reminder_type, guild_id, level=logging.DEBUG)
             
-            guild, channel, guild_settings = await self._validate_guild_and_channel(guild_id, "REMINDER")
+            guild, channel, guild_settings = await self._validate_guild_and_channel(guild_id, "REMINDER", guild_settings)
             if not guild or not channel:
                 return
             
-            # Create reminder embed
-            embed = self.create_reminder_embed(post_data, reminder_type, event_datetime_utc)
+            # Mark the reminder as sent before sending; only one claimant (e.g. across bot instances) gets to send it
+            if not await database.try_claim_reminder(post_data['id'], guild_id, reminder_type, post_data['event_date']):
+                self._log_with_prefix("REMINDER", "Guild %s %s reminder already claimed in database, skipping", guild_id, reminder_type, level=logging.DEBUG)
+                return
             
-            # Send reminder
-            await channel.send("@everyone", embed=embed)
-            self._log_with_prefix("REMINDER", f"Successfully sent {reminder_type} reminder to channel {channel.id} for guild {guild_id}")
+            # Create reminder embed
+            embed = self.create_reminder_embed(post_data, reminder_type, event_datetime, sent_at)
             
-            # Mark reminder as sent in database
-            await database.save_reminder_sent(
-                post_data['id'], 
-                guild_id, 
-                reminder_type, 
-                post_data['event_date']
-            )
-            self._log_with_prefix("REMINDER", f"Marked {reminder_type} reminder as sent in database for guild {guild_id}")
+            # Send reminder, releasing the claim on failure so a later check can retry
+            try:
+                await channel.send("@everyone", embed=embed)
+            except Exception:
+                await database.release_reminder_claim(post_data['id'], reminder_type)
+                raise
+            self._log_with_prefix("REMINDER", "Successfully sent %s reminder to channel %s for guild %s", reminder_type, channel.id, guild_id)
             
         except Exception as e:
-            self._log_with_prefix("REMINDER", f"Error sending {reminder_type} reminder for guild {guild_id}: {e}")
-            traceback.print_exc()
+            self._log_with_prefix("REMINDER", "Error sending %s reminder for guild %s: %s", reminder_type, guild_id, e, level=logging.ERROR, exc_info=True)
     
-    def create_reminder_embed(self, post_data: dict, reminder_type: str, event_datetime_utc: datetime) -> disnake.Embed:
-        """Create a reminder embed with timezone conversion"""
+    def create_reminder_embed(self, post_data: dict, reminder_type: str, event_datetime: datetime,
+                              sent_at: Optional[datetime] = None) -> disnake.Embed:
+        """Create a reminder embed; the aware event time is shown as a Discord timestamp, so no conversion is needed"""
         event_data = post_data['event_data']
         
-        # Convert UTC time to user-friendly display
-        # Note: We can't know each user's timezone, so we'll show multiple timezones
-        local_datetime = self.timezone_manager.from_utc(event_datetime_utc)
-        local_time, utc_time = self._format_time_display(local_datetime, event_datetime_utc)
+        # Discord renders the timestamp in each user's own timezone
+        event_time_display = self._format_event_time(event_datetime)
         
         # Set embed properties based on reminder type
-        if reminder_type == '4pm':
-            title = "📢 Afternoon Event Reminder"
-            color = disnake.Color.blue()
-            time_text = f"**Event starts at:** {local_time} / {utc_time}"
-            footer = "Don't forget to RSVP if you haven't already!"
-        elif reminder_type == '1_hour':
-            title = "🔔 Event Reminder - 1 Hour"
-            color = disnake.Color.orange()
-            time_text = f"**Event starts at:** {local_time} / {utc_time}"
-            footer = "Don't forget to RSVP if you haven't already!"
-        elif reminder_type == '15_minutes':
-            title = "🚨 Final Reminder - 15 Minutes"
-            color = disnake.Color.red()
-            time_text = f"**Event starts at:** {local_time} / {utc_time}"
-            footer = "Last chance to join!"
-        else:
-            title = "📢 Event Reminder"
-            color = disnake.Color.blue()
-            time_text = f"**Event starts at:** {local_time} / {utc_time}"
-            footer = "Event reminder"
+        title, color, footer = REMINDER_VARIANTS.get(reminder_type, REMINDER_VARIANTS[None])
+        time_text = f"**Event starts at:** {event_time_display}"
         
         embed = disnake.Embed(
             title=title,
             description=f"**{event_data['event_name']}**",
             color=color,
-            timestamp=datetime.now(timezone.utc)
+            timestamp=sent_at or datetime.now(timezone.utc)
         )
         
         embed.add_field(name="👔 Outfit/Gear", value=event_data['outfit'], inline=True)
@@ -1073,74 +1719,22 @@ class ScheduleCog(commands.Cog):
         name="list_commands",
         description="List all available commands (admin only)"
     )
+    @admin_only()
     async def list_commands(self, inter: disnake.ApplicationCommandInteraction):
         """List all available commands"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
-        commands_list = [
-            "__**🚀 Getting Started**__",
-            "**📅 `/setup_weekly_schedule`** - Plan your week! Tell me what events you want (like Monday raids, Tuesday training, etc.) and I'll post them automatically every day.",
-            "",
-            "**📢 `/set_event_channel`** - Pick which channel I should post events in. This is where your team will see daily announcements and click buttons to say if they're coming.",
-            "",
-            "**⏰ `/set_event_time`** - What time do your events usually start? This helps me send reminders at the right times.",
-            "",
-            "**📅 `/set_posting_time`** - What time should I create the daily RSVP posts? (Default: 9:00 AM Eastern). This is when the post appears each day.",
-            "",
-            "__**📋 Managing Your Events**__",
-            "**📋 `/view_schedule`** - Show me this week's event plan. See what's happening each day at a glance.",
-            "",
-            "**✏️ `/edit_event`** - Change or add events for any day. Maybe Monday changed from 'Raids' to 'PvP Night'? I've got you covered!",
-            "",
-            "**🔔 `/configure_reminders`** - Want reminders? I can ping everyone about tonight's event, or remind them an hour before it starts.",
-            "",
-            "__**👥 See Who's Coming**__",
-            "**👥 `/view_rsvps`** - Who's joining today's event? See the list of people coming, maybe coming, or can't make it.",
-            "",
-            "**📊 `/view_yesterday_rsvps`** - Check who showed up yesterday. Great for seeing attendance trends!",
-            "",
-            "**📈 `/midweek_rsvp_report`** - Get a detailed mid-week RSVP report (Monday-Wednesday). Shows actual member names who RSVPed Yes/No/Maybe/Mobile, plus participation stats and attendance patterns.",
-            "",
-            "**📊 `/weekly_rsvp_report`** - Get a comprehensive weekly RSVP report (Monday-Sunday). Shows member names, attendance analysis, participation trends, and identifies most active attendees.",
-            "",
-            "__**🔧 Help & Support**__",
-            "**📋 `/list_commands`** - Show this help menu again anytime.",
-            "",
-            "**🔧 `/list_help`** - Show troubleshooting, maintenance, and advanced diagnostic commands."
-        ]
-        
-        embed = disnake.Embed(
-            title="📋 Available Commands",
-            description="\n".join(commands_list),
-            color=disnake.Color.blue()
-        )
-        
-        await inter.response.send_message(embed=embed, ephemeral=True)
+        await inter.response.send_message(embed=disnake.Embed.from_dict(LIST_COMMANDS_EMBED), ephemeral=True)
     
     @commands.slash_command(
         name="list_help",
         description="List troubleshooting, maintenance, and diagnostic commands (admin only)"
     )
+    @admin_only()
     async def list_help(self, inter: disnake.ApplicationCommandInteraction):
         """
         List troubleshooting, maintenance, and advanced diagnostic commands.
         Shows commands for fixing issues, cleaning up data, maintaining the bot,
         and diagnosing system problems.
         """
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         debug_commands_list = [
             "__**🛠️ Troubleshooting & Fixes**__",
             "**🚀 `/force_post_rsvp`** - Didn't get today's event post? Use this to make me post it right now.",
@@ -1188,16 +1782,9 @@ class ScheduleCog(commands.Cog):
         name="force_sync",
         description="Force sync commands to Discord (admin only)"
     )
+    @admin_only()
     async def force_sync(self, inter: disnake.ApplicationCommandInteraction):
         """Force sync commands to Discord"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             await inter.response.send_message("🔄 Force syncing commands...", ephemeral=True)
             
@@ -1221,16 +1808,9 @@ class ScheduleCog(commands.Cog):
         name="setup_weekly_schedule",
         description="Set up the weekly schedule for events"
     )
+    @admin_only()
     async def setup_weekly_schedule(self, inter: disnake.ApplicationCommandInteraction):
         """Initialize weekly schedule setup for the guild"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         guild_id = inter.guild.id
         
         # Check if guild is already in setup process
@@ -1247,56 +1827,31 @@ class ScheduleCog(commands.Cog):
         self.current_setups[guild_id] = 0
         
         # Present modal for the first day (Monday)
-        first_day = self.days[0]
+        first_day = WEEKDAY_NAMES[0]
         modal = ScheduleDayModal(first_day, guild_id)
         
         try:
             # Check if interaction has already been acknowledged
             if inter.response.is_done():
-                await inter.followup.send(
-                    "❌ Unable to start setup due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
+                await safe_respond(inter, "❌ Unable to start setup due to interaction timing issue. Please try again.")
                 # Clean up setup state
-                if guild_id in self.current_setups:
-                    del self.current_setups[guild_id]
+                self.current_setups.pop(guild_id, None)
                 return
             
             await inter.response.send_modal(modal)
         except disnake.HTTPException as e:
-            # If the interaction has already been acknowledged, send a followup
-            try:
-                await inter.followup.send(
-                    "❌ Unable to start setup due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
-            except:
-                print(f"Failed to send followup message for setup_weekly_schedule: {e}")
+            await safe_respond(inter, "❌ Unable to start setup due to interaction timing issue. Please try again.")
             
             # Clean up setup state
-            if guild_id in self.current_setups:
-                del self.current_setups[guild_id]
+            self.current_setups.pop(guild_id, None)
             
             print(f"Error sending modal in setup_weekly_schedule: {e}")
         except Exception as e:
             # Handle any other errors
-            try:
-                if not inter.response.is_done():
-                    await inter.response.send_message(
-                        "❌ An error occurred while starting the setup. Please try again.",
-                        ephemeral=True
-                    )
-                else:
-                    await inter.followup.send(
-                        "❌ An error occurred while starting the setup. Please try again.",
-                        ephemeral=True
-                    )
-            except:
-                print(f"Failed to send error message for setup_weekly_schedule: {e}")
+            await safe_respond(inter, "❌ An error occurred while starting the setup. Please try again.")
             
             # Clean up setup state
-            if guild_id in self.current_setups:
-                del self.current_setups[guild_id]
+            self.current_setups.pop(guild_id, None)
             
             print(f"Unexpected error in setup_weekly_schedule: {e}")
     
@@ -1304,16 +1859,9 @@ class ScheduleCog(commands.Cog):
         name="reset_setup",
         description="Reset/clear any stuck weekly schedule setup process (admin only)"
     )
+    @admin_only()
     async def reset_setup(self, inter: disnake.ApplicationCommandInteraction):
         """Reset/clear any stuck weekly schedule setup process"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         guild_id = inter.guild.id
         
         # Check if guild is in setup process
@@ -1340,20 +1888,13 @@ class ScheduleCog(commands.Cog):
         description="Set the channel where daily events will be posted",
         guild_ids=None  # This makes it a global command
     )
+    @admin_only()
     async def set_event_channel(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         channel: disnake.TextChannel = commands.Param(description="Channel for daily event posts")
     ):
         """Set the event channel for daily posts"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             guild_id = inter.guild.id
             print(f"Setting event channel for guild {guild_id} to channel {channel.id}")
@@ -1362,6 +1903,7 @@ class ScheduleCog(commands.Cog):
             success = await database.save_guild_settings(guild_id, {"event_channel_id": channel.id})
             
             if success:
+                self._notify_post_schedule_changed()
                 await inter.response.send_message(
                     f"✅ **Event Channel Set!**\n"
                     f"Daily events will now be posted to {channel.mention}",
@@ -1386,6 +1928,7 @@ class ScheduleCog(commands.Cog):
         name="set_event_time",
         description="Set the time when events start (Eastern Time)"
     )
+    @admin_only()
     async def set_event_time(
         self, 
         inter: disnake.ApplicationCommandInteraction,
@@ -1393,14 +1936,6 @@ class ScheduleCog(commands.Cog):
         minute: int = commands.Param(description="Minute (0-59)", ge=0, le=59)
     ):
         """Set the event time in Eastern Time"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             guild_id = inter.guild.id
             
@@ -1421,7 +1956,7 @@ class ScheduleCog(commands.Cog):
             
             if success:
                 # Convert to 12-hour format for display
-                local_time = datetime.strptime(time_str, '%H:%M:%S').strftime('%I:%M %p')
+                local_time = format_12_hour_time(hour, minute)
                 await inter.response.send_message(
                     f"✅ **Event Time Set!**\n"
                     f"Events will start at **{local_time} {self.timezone_manager.display_name}**\n"
@@ -1445,6 +1980,7 @@ class ScheduleCog(commands.Cog):
         name="set_posting_time",
         description="Set the time when daily event posts are created (Eastern Time)"
     )
+    @admin_only()
     async def set_posting_time(
         self, 
         inter: disnake.ApplicationCommandInteraction,
@@ -1452,14 +1988,6 @@ class ScheduleCog(commands.Cog):
         minute: int = commands.Param(description="Minute (0-59)", ge=0, le=59)
     ):
         """Set the posting time in Eastern Time"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             guild_id = inter.guild.id
             
@@ -1479,8 +2007,9 @@ class ScheduleCog(commands.Cog):
             success = await database.save_guild_settings(guild_id, {"post_time": time_str})
             
             if success:
+                self._notify_post_schedule_changed()
                 # Convert to 12-hour format for display
-                local_time = datetime.strptime(time_str, '%H:%M:%S').strftime('%I:%M %p')
+                local_time = format_12_hour_time(hour, minute)
                 await inter.response.send_message(
                     f"✅ **Daily Posting Time Set!**\n"
                     f"Daily event posts will be created at **{local_time} {self.timezone_manager.display_name}**\n"
@@ -1504,6 +2033,7 @@ class ScheduleCog(commands.Cog):
         name="configure_reminders",
         description="Configure reminder settings for events"
     )
+    @admin_only()
     async def configure_reminders(
         self, 
         inter: disnake.ApplicationCommandInteraction,
@@ -1513,14 +2043,6 @@ class ScheduleCog(commands.Cog):
         fifteen_minutes: bool = commands.Param(description="Send reminder 15 minutes before event", default=True)
     ):
         """Configure reminder settings"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             guild_id = inter.guild.id
             
@@ -1532,8 +2054,10 @@ class ScheduleCog(commands.Cog):
                 "reminder_15_minutes": fifteen_minutes
             }
             
-            # Save to database
-            success = await database.save_guild_settings(guild_id, settings)
+            # Only write the settings that changed, so re-running the command to check them skips the database write
+            current_settings = await database.get_guild_settings(guild_id) or {}
+            changed_settings = {key: value for key, value in settings.items() if current_settings.get(key) != value}
+            success = await database.save_guild_settings(guild_id, changed_settings) if changed_settings else True
             
             if success:
                 # Create status message
@@ -1556,7 +2080,10 @@ class ScheduleCog(commands.Cog):
                     inline=False
                 )
                 
-                embed.set_footer(text="Reminders are sent automatically based on your event time")
+                if changed_settings:
+                    embed.set_footer(text="Reminders are sent automatically based on your event time")
+                else:
+                    embed.set_footer(text="No changes - these were already your reminder settings")
                 
                 await inter.response.send_message(embed=embed, ephemeral=True)
             else:
@@ -1576,20 +2103,13 @@ class ScheduleCog(commands.Cog):
         name="set_admin_channel",
         description="Set the channel for admin notifications (admin only)"
     )
+    @admin_only()
     async def set_admin_channel(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         channel: disnake.TextChannel = commands.Param(description="Channel for admin notifications")
     ):
         """Set the channel for admin notifications"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         try:
             guild_id = inter.guild.id
             
@@ -1620,26 +2140,19 @@ class ScheduleCog(commands.Cog):
         name="edit_event",
         description="Add or edit an event for a specific day (admin only)"
     )
+    @admin_only()
     async def edit_event(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         day: str = commands.Param(
             description="Day of the week to add or edit",
-            choices=["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+            choices=list(WEEKDAY_NAMES)
         )
     ):
         """Add or edit an event for a specific day"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
+        guild_id = inter.guild.id
         
         try:
-            guild_id = inter.guild.id
-            
             # Get current schedule
             schedule = await database.get_guild_schedule(guild_id)
             
@@ -1653,59 +2166,26 @@ class ScheduleCog(commands.Cog):
             
             # Check if interaction has already been acknowledged
             if inter.response.is_done():
-                await inter.followup.send(
-                    "❌ Unable to show edit modal due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
+                await safe_respond(inter, "❌ Unable to show edit modal due to interaction timing issue. Please try again.")
                 return
             
             await inter.response.send_modal(modal)
             
-        except disnake.HTTPException as e:
-            # If the interaction has already been acknowledged, send a followup
-            try:
-                await inter.followup.send(
-                    "❌ Unable to show edit modal due to interaction timing issue. Please try again.",
-                    ephemeral=True
-                )
-            except:
-                print(f"Failed to send followup message for edit_event: {e}")
-            
-            print(f"Error sending modal in edit_event: {e}")
+        except disnake.HTTPException:
+            await safe_respond(inter, "❌ Unable to show edit modal due to interaction timing issue. Please try again.")
+            self._log_with_prefix("EDIT-EVENT", "Error sending modal in guild %s", guild_id, level=logging.ERROR, exc_info=True)
         except Exception as e:
             # Handle any other errors
-            try:
-                if not inter.response.is_done():
-                    await inter.response.send_message(
-                        f"❌ **Error Editing Event**\n"
-                        f"An error occurred: {str(e)}",
-                        ephemeral=True
-                    )
-                else:
-                    await inter.followup.send(
-                        f"❌ **Error Editing Event**\n"
-                        f"An error occurred: {str(e)}",
-                        ephemeral=True
-                    )
-            except:
-                print(f"Failed to send error message for edit_event: {e}")
-            
-            print(f"Unexpected error in edit_event: {e}")
+            await safe_respond(inter, f"❌ **Error Editing Event**\nAn error occurred: {e}")
+            self._log_with_prefix("EDIT-EVENT", "Unexpected error in guild %s", guild_id, level=logging.ERROR, exc_info=True)
     
     @commands.slash_command(
         name="view_schedule",
         description="View the current weekly schedule (admin only)"
     )
+    @admin_only()
     async def view_schedule(self, inter: disnake.ApplicationCommandInteraction):
         """View the current weekly schedule"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.defer(ephemeral=True)
-            await inter.edit_original_response(
-                content="❌ You don't have permission to use this command."
-            )
-            return
-        
         try:
             await inter.response.defer(ephemeral=True)
             guild_id = inter.guild.id
@@ -1730,24 +2210,10 @@ class ScheduleCog(commands.Cog):
                 color=disnake.Color.blue()
             )
             
-            days_ordered = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-            
-            for day in days_ordered:
-                if day in schedule:
-                    event_data = schedule[day]
-                    embed.add_field(
-                        name=f"{day.capitalize()}",
-                        value=f"**Event:** {event_data.get('event_name', 'N/A')}\n"
-                              f"**Outfit:** {event_data.get('outfit', 'N/A')}\n"
-                              f"**Vehicle:** {event_data.get('vehicle', 'N/A')}",
-                        inline=True
-                    )
-                else:
-                    embed.add_field(
-                        name=f"{day.capitalize()}",
-                        value="No event scheduled",
-                        inline=True
-                    )
+            # Build all seven day fields in one pass, then add them
+            fields = [(day.capitalize(), format_schedule_day(schedule.get(day))) for day in WEEKDAY_NAMES]
+            for name, value in fields:
+                embed.add_field(name=name, value=value, inline=True)
             
             embed.set_footer(text="Use /edit_event to add or modify any day's event")
             
@@ -1772,301 +2238,48 @@ class ScheduleCog(commands.Cog):
         This command always fetches live data directly from the database
         without using any caching mechanisms to ensure real-time accuracy.
         """
-        guild_id = inter.guild.id
-        # Use configured timezone to determine what day it is
-        today = self.timezone_manager.today()
-        
-        # Get all posts for today (handles both automatic and manual posts)
-        # NOTE: Direct database call - no caching to ensure live data
-        posts = await database.get_all_daily_posts_for_date(guild_id, today)
-        if not posts:
-            await inter.response.send_message(
-                "❌ **No Event Posted Today**\n"
-                "No daily event has been posted for today yet.",
-                ephemeral=True
-            )
-            return
-        
-        # Get aggregated RSVP responses from all posts for today
-        # NOTE: Using comprehensive method to ensure we get all RSVPs
-        from utils.rsvp_migration import get_todays_rsvps_comprehensive
-        rsvps = await get_todays_rsvps_comprehensive(guild_id)
-        
-        # Use the most recent post for event details (they should all be the same event)
-        post_data = posts[-1]  # Most recent post
-        
-        # Get all guild members (excluding bots)
-        all_members = [member for member in inter.guild.members if not member.bot]
-        
-        # Create sets for easier comparison
-        rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
-        all_user_ids = {member.id for member in all_members}
-        
-        # Find users who haven't RSVPed
-        no_rsvp_user_ids = all_user_ids - rsvp_user_ids
-        
-        # Organize responses with Discord names
-        yes_users = []
-        no_users = []
-        maybe_users = []
-        mobile_users = []
-        no_rsvp_users = []
-        
-        # Process RSVP responses
-        print(f"[RATE-LIMIT] Processing {len(rsvps)} RSVP responses for view_rsvps")
-        for rsvp in rsvps:
-            user_id = rsvp['user_id']
-            user = inter.guild.get_member(user_id)
-            
-            if user:
-                user_display = f"{user.display_name} ({user.name})"
-            else:
-                # Try to fetch user from Discord API
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    user_display = f"{user.display_name} ({user.name})"
-                    # Add rate limiting delay
-                    await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                except:
-                    user_display = f"Unknown User ({user_id})"
-            
-            if rsvp['response_type'] == 'yes':
-                yes_users.append(user_display)
-            elif rsvp['response_type'] == 'no':
-                no_users.append(user_display)
-            elif rsvp['response_type'] == 'maybe':
-                maybe_users.append(user_display)
-            elif rsvp['response_type'] == 'mobile':
-                mobile_users.append(user_display)
-        
-        # Process users who haven't RSVPed
-        print(f"[RATE-LIMIT] Processing {len(no_rsvp_user_ids)} no-response users for view_rsvps")
-        for user_id in no_rsvp_user_ids:
-            user = inter.guild.get_member(user_id)
-            
-            if user:
-                user_display = f"{user.display_name} ({user.name})"
-                no_rsvp_users.append(user_display)
-            else:
-                # Try to fetch user from Discord API
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    user_display = f"{user.display_name} ({user.name})"
-                    no_rsvp_users.append(user_display)
-                    # Add rate limiting delay
-                    await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                except:
-                    # Skip users we can't fetch (they might have left the server)
-                    continue
-        
-        # Create embed
-        embed_title = "📋 RSVP Summary - Today's Event"
-        if len(posts) > 1:
-            embed_title += f" ({len(posts)} posts)"
-        
-        embed = disnake.Embed(
-            title=embed_title,
-            description=f"**{post_data['event_data']['event_name']}**",
-            color=disnake.Color.blue()
-        )
-        
-        if yes_users:
-            embed.add_field(
-                name=f"✅ Attending ({len(yes_users)})",
-                value="\n".join(yes_users) if len(yes_users) <= 15 else f"{len(yes_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if maybe_users:
-            embed.add_field(
-                name=f"❓ Maybe ({len(maybe_users)})",
-                value="\n".join(maybe_users) if len(maybe_users) <= 15 else f"{len(maybe_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if mobile_users:
-            embed.add_field(
-                name=f"📱 Mobile ({len(mobile_users)})",
-                value="\n".join(mobile_users) if len(mobile_users) <= 15 else f"{len(mobile_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if no_users:
-            embed.add_field(
-                name=f"❌ Not Attending ({len(no_users)})",
-                value="\n".join(no_users) if len(no_users) <= 15 else f"{len(no_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if no_rsvp_users:
-            self.add_no_response_fields(embed, no_rsvp_users, "⏰ No Response")
-        
-        total_responses = len(yes_users) + len(maybe_users) + len(mobile_users) + len(no_users)
-        total_members = len(all_members)
-        embed.set_footer(text=f"Total responses: {total_responses}/{total_members} members")
-        
-        await inter.response.send_message(embed=embed, ephemeral=True)
-    
-    @commands.slash_command(
-        name="view_yesterday_rsvps",
-        description="View RSVP responses for yesterday's event"
-    )
-    async def view_yesterday_rsvps(self, inter: disnake.ApplicationCommandInteraction):
-        """View RSVP responses for yesterday's event"""
-        guild_id = inter.guild.id
-        # Use configured timezone to determine what day it is
-        yesterday = self.timezone_manager.today() - timedelta(days=1)
-        
-        # Get all posts for yesterday (handles both automatic and manual posts)
-        posts = await database.get_all_daily_posts_for_date(guild_id, yesterday)
-        if not posts:
-            await inter.response.send_message(
-                "❌ **No Event Posted Yesterday**\n"
-                f"No daily event was posted for {yesterday.strftime('%B %d, %Y')}.",
-                ephemeral=True
-            )
-            return
-        
-        # Get aggregated RSVP responses from all posts for yesterday
-        rsvps = await database.get_aggregated_rsvp_responses_for_date(guild_id, yesterday)
-        
-        # Use the most recent post for event details (they should all be the same event)
-        post_data = posts[-1]  # Most recent post
-        
-        # Get all guild members (excluding bots)
-        all_members = [member for member in inter.guild.members if not member.bot]
-        
-        # Create sets for easier comparison
-        rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
-        all_user_ids = {member.id for member in all_members}
-        
-        # Find users who haven't RSVPed
-        no_rsvp_user_ids = all_user_ids - rsvp_user_ids
-        
-        # Organize responses with Discord names
-        yes_users = []
-        no_users = []
-        maybe_users = []
-        mobile_users = []
-        no_rsvp_users = []
-        
-        # Process RSVP responses
-        print(f"[RATE-LIMIT] Processing {len(rsvps)} RSVP responses for view_yesterday_rsvps")
-        for rsvp in rsvps:
-            user_id = rsvp['user_id']
-            user = inter.guild.get_member(user_id)
-            
-            if user:
-                user_display = f"{user.display_name} ({user.name})"
-            else:
-                # Try to fetch user from Discord API
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    user_display = f"{user.display_name} ({user.name})"
-                    # Add rate limiting delay
-                    await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                except:
-                    user_display = f"Unknown User ({user_id})"
-            
-            if rsvp['response_type'] == 'yes':
-                yes_users.append(user_display)
-            elif rsvp['response_type'] == 'no':
-                no_users.append(user_display)
-            elif rsvp['response_type'] == 'maybe':
-                maybe_users.append(user_display)
-            elif rsvp['response_type'] == 'mobile':
-                mobile_users.append(user_display)
-        
-        # Process users who haven't RSVPed
-        print(f"[RATE-LIMIT] Processing {len(no_rsvp_user_ids)} no-response users for view_yesterday_rsvps")
-        for user_id in no_rsvp_user_ids:
-            user = inter.guild.get_member(user_id)
-            
-            if user:
-                user_display = f"{user.display_name} ({user.name})"
-                no_rsvp_users.append(user_display)
-            else:
-                # Try to fetch user from Discord API
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    user_display = f"{user.display_name} ({user.name})"
-                    no_rsvp_users.append(user_display)
-                    # Add rate limiting delay
-                    await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                except:
-                    # Skip users we can't fetch (they might have left the server)
-                    continue
-        
-        # Create embed
-        embed_title = "📋 RSVP Summary - Yesterday's Event"
-        if len(posts) > 1:
-            embed_title += f" ({len(posts)} posts)"
-        
-        embed = disnake.Embed(
-            title=embed_title,
-            description=f"**{post_data['event_data']['event_name']}**\n📅 {yesterday.strftime('%B %d, %Y')}",
-            color=disnake.Color.orange()
-        )
-        
-        if yes_users:
-            embed.add_field(
-                name=f"✅ Attended ({len(yes_users)})",
-                value="\n".join(yes_users) if len(yes_users) <= 15 else f"{len(yes_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if maybe_users:
-            embed.add_field(
-                name=f"❓ Maybe ({len(maybe_users)})",
-                value="\n".join(maybe_users) if len(maybe_users) <= 15 else f"{len(maybe_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if mobile_users:
-            embed.add_field(
-                name=f"📱 Mobile ({len(mobile_users)})",
-                value="\n".join(mobile_users) if len(mobile_users) <= 15 else f"{len(mobile_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if no_users:
-            embed.add_field(
-                name=f"❌ Did Not Attend ({len(no_users)})",
-                value="\n".join(no_users) if len(no_users) <= 15 else f"{len(no_users)} users (too many to list)",
-                inline=False
-            )
-        
-        if no_rsvp_users:
-            self.add_no_response_fields(embed, no_rsvp_users, "⏰ No Response")
-        
-        total_responses = len(yes_users) + len(maybe_users) + len(mobile_users) + len(no_users)
-        total_members = len(all_members)
-        embed.set_footer(text=f"Total responses: {total_responses}/{total_members} members")
-        
-        await inter.response.send_message(embed=embed, ephemeral=True)
+        await self._send_rsvp_summary(
+            inter, "view_rsvps", self.timezone_manager.today(),
+            # NOTE: Comprehensive method so no RSVPs are missed; no caching to ensure live data
+            get_todays_rsvps_comprehensive,
+            day_label="Today",
+            color=disnake.Color.blue(),
+            attendance_labels=("✅ Attending", "❌ Not Attending"),
+            no_posts_message="❌ **No Event Posted Today**\nNo daily event has been posted for today yet."
+        )
+    
+    @commands.slash_command(
+        name="view_yesterday_rsvps",
+        description="View RSVP responses for yesterday's event"
+    )
+    async def view_yesterday_rsvps(self, inter: disnake.ApplicationCommandInteraction):
+        """View RSVP responses for yesterday's event"""
+        yesterday = self.timezone_manager.today() - timedelta(days=1)
+        await self._send_rsvp_summary(
+            inter, "view_yesterday_rsvps", yesterday,
+            lambda guild_id: database.get_aggregated_rsvp_responses_for_date(guild_id, yesterday),
+            day_label="Yesterday",
+            color=disnake.Color.orange(),
+            attendance_labels=("✅ Attended", "❌ Did Not Attend"),
+            no_posts_message=f"❌ **No Event Posted Yesterday**\nNo daily event was posted for {yesterday.strftime('%B %d, %Y')}.",
+            show_date=True
+        )
 
     @commands.slash_command(
         name="midweek_rsvp_report",
         description="View RSVP summary for Monday-Wednesday of this week (admin only)"
     )
+    @admin_only()
     async def midweek_rsvp_report(self, inter: disnake.ApplicationCommandInteraction):
         """
         Generate a mid-week RSVP report showing attendance from Monday to Wednesday.
         Shows who RSVPed and who didn't for each day of the first half of the week.
         """
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
+        guild_id = inter.guild.id
         
         await inter.response.defer(ephemeral=True)
         
         try:
-            guild_id = inter.guild.id
-            
             # Get the start of the current week (Monday) using configured timezone
             today_local = self.timezone_manager.now()
             days_since_monday = today_local.weekday()
@@ -2087,9 +2300,9 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            # Get all guild members (excluding bots) for comparison
-            all_members = [member for member in inter.guild.members if not member.bot]
-            all_user_ids = {member.id for member in all_members}
+            # Index display names of all guild members (excluding bots) in one pass; the daily loops below only look them up
+            display_names = {member.id: member.display_name for member in inter.guild.members if not member.bot}
+            all_user_ids = display_names.keys()
             
             # Create the main embed
             embed = disnake.Embed(
@@ -2117,63 +2330,42 @@ class ScheduleCog(commands.Cog):
                 # Organize responses with Discord names
                 day_responses = {'yes': [], 'no': [], 'maybe': [], 'mobile': [], 'no_response': []}
                 
-                # Process RSVP responses with rate limiting
-                print(f"[RATE-LIMIT] Processing {len(rsvps)} RSVP responses for {day_name} midweek report")
+                # Split responders into indexed members and users outside the guild in one set operation
+                rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
+                no_rsvp_user_ids = all_user_ids - rsvp_user_ids
+                
+                # Responders who left the guild are fetched concurrently (bounded and cached by _resolve_users);
+                # disnake's HTTP client handles Discord's rate limits, so no fixed sleeps are needed
+                self._log_with_prefix("RATE-LIMIT", "Processing %d RSVP responses for %s midweek report",
+                                      len(rsvps), day_name, level=logging.DEBUG)
+                fetched_users = await self._resolve_users(inter.guild, rsvp_user_ids - all_user_ids)
                 for rsvp in rsvps:
                     user_id = rsvp['user_id']
-                    user = inter.guild.get_member(user_id)
-                    
-                    if user:
-                        user_display = f"{user.display_name}"
-                    else:
-                        # Try to fetch user from Discord API
-                        try:
-                            user = await self.bot.fetch_user(user_id)
-                            user_display = f"{user.display_name}"
-                            # Add rate limiting delay
-                            await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                        except:
-                            user_display = f"Unknown User"
+                    user_display = display_names.get(user_id)
+                    if user_display is None:
+                        user = fetched_users.get(user_id)
+                        user_display = user.display_name if user else "Unknown User"
                     
                     response_type = rsvp['response_type']
                     day_responses[response_type].append(user_display)
                     all_midweek_users[response_type].add(user_display)
                 
-                # Process users who haven't RSVPed
-                rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
-                no_rsvp_user_ids = all_user_ids - rsvp_user_ids
-                
-                print(f"[RATE-LIMIT] Processing {len(no_rsvp_user_ids)} no-response users for {day_name} midweek report")
+                # Users who haven't RSVPed are all indexed members, so no lookups are needed
                 for user_id in no_rsvp_user_ids:
-                    user = inter.guild.get_member(user_id)
-                    
-                    if user:
-                        user_display = f"{user.display_name}"
-                        day_responses['no_response'].append(user_display)
-                        all_midweek_users['no_response'].add(user_display)
-                    else:
-                        # Try to fetch user from Discord API
-                        try:
-                            user = await self.bot.fetch_user(user_id)
-                            user_display = f"{user.display_name}"
-                            day_responses['no_response'].append(user_display)
-                            all_midweek_users['no_response'].add(user_display)
-                            # Add rate limiting delay
-                            await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                        except:
-                            # Skip users we can't fetch (they might have left the server)
-                            continue
+                    user_display = display_names[user_id]
+                    day_responses['no_response'].append(user_display)
+                    all_midweek_users['no_response'].add(user_display)
                 
                 # Add to midweek totals
                 for response_type, users in day_responses.items():
                     midweek_totals[response_type] += len(users)
                 
                 # Calculate participation rate
-                participation_rate = round((len(rsvp_user_ids) / len(all_members)) * 100, 1) if all_members else 0
+                participation_rate = round((len(rsvp_user_ids) / len(display_names)) * 100, 1) if display_names else 0
                 
                 # Create header field for this day
                 header_value = f"📅 **{event_date.strftime('%m/%d')}** - {event_data.get('event_name', 'Event')}\n"
-                header_value += f"📊 **Participation**: {participation_rate}% ({len(rsvp_user_ids)}/{len(all_members)})\n"
+                header_value += f"📊 **Participation**: {participation_rate}% ({len(rsvp_user_ids)}/{len(display_names)})\n"
                 header_value += f"✅ Yes: **{len(day_responses['yes'])}** | 📱 Mobile: **{len(day_responses['mobile'])}** | ❓ Maybe: **{len(day_responses['maybe'])}** | ❌ No: **{len(day_responses['no'])}** | ⏰ No Response: **{len(day_responses['no_response'])}**"
                 
                 embed.add_field(
@@ -2277,14 +2469,14 @@ class ScheduleCog(commands.Cog):
                 never_responded = len(all_user_ids) - len(overall_participation)
                 
                 # Calculate average participation rate
-                total_possible_responses = len(all_members) * total_events
+                total_possible_responses = len(display_names) * total_events
                 total_actual_responses = sum(midweek_totals[key] for key in ['yes', 'no', 'maybe', 'mobile'])
                 avg_participation = round((total_actual_responses / total_possible_responses) * 100, 1) if total_possible_responses > 0 else 0
                 
                 embed.add_field(
                     name="📈 Mid-Week Analysis",
                     value=f"**Consistent Attendees**: {len(consistent_attendees)} (all 3 days 'Yes' or 'Mobile')\n"
-                          f"**Total Members**: {len(all_members)}\n"
+                          f"**Total Members**: {len(display_names)}\n"
                           f"**Never Responded**: {never_responded}\n"
                           f"**Average Participation**: {avg_participation}%",
                     inline=True
@@ -2324,7 +2516,7 @@ class ScheduleCog(commands.Cog):
             await inter.edit_original_message(embed=embed)
             
         except Exception as e:
-            print(f"Error generating mid-week RSVP report for guild {inter.guild.id}: {e}")
+            self._log_with_prefix("MIDWEEK-REPORT", "Error generating mid-week RSVP report for guild %s: %s", guild_id, e, level=logging.ERROR, exc_info=True)
             await inter.edit_original_message(
                 content=f"❌ **Error Generating Report**\n"
                        f"An error occurred while generating the mid-week report: {str(e)}"
@@ -2334,24 +2526,17 @@ class ScheduleCog(commands.Cog):
         name="weekly_rsvp_report",
         description="View complete RSVP summary for Monday-Sunday of this week (admin only)"
     )
+    @admin_only()
     async def weekly_rsvp_report(self, inter: disnake.ApplicationCommandInteraction):
         """
         Generate a full weekly RSVP report showing attendance from Monday to Sunday.
         Shows who RSVPed and who didn't for each day of the entire week.
         """
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
+        guild_id = inter.guild.id
         
         await inter.response.defer(ephemeral=True)
         
         try:
-            guild_id = inter.guild.id
-            
             # Get the start of the current week (Monday) using configured timezone
             today_local = self.timezone_manager.now()
             days_since_monday = today_local.weekday()
@@ -2371,9 +2556,9 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            # Get all guild members (excluding bots) for comparison
-            all_members = [member for member in inter.guild.members if not member.bot]
-            all_user_ids = {member.id for member in all_members}
+            # Index display names of all guild members (excluding bots) in one pass; the daily loops below only look them up
+            display_names = {member.id: member.display_name for member in inter.guild.members if not member.bot}
+            all_user_ids = display_names.keys()
             
             # Create the main embed
             embed = disnake.Embed(
@@ -2401,63 +2586,42 @@ class ScheduleCog(commands.Cog):
                 # Organize responses with Discord names
                 day_responses = {'yes': [], 'no': [], 'maybe': [], 'mobile': [], 'no_response': []}
                 
-                # Process RSVP responses with rate limiting
-                print(f"[RATE-LIMIT] Processing {len(rsvps)} RSVP responses for {day_name} weekly report")
+                # Split responders into indexed members and users outside the guild in one set operation
+                rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
+                no_rsvp_user_ids = all_user_ids - rsvp_user_ids
+                
+                # Responders who left the guild are fetched concurrently (bounded and cached by _resolve_users);
+                # disnake's HTTP client handles Discord's rate limits, so no fixed sleeps are needed
+                self._log_with_prefix("RATE-LIMIT", "Processing %d RSVP responses for %s weekly report",
+                                      len(rsvps), day_name, level=logging.DEBUG)
+                fetched_users = await self._resolve_users(inter.guild, rsvp_user_ids - all_user_ids)
                 for rsvp in rsvps:
                     user_id = rsvp['user_id']
-                    user = inter.guild.get_member(user_id)
-                    
-                    if user:
-                        user_display = f"{user.display_name}"
-                    else:
-                        # Try to fetch user from Discord API
-                        try:
-                            user = await self.bot.fetch_user(user_id)
-                            user_display = f"{user.display_name}"
-                            # Add rate limiting delay
-                            await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                        except:
-                            user_display = f"Unknown User"
+                    user_display = display_names.get(user_id)
+                    if user_display is None:
+                        user = fetched_users.get(user_id)
+                        user_display = user.display_name if user else "Unknown User"
                     
                     response_type = rsvp['response_type']
                     day_responses[response_type].append(user_display)
                     all_week_users[response_type].add(user_display)
                 
-                # Process users who haven't RSVPed
-                rsvp_user_ids = {rsvp['user_id'] for rsvp in rsvps}
-                no_rsvp_user_ids = all_user_ids - rsvp_user_ids
-                
-                print(f"[RATE-LIMIT] Processing {len(no_rsvp_user_ids)} no-response users for {day_name} weekly report")
+                # Users who haven't RSVPed are all indexed members, so no lookups are needed
                 for user_id in no_rsvp_user_ids:
-                    user = inter.guild.get_member(user_id)
-                    
-                    if user:
-                        user_display = f"{user.display_name}"
-                        day_responses['no_response'].append(user_display)
-                        all_week_users['no_response'].add(user_display)
-                    else:
-                        # Try to fetch user from Discord API
-                        try:
-                            user = await self.bot.fetch_user(user_id)
-                            user_display = f"{user.display_name}"
-                            day_responses['no_response'].append(user_display)
-                            all_week_users['no_response'].add(user_display)
-                            # Add rate limiting delay
-                            await asyncio.sleep(0.1)  # 100ms delay to respect rate limits
-                        except:
-                            # Skip users we can't fetch (they might have left the server)
-                            continue
+                    user_display = display_names[user_id]
+                    day_responses['no_response'].append(user_display)
+                    all_week_users['no_response'].add(user_display)
                 
                 # Add to week totals
                 for response_type, users in day_responses.items():
                     week_totals[response_type] += len(users)
                 
                 # Calculate participation rate
-                participation_rate = round((len(rsvp_user_ids) / len(all_members)) * 100, 1) if all_members else 0
+                participation_rate = round((len(rsvp_user_ids) / len(display_names)) * 100, 1) if display_names else 0
                 
                 # Create header field for this day
                 header_value = f"📅 **{event_date.strftime('%m/%d')}** - {event_data.get('event_name', 'Event')}\n"
-                header_value += f"📊 **Participation**: {participation_rate}% ({len(rsvp_user_ids)}/{len(all_members)})\n"
+                header_value += f"📊 **Participation**: {participation_rate}% ({len(rsvp_user_ids)}/{len(display_names)})\n"
                 header_value += f"✅ Yes: **{len(day_responses['yes'])}** | 📱 Mobile: **{len(day_responses['mobile'])}** | ❓ Maybe: **{len(day_responses['maybe'])}** | ❌ No: **{len(day_responses['no'])}** | ⏰ No Response: **{len(day_responses['no_response'])}**"
                 
                 embed.add_field(
@@ -2566,7 +2730,7 @@ class ScheduleCog(commands.Cog):
                 never_responded = len(all_user_ids) - len(overall_participation)
                 
                 # Calculate average participation rate
-                total_possible_responses = len(all_members) * total_events
+                total_possible_responses = len(display_names) * total_events
                 total_actual_responses = sum(week_totals[key] for key in ['yes', 'no', 'maybe', 'mobile'])
                 avg_participation = round((total_actual_responses / total_possible_responses) * 100, 1) if total_possible_responses > 0 else 0
                 
@@ -2613,7 +2777,7 @@ class ScheduleCog(commands.Cog):
             await inter.edit_original_message(embed=embed)
             
         except Exception as e:
-            print(f"Error generating weekly RSVP report for guild {inter.guild.id}: {e}")
+            self._log_with_prefix("WEEKLY-REPORT", "Error generating weekly RSVP report for guild %s: %s", guild_id, e, level=logging.ERROR, exc_info=True)
             await inter.edit_original_message(
                 content=f"❌ **Error Generating Report**\n"
                        f"An error occurred while generating the weekly report: {str(e)}"
@@ -2623,38 +2787,26 @@ class ScheduleCog(commands.Cog):
         name="force_post_rsvp",
         description="Manually post today's RSVP if it didn't post automatically (admin only)"
     )
+    @admin_only()
     async def force_post_rsvp(self, inter: disnake.ApplicationCommandInteraction):
         """Manually post today's RSVP if it didn't post automatically"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
+        guild_id = inter.guild.id
         
         # Defer the response immediately to prevent timeout
         try:
             await inter.response.defer(ephemeral=True)
         except disnake.errors.NotFound:
             # Interaction has already expired, can't proceed
-            print(f"Interaction expired for force_post_rsvp in guild {inter.guild.id}")
+            self._log_with_prefix("FORCE-POST", "Interaction expired before it could be deferred in guild %s", guild_id, level=logging.WARNING)
             return
-        except Exception as e:
-            print(f"Error deferring interaction for force_post_rsvp: {e}")
+        except Exception:
+            self._log_with_prefix("FORCE-POST", "Error deferring interaction in guild %s", guild_id, level=logging.ERROR, exc_info=True)
             return
         
         try:
-            guild_id = inter.guild.id
             # Use configured timezone to determine what day it is
             today = self.timezone_manager.today()
             
-            # Send initial status update
-            try:
-                await inter.edit_original_message("🔄 **Checking current setup...**")
-            except:
-                pass  # If this fails, continue anyway
-            
             # Run database queries in parallel for speed
             existing_post_task = database.get_daily_post(guild_id, today)
             guild_settings_task = database.get_guild_settings(guild_id)
@@ -2676,12 +2828,6 @@ class ScheduleCog(commands.Cog):
             if isinstance(is_current_week_setup, Exception):
                 is_current_week_setup = False
             
-            # Update status
-            try:
-                await inter.edit_original_message("🔄 **Validating configuration...**")
-            except:
-                pass
-            
             # Get event channel
             channel_id = guild_settings.get('event_channel_id') if guild_settings else None
             
@@ -2700,15 +2846,18 @@ class ScheduleCog(commands.Cog):
                 return
             
             # Check bot permissions in the channel
-            bot_member = inter.guild.get_member(self.bot.user.id)
+            bot_member = self._get_bot_member(inter.guild)
             if not bot_member:
                 await inter.edit_original_message(
                     "❌ Bot member not found in this server. Please check bot permissions."
                 )
                 return
             
+            # Resolve the bot's channel permissions once for both checks below
+            bot_permissions = channel.permissions_for(bot_member)
+            
             # Check if bot has permission to send messages in this channel
-            if not channel.permissions_for(bot_member).send_messages:
+            if not bot_permissions.send_messages:
                 await inter.edit_original_message(
                     f"❌ **Bot Permission Error**\n"
                     f"The bot doesn't have permission to send messages in <#{channel_id}>.\n\n"
@@ -2720,7 +2869,7 @@ class ScheduleCog(commands.Cog):
                 return
             
             # Check if bot has permission to embed links
-            if not channel.permissions_for(bot_member).embed_links:
+            if not bot_permissions.embed_links:
                 await inter.edit_original_message(
                     f"❌ **Bot Permission Error**\n"
                     f"The bot doesn't have permission to embed links in <#{channel_id}>.\n\n"
@@ -2738,20 +2887,17 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            # Update status about existing post
-            if existing_post:
-                try:
-                    await inter.edit_original_message("🔄 **Removing existing post and creating new one...**")
-                except:
-                    pass
-            else:
-                try:
-                    await inter.edit_original_message("🔄 **Creating today's RSVP post...**")
-                except:
-                    pass
+            # Single progress update once validation has passed, since posting can take a few seconds
+            try:
+                await inter.edit_original_message(
+                    "🔄 **Removing existing post and creating new one...**" if existing_post
+                    else "🔄 **Creating today's RSVP post...**"
+                )
+            except:
+                pass  # If this fails, continue anyway
             
             # Post today's event
-            await self.post_todays_event(inter.guild, channel)
+            await self.post_todays_event(inter.guild, channel, guild_settings)
             
             try:
                 await inter.edit_original_message(
@@ -2763,12 +2909,12 @@ class ScheduleCog(commands.Cog):
                 )
             except disnake.errors.NotFound:
                 # Interaction has expired, but command was successful
-                print(f"Successfully posted RSVP but could not edit response in guild {inter.guild.id}: interaction expired")
-            except Exception as edit_error:
-                print(f"Error editing successful response for force_post_rsvp: {edit_error}")
+                self._log_with_prefix("FORCE-POST", "Posted RSVP in guild %s but the interaction expired before the response could be edited", guild_id, level=logging.WARNING)
+            except Exception:
+                self._log_with_prefix("FORCE-POST", "Error editing success response in guild %s", guild_id, level=logging.ERROR, exc_info=True)
             
         except Exception as e:
-            print(f"Error force posting RSVP: {e}")
+            self._log_with_prefix("FORCE-POST", "Error force posting RSVP in guild %s", guild_id, level=logging.ERROR, exc_info=True)
             try:
                 await inter.edit_original_message(
                     f"❌ **Error Posting RSVP**\n"
@@ -2781,38 +2927,32 @@ class ScheduleCog(commands.Cog):
                 )
             except disnake.errors.NotFound:
                 # Interaction has expired, can't edit response
-                print(f"Could not edit response for force_post_rsvp error in guild {inter.guild.id}: interaction expired")
-            except Exception as edit_error:
-                print(f"Error editing response for force_post_rsvp: {edit_error}")
+                self._log_with_prefix("FORCE-POST", "Interaction expired before the error response could be edited in guild %s", guild_id, level=logging.WARNING)
+            except Exception:
+                self._log_with_prefix("FORCE-POST", "Error editing error response in guild %s", guild_id, level=logging.ERROR, exc_info=True)
 
     @commands.slash_command(
         name="delete_message",
         description="Delete a specific message by ID (admin only)"
     )
+    @admin_only()
     async def delete_message(
         self, 
         inter: disnake.ApplicationCommandInteraction,
         message_id: str = commands.Param(description="The ID of the message to delete"),
-        channel: disnake.TextChannel = commands.Param(description="Channel where the message is located", default=None)
+        channel: disnake.TextChannel = commands.Param(description="Channel where the message is located", default=None),
+        preview: bool = commands.Param(description="Show the deleted message's author and content (costs an extra fetch)", default=False)
     ):
         """Delete a specific message by ID"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         # Defer the response immediately to prevent timeout
         try:
             await inter.response.defer(ephemeral=True)
         except disnake.errors.NotFound:
             # Interaction has already expired, can't proceed
-            print(f"Interaction expired for delete_message in guild {inter.guild.id}")
+            self._log_with_prefix("DELETE-MESSAGE", "Interaction expired for delete_message in guild %s", inter.guild.id, level=logging.WARNING)
             return
         except Exception as e:
-            print(f"Error deferring interaction for delete_message: {e}")
+            self._log_with_prefix("DELETE-MESSAGE", "Error deferring interaction for delete_message: %s", e, level=logging.ERROR)
             return
         
         try:
@@ -2830,7 +2970,7 @@ class ScheduleCog(commands.Cog):
             target_channel = channel if channel else inter.channel
             
             # Check if bot has permission to delete messages in the target channel
-            bot_member = inter.guild.get_member(self.bot.user.id)
+            bot_member = self._get_bot_member(inter.guild)
             if not bot_member or not target_channel.permissions_for(bot_member).manage_messages:
                 await inter.edit_original_message(
                     f"❌ **Bot Permission Error**\n"
@@ -2841,18 +2981,24 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            # Try to fetch and delete the message
+            # Delete by ID directly; the message is only fetched when a preview was asked for
             try:
-                message = await target_channel.fetch_message(message_id_int)
-                await message.delete()
-                
-                await inter.edit_original_message(
-                    f"✅ **Message Deleted Successfully!**\n"
-                    f"Message ID: `{message_id}`\n"
-                    f"Channel: {target_channel.mention}\n"
-                    f"Author: {message.author.mention if message.author else 'Unknown'}\n"
-                    f"Content preview: {message.content[:100]}{'...' if len(message.content) > 100 else ''}"
-                )
+                if preview:
+                    message = await target_channel.fetch_message(message_id_int)
+                    await message.delete()
+                else:
+                    message = None
+                    await target_channel.get_partial_message(message_id_int).delete()
+                
+                confirmation = [
+                    "✅ **Message Deleted Successfully!**",
+                    f"Message ID: `{message_id}`",
+                    f"Channel: {target_channel.mention}",
+                ]
+                if message:
+                    confirmation.append(f"Author: {message.author.mention if message.author else 'Unknown'}")
+                    confirmation.append(f"Content preview: {truncate_text(message.content)}")
+                await inter.edit_original_message("\n".join(confirmation))
                 
             except disnake.NotFound:
                 await inter.edit_original_message(
@@ -2883,7 +3029,7 @@ class ScheduleCog(commands.Cog):
                 )
                 
         except Exception as e:
-            print(f"Error in delete_message command: {e}")
+            self._log_with_prefix("DELETE-MESSAGE", "Error in delete_message command: %s", e, level=logging.ERROR, exc_info=True)
             await inter.edit_original_message(
                 f"❌ **Command Error**\n"
                 f"An error occurred while processing the command: {str(e)}"
@@ -2893,36 +3039,28 @@ class ScheduleCog(commands.Cog):
         name="cleanup_old_posts",
         description="Manually clean up old event posts from Discord channels (keeps RSVP data) (admin only)"
     )
+    @admin_only()
     async def cleanup_old_posts(self, inter: disnake.ApplicationCommandInteraction):
         """Manually clean up old event posts from Discord channels"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
+        guild_id = inter.guild.id
         
         # Defer the response immediately to prevent timeout
         try:
             await inter.response.defer(ephemeral=True)
         except disnake.errors.NotFound:
             # Interaction has already expired, can't proceed
-            print(f"Interaction expired for cleanup_old_posts in guild {inter.guild.id}")
+            self._log_with_prefix("CLEANUP", "Interaction expired for cleanup_old_posts in guild %s", guild_id, level=logging.WARNING)
             return
         except Exception as e:
-            print(f"Error deferring interaction for cleanup_old_posts: {e}")
+            self._log_with_prefix("CLEANUP", "Error deferring interaction for cleanup_old_posts: %s", e, level=logging.ERROR)
             return
         
         try:
-            guild_id = inter.guild.id
-            
             # Get yesterday's date as cutoff using configured timezone (delete posts older than yesterday)
             yesterday = self.timezone_manager.today() - timedelta(days=1)
             
-            # Get all old posts for this guild
-            old_posts = await database.get_old_daily_posts(yesterday)
-            guild_old_posts = [post for post in old_posts if post['guild_id'] == guild_id]
+            # Get all old posts for this guild, filtered in the query rather than after fetching every guild's posts
+            guild_old_posts = await database.get_old_daily_posts(yesterday, guild_id, columns=OLD_POST_CLEANUP_COLUMNS)
             
             if not guild_old_posts:
                 await inter.edit_original_message(
@@ -2931,101 +3069,92 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            deleted_count = 0
-            failed_count = 0
-            
-            for post_data in guild_old_posts:
-                try:
-                    channel_id = post_data['channel_id']
-                    message_id = post_data['message_id']
-                    event_date = post_data['event_date']
-                    
-                    # Get the channel
-                    channel = inter.guild.get_channel(channel_id)
-                    if not channel:
-                        print(f"Channel {channel_id} not found in guild {guild_id}, skipping cleanup")
-                        continue
-                    
-                    # Try to delete the message from Discord only
-                    try:
-                        message = await channel.fetch_message(message_id)
-                        await message.delete()
-                        print(f"Deleted old event message {message_id} from guild {guild_id}")
-                        deleted_count += 1
-                        
-                        # Add rate limiting delay after each Discord API call
-                        await asyncio.sleep(0.5)  # 500ms delay between deletions
-                        
-                    except disnake.NotFound:
-                        # Message already deleted or not found
-                        print(f"Message {message_id} not found in guild {guild_id}, already cleaned up")
-                        deleted_count += 1
-                    except disnake.Forbidden:
-                        # Bot doesn't have permission to delete the message
-                        print(f"Bot doesn't have permission to delete message {message_id} in guild {guild_id}")
-                        failed_count += 1
-                    except Exception as e:
-                        print(f"Error deleting message {message_id} in guild {guild_id}: {e}")
-                        failed_count += 1
-                    
-                    # Note: We do NOT delete from database to preserve RSVP data
-                    
-                except Exception as e:
-                    print(f"Error cleaning up post {post_data.get('id', 'unknown')}: {e}")
-                    failed_count += 1
+            deleted_count, failed_count = await self._delete_old_post_messages(guild_old_posts)
             
             # Create response message
             if deleted_count > 0:
-                success_message = f"✅ **Cleanup Complete!**\n\n"
-                success_message += f"**Successfully deleted:** {deleted_count} old event posts\n"
+                message_lines = [
+                    "✅ **Cleanup Complete!**",
+                    "",
+                    f"**Successfully deleted:** {deleted_count} old event posts",
+                ]
                 if failed_count > 0:
-                    success_message += f"**Failed to delete:** {failed_count} posts (missing permissions or already deleted)\n"
-                success_message += f"\n**Note:** RSVP data has been preserved in the database for tracking purposes."
+                    message_lines.append(f"**Failed to delete:** {failed_count} posts (missing permissions or already deleted)")
+                message_lines += [
+                    "",
+                    "**Note:** RSVP data has been preserved in the database for tracking purposes.",
+                ]
             else:
-                success_message = f"⚠️ **Cleanup Complete**\n\n"
-                success_message += f"No messages were deleted. This could be due to:\n"
-                success_message += f"• Bot lacks permission to delete messages\n"
-                success_message += f"• Messages were already deleted\n"
-                success_message += f"• Messages are too old for Discord to access\n\n"
-                success_message += f"**Failed attempts:** {failed_count}"
-            
-            await inter.edit_original_message(success_message)
+                message_lines = [
+                    "⚠️ **Cleanup Complete**",
+                    "",
+                    "No messages were deleted. This could be due to:",
+                    "• Bot lacks permission to delete messages",
+                    "• Messages were already deleted",
+                    "• Messages are too old for Discord to access",
+                    "",
+                    f"**Failed attempts:** {failed_count}",
+                ]
+            
+            await inter.edit_original_message("\n".join(message_lines))
             
         except Exception as e:
-            print(f"Error in manual cleanup: {e}")
+            self._log_with_prefix("CLEANUP", "Error in manual cleanup for guild %s: %s", guild_id, e, level=logging.ERROR, exc_info=True)
             await inter.edit_original_message(
                 f"❌ **Error During Cleanup**\n"
                 f"An error occurred while trying to clean up old posts.\n\n"
                 f"**Error:** {str(e)}"
             )
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: disnake.Guild):
+        """Drop in-memory tracking state for a guild the bot was removed from"""
+        self.last_posted_times.pop(guild.id, None)
+        self.last_reminder_times.pop(guild.id, None)
+        self._admin_notified_dates.pop(guild.id, None)
+        self._non_bot_member_ids.pop(guild.id, None)
+        self._bot_members.pop(guild.id, None)
+        await self._save_duplicate_tracking()
+        self._invalidate_week_setup_cache(guild.id)
+        self._notify_post_schedule_changed()
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member: disnake.Member):
+        """Drop the cached non-bot member IDs for the guild the member joined"""
+        self._non_bot_member_ids.pop(member.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: disnake.Member):
+        """Drop the cached non-bot member IDs for the guild the member left"""
+        self._non_bot_member_ids.pop(member.guild.id, None)
+    
+    @commands.Cog.listener()
+    async def on_member_update(self, before: disnake.Member, after: disnake.Member):
+        """Drop cached member state affected by a member update: non-bot member IDs and the bot's own member"""
+        if before.bot != after.bot:
+            self._non_bot_member_ids.pop(after.guild.id, None)
+        if after.id == self.bot.user.id:
+            self._bot_members.pop(after.guild.id, None)
+    
     @commands.Cog.listener()
     async def on_modal_submit(self, inter: disnake.ModalInteraction):
         """Handle modal submissions for schedule setup and editing"""
-        custom_id = inter.custom_id
-        
-        # Check if this is a schedule modal or edit modal
-        if not (custom_id.startswith("schedule_modal_") or custom_id.startswith("edit_modal_")):
+        # Check if this is a schedule modal or edit modal, and parse its day and guild_id
+        match = SCHEDULE_MODAL_CUSTOM_ID_RE.match(inter.custom_id)
+        if not match:
             return
         
         try:
-            # Parse custom_id to get day and guild_id
-            parts = custom_id.split("_")
-            day = parts[2]
-            guild_id = int(parts[3])
-            is_edit = custom_id.startswith("edit_modal_")
+            modal_kind, day, guild_id = match.groups()
+            guild_id = int(guild_id)
+            is_edit = modal_kind == "edit"
             
             # Extract form data
-            event_name = inter.text_values["event_name"]
-            outfit = inter.text_values["outfit"]
-            vehicle = inter.text_values["vehicle"]
-            
-            # Prepare data for database
-            day_data = {
-                "event_name": event_name,
-                "outfit": outfit,
-                "vehicle": vehicle
-            }
+            day_data = database.DayData(
+                inter.text_values["event_name"],
+                inter.text_values["outfit"],
+                inter.text_values["vehicle"]
+            )
             
             if is_edit:
                 # Handle edit modal - check if event exists to determine if we're creating or updating
@@ -3044,14 +3173,15 @@ class ScheduleCog(commands.Cog):
                     title = "✅ Event Created Successfully"
                 
                 if success:
+                    self._invalidate_week_setup_cache(guild_id)
                     embed = disnake.Embed(
                         title=title,
                         description=f"**{day.capitalize()}** event has been {action_text}.",
                         color=disnake.Color.green()
                     )
-                    embed.add_field(name="Event", value=event_name, inline=True)
-                    embed.add_field(name="Outfit", value=outfit, inline=True)
-                    embed.add_field(name="Vehicle", value=vehicle, inline=True)
+                    embed.add_field(name="Event", value=day_data.event_name, inline=True)
+                    embed.add_field(name="Outfit", value=day_data.outfit, inline=True)
+                    embed.add_field(name="Vehicle", value=day_data.vehicle, inline=True)
                     embed.set_footer(text="The event will be used for future posts")
                     
                     await inter.response.send_message(embed=embed, ephemeral=True)
@@ -3063,8 +3193,9 @@ class ScheduleCog(commands.Cog):
                 return
             
             # Handle schedule setup modal
-            # Verify this guild is in setup process
-            if guild_id not in self.current_setups:
+            # Verify this guild is in setup process and get the day index it is on
+            current_day_index = self.current_setups.get(guild_id)
+            if current_day_index is None:
                 await inter.response.send_message(
                     "❌ No active setup found for this server.",
                     ephemeral=True
@@ -3081,12 +3212,13 @@ class ScheduleCog(commands.Cog):
                 )
                 return
             
-            # Get current day index and move to next day
-            current_day_index = self.current_setups[guild_id]
+            self._invalidate_week_setup_cache(guild_id)
+            
+            # Move to next day
             next_day_index = current_day_index + 1
             
             # Check if we've completed all days
-            if next_day_index >= len(self.days):
+            if next_day_index >= len(WEEKDAY_NAMES):
                 # All days completed
                 await inter.response.send_message(
                     f"✅ **Weekly Schedule Setup Complete!**\n\n"
@@ -3099,48 +3231,34 @@ class ScheduleCog(commands.Cog):
                 )
                 
                 # Remove guild from setup tracking
-                del self.current_setups[guild_id]
+                self.current_setups.pop(guild_id, None)
                 
             else:
                 # Move to next day
                 self.current_setups[guild_id] = next_day_index
-                next_day = self.days[next_day_index]
+                next_day = WEEKDAY_NAMES[next_day_index]
                 
                 # Acknowledge current day completion and provide button to continue
                 view = NextDayButton(next_day, guild_id)
                 await inter.response.send_message(
                     f"✅ **{day.capitalize()} Schedule Saved!**\n\n"
-                    f"**Event:** {event_name}\n"
-                    f"**Outfit:** {outfit}\n"
-                    f"**Vehicle:** {vehicle}\n\n"
+                    f"**Event:** {day_data.event_name}\n"
+                    f"**Outfit:** {day_data.outfit}\n"
+                    f"**Vehicle:** {day_data.vehicle}\n\n"
                     f"Ready to set up **{next_day.capitalize()}**. Click the button below to continue.",
                     ephemeral=True,
                     view=view
                 )
         
         except Exception as e:
-            print(f"Error handling modal submission: {e}")
+            self._log_with_prefix("SETUP", "Error handling modal submission %s: %s", inter.custom_id, e, level=logging.ERROR, exc_info=True)
             
-            # Try to send error message if interaction hasn't been responded to yet
-            try:
-                if not inter.response.is_done():
-                    await inter.response.send_message(
-                        "❌ An error occurred while processing your submission. Please try again.",
-                        ephemeral=True
-                    )
-                else:
-                    # If interaction already responded, send as followup
-                    await inter.followup.send(
-                        "❌ An error occurred while processing your submission. Please try again.",
-                        ephemeral=True
-                    )
-            except Exception as response_error:
-                print(f"Failed to send error message: {response_error}")
+            # Send the error as the response, or as a followup if the interaction was already responded to
+            await safe_respond(inter, "❌ An error occurred while processing your submission. Please try again.")
             
             # Clean up failed setup
             guild_id = inter.guild.id
-            if guild_id in self.current_setups:
-                del self.current_setups[guild_id]
+            self.current_setups.pop(guild_id, None)
 
     def add_no_response_fields(self, embed: disnake.Embed, no_rsvp_users: list, field_name: str):
         """
@@ -3158,24 +3276,21 @@ class ScheduleCog(commands.Cog):
         no_rsvp_text = "\n".join(no_rsvp_users)
         
         # Discord embed field values have a 1024 character limit
-        if len(no_rsvp_text) > 1024:
-            # Split into multiple fields if needed
+        if len(no_rsvp_text) > EMBED_FIELD_VALUE_LIMIT:
+            # Split into multiple fields at the points where the running length
+            # (+1 per user for the newline) crosses the limit
+            cumulative_lengths = list(itertools.accumulate(len(user) + 1 for user in no_rsvp_users))
             chunks = []
-            current_chunk = []
-            current_length = 0
-            
-            for user in no_rsvp_users:
-                user_length = len(user) + 1  # +1 for newline
-                if current_length + user_length > 1024 and current_chunk:
-                    chunks.append("\n".join(current_chunk))
-                    current_chunk = [user]
-                    current_length = user_length
-                else:
-                    current_chunk.append(user)
-                    current_length += user_length
+            start = 0
+            offset = 0
             
-            if current_chunk:
-                chunks.append("\n".join(current_chunk))
+            while start < len(no_rsvp_users):
+                end = bisect.bisect_right(cumulative_lengths, offset + EMBED_FIELD_VALUE_LIMIT)
+                # A single name over the limit still gets a chunk of its own
+                end = max(end, start + 1)
+                chunks.append("\n".join(no_rsvp_users[start:end]))
+                offset = cumulative_lengths[end - 1]
+                start = end
             
             # Add first chunk with the main title
             embed.add_field(
@@ -3202,16 +3317,9 @@ class ScheduleCog(commands.Cog):
         name="debug_view_rsvps",
         description="Debug why view_rsvps isn't finding posts (admin only)"
     )
+    @admin_only()
     async def debug_view_rsvps(self, inter: disnake.ApplicationCommandInteraction):
         """Debug the view_rsvps command by showing detailed information"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         await inter.response.defer(ephemeral=True)
         
         try:
@@ -3231,89 +3339,98 @@ class ScheduleCog(commands.Cog):
                 description=f"Debugging why `/view_rsvps` isn't finding posts for **{inter.guild.name}**",
                 color=disnake.Color.yellow()
             )
+            fields = []
             
             # Show timezone and date info
-            embed.add_field(
-                name="📅 Date Information",
-                value=f"**Current {self.timezone_manager.display_name} Time:** {today_local.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
-                      f"**Today's Date:** {today_date.isoformat()}\n"
-                      f"**Yesterday:** {yesterday.isoformat()}\n"
-                      f"**Tomorrow:** {tomorrow.isoformat()}\n"
-                      f"**Guild ID:** {guild_id}",
-                inline=False
-            )
-            
-            # Check posts for today, yesterday, and tomorrow
-            posts_today = await database.get_all_daily_posts_for_date(guild_id, today_date)
-            posts_yesterday = await database.get_all_daily_posts_for_date(guild_id, yesterday)
-            posts_tomorrow = await database.get_all_daily_posts_for_date(guild_id, tomorrow)
-            
-            embed.add_field(
-                name="📊 Posts Found",
-                value=f"**Today ({today_date}):** {len(posts_today)} posts\n"
-                      f"**Yesterday ({yesterday}):** {len(posts_yesterday)} posts\n"
-                      f"**Tomorrow ({tomorrow}):** {len(posts_tomorrow)} posts",
-                inline=False
-            )
-            
-            # Get ALL posts for this guild (regardless of date)
-            try:
-                client = database.get_supabase_client()
-                all_posts_result = client.table('daily_posts').select('*').eq('guild_id', guild_id).execute()
-                all_posts = all_posts_result.data if all_posts_result.data else []
-                
-                if all_posts:
-                    # Show recent posts
-                    recent_posts = []
-                    for post in all_posts[-5:]:  # Last 5 posts
-                        event_date = post['event_date']
-                        message_id = post['message_id']
-                        channel_id = post['channel_id']
-                        recent_posts.append(f"**{event_date}** - Message {message_id} in <#{channel_id}>")
-                    
-                    embed.add_field(
-                        name="📋 Recent Posts in Database",
-                        value="\n".join(recent_posts) if recent_posts else "No posts found",
-                        inline=False
-                    )
-                else:
-                    embed.add_field(
-                        name="📋 All Posts for Guild",
-                        value="❌ **No posts found in database for this guild**",
-                        inline=False
-                    )
-                    
-            except Exception as e:
-                embed.add_field(
-                    name="❌ Database Query Error",
-                    value=f"Error querying all posts: {str(e)}",
-                    inline=False
-                )
+            fields.append((
+                "📅 Date Information",
+                "\n".join([
+                    f"**Current {self.timezone_manager.display_name} Time:** {today_local.strftime('%Y-%m-%d %H:%M:%S %Z')}",
+                    f"**Today's Date:** {today_date.isoformat()}",
+                    f"**Yesterday:** {yesterday.isoformat()}",
+                    f"**Tomorrow:** {tomorrow.isoformat()}",
+                    f"**Guild ID:** {guild_id}",
+                ]),
+                False
+            ))
+            
+            async def get_recent_posts():
+                # A failure here is reported in its own field rather than failing the whole command
+                try:
+                    return await database.list_recent_daily_posts(guild_id, limit=5)
+                except Exception as e:
+                    return e
+            
+            # Check posts for today, yesterday, and tomorrow, plus the most recent posts for this guild
+            # (regardless of date), concurrently
+            posts_today, posts_yesterday, posts_tomorrow, all_posts = await asyncio.gather(
+                database.get_all_daily_posts_for_date(guild_id, today_date),
+                database.get_all_daily_posts_for_date(guild_id, yesterday),
+                database.get_all_daily_posts_for_date(guild_id, tomorrow),
+                get_recent_posts()
+            )
+            
+            fields.append((
+                "📊 Posts Found",
+                "\n".join([
+                    f"**Today ({today_date}):** {len(posts_today)} posts",
+                    f"**Yesterday ({yesterday}):** {len(posts_yesterday)} posts",
+                    f"**Tomorrow ({tomorrow}):** {len(posts_tomorrow)} posts",
+                ]),
+                False
+            ))
+            
+            # Show the most recent posts for this guild (regardless of date)
+            if isinstance(all_posts, Exception):
+                fields.append((
+                    "❌ Database Query Error",
+                    f"Error querying all posts: {str(all_posts)}",
+                    False
+                ))
+            elif all_posts:
+                recent_posts = [
+                    f"**{post['event_date']}** - Message {post['message_id']} in <#{post['channel_id']}>"
+                    for post in all_posts
+                ]
+                
+                fields.append((
+                    "📋 Recent Posts in Database",
+                    "\n".join(recent_posts),
+                    False
+                ))
+            else:
+                fields.append((
+                    "📋 All Posts for Guild",
+                    "❌ **No posts found in database for this guild**",
+                    False
+                ))
             
             # Show what the exact query would be
-            embed.add_field(
-                name="🔍 Query Details",
-                value=f"**Query:** `SELECT * FROM daily_posts WHERE guild_id = {guild_id} AND event_date = '{today_date.isoformat()}'`\n"
-                      f"**Date Format:** ISO format (YYYY-MM-DD)",
-                inline=False
-            )
+            fields.append((
+                "🔍 Query Details",
+                "\n".join([
+                    f"**Query:** `SELECT * FROM daily_posts WHERE guild_id = {guild_id} AND event_date = '{today_date.isoformat()}'`",
+                    "**Date Format:** ISO format (YYYY-MM-DD)",
+                ]),
+                False
+            ))
             
             # Show potential solutions
-            solutions = []
-            if len(posts_today) == 0:
-                solutions.append("• No posts found for today - try `/force_post_rsvp` to create one")
-            if len(posts_yesterday) > 0:
-                solutions.append("• Posts exist for yesterday - might be a timezone issue")
-            if len(posts_tomorrow) > 0:
-                solutions.append("• Posts exist for tomorrow - might be a timezone issue")
+            solution_checks = [
+                (not posts_today, "• No posts found for today - try `/force_post_rsvp` to create one"),
+                (bool(posts_yesterday), "• Posts exist for yesterday - might be a timezone issue"),
+                (bool(posts_tomorrow), "• Posts exist for tomorrow - might be a timezone issue"),
+            ]
+            solutions = [message for condition, message in solution_checks if condition]
             
             if solutions:
-                embed.add_field(
-                    name="💡 Potential Solutions",
-                    value="\n".join(solutions),
-                    inline=False
-                )
+                fields.append((
+                    "💡 Potential Solutions",
+                    "\n".join(solutions),
+                    False
+                ))
             
+            self._add_embed_fields(embed, fields)
             embed.set_footer(text="This command helps identify why view_rsvps isn't working")
             
             await inter.edit_original_message(embed=embed)
@@ -3330,16 +3447,9 @@ class ScheduleCog(commands.Cog):
         name="debug_auto_posting",
         description="Debug the automatic posting system (admin only)"
     )
+    @admin_only()
     async def debug_auto_posting(self, inter: disnake.ApplicationCommandInteraction):
         """Debug the automatic posting system"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         await inter.response.defer(ephemeral=True)
         
         try:
@@ -3354,126 +3464,130 @@ class ScheduleCog(commands.Cog):
                 description=f"Diagnosing automatic posting for **{inter.guild.name}**",
                 color=disnake.Color.yellow()
             )
+            fields = []
             
             # Current time info
-            embed.add_field(
-                name="⏰ Current Time Information",
-                value=f"**{self.timezone_manager.display_name} Time:** {now_local.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
-                      f"**Comparison Time:** {current_time.strftime('%H:%M:%S')}\n"
-                      f"**Today's Date:** {today.isoformat()}",
-                inline=False
-            )
+            fields.append((
+                "⏰ Current Time Information",
+                "\n".join([
+                    f"**{self.timezone_manager.display_name} Time:** {now_local.strftime('%Y-%m-%d %H:%M:%S %Z')}",
+                    f"**Comparison Time:** {current_time.strftime('%H:%M:%S')}",
+                    f"**Today's Date:** {today.isoformat()}",
+                ]),
+                False
+            ))
             
             # Get guild settings
             guild_settings = await database.get_guild_settings(guild_id)
             
             if not guild_settings:
-                embed.add_field(
-                    name="❌ Guild Settings",
-                    value="No guild settings found in database",
-                    inline=False
-                )
+                fields.append((
+                    "❌ Guild Settings",
+                    "No guild settings found in database",
+                    False
+                ))
             else:
                 # Posting time info
                 post_time_str = guild_settings.get('post_time', '09:00:00')
+                event_channel_id = guild_settings.get('event_channel_id')
                 try:
-                    guild_post_time = datetime.strptime(post_time_str, '%H:%M:%S').time()
+                    guild_post_time = parse_time_string(post_time_str)
                     post_time_display = guild_post_time.strftime('%I:%M %p')
                     time_match = (current_time.hour == guild_post_time.hour and 
                                 current_time.minute == guild_post_time.minute)
                 except ValueError:
-                    guild_post_time = datetime.strptime('09:00:00', '%H:%M:%S').time()
+                    guild_post_time = time(9, 0)
                     post_time_display = "9:00 AM (default)"
                     time_match = False
                 
-                embed.add_field(
-                    name="📅 Posting Configuration",
-                    value=f"**Configured Time:** {post_time_display} ET ({post_time_str})\n"
-                          f"**Time Match:** {'✅ YES' if time_match else '❌ NO'}\n"
-                          f"**Event Channel:** <#{guild_settings.get('event_channel_id')}>" if guild_settings.get('event_channel_id') else "❌ Not set",
-                    inline=False
-                )
+                fields.append((
+                    "📅 Posting Configuration",
+                    "\n".join([
+                        f"**Configured Time:** {post_time_display} ET ({post_time_str})",
+                        f"**Time Match:** {'✅ YES' if time_match else '❌ NO'}",
+                        f"**Event Channel:** <#{event_channel_id}>" if event_channel_id else "**Event Channel:** ❌ Not set",
+                    ]),
+                    False
+                ))
             
             # Check if guild has schedules
             schedule = await database.get_guild_schedule(guild_id)
             is_current_week_setup = await self.check_current_week_setup(guild_id)
             
-            embed.add_field(
-                name="📋 Schedule Status",
-                value=f"**Has Schedule:** {'✅ YES' if schedule else '❌ NO'}\n"
-                      f"**Current Week Setup:** {'✅ YES' if is_current_week_setup else '❌ NO'}\n"
-                      f"**Days Configured:** {len(schedule) if schedule else 0}/7",
-                inline=False
-            )
+            fields.append((
+                "📋 Schedule Status",
+                "\n".join([
+                    f"**Has Schedule:** {'✅ YES' if schedule else '❌ NO'}",
+                    f"**Current Week Setup:** {'✅ YES' if is_current_week_setup else '❌ NO'}",
+                    f"**Days Configured:** {len(schedule) if schedule else 0}/7",
+                ]),
+                False
+            ))
             
             # Check existing posts for today
-            existing_post = await database.get_daily_post(guild_id, today)
-            embed.add_field(
-                name="📝 Today's Post Status",
-                value=f"**Existing Post:** {'✅ YES' if existing_post else '❌ NO'}\n"
-                      f"**Post ID:** {existing_post.get('id') if existing_post else 'None'}\n"
-                      f"**Message ID:** {existing_post.get('message_id') if existing_post else 'None'}",
-                inline=False
-            )
+            existing_post = await database.get_daily_post(guild_id, today, columns='id, message_id')
+            fields.append((
+                "📝 Today's Post Status",
+                "\n".join([
+                    f"**Existing Post:** {'✅ YES' if existing_post else '❌ NO'}",
+                    f"**Post ID:** {existing_post.get('id') if existing_post else 'None'}",
+                    f"**Message ID:** {existing_post.get('message_id') if existing_post else 'None'}",
+                ]),
+                False
+            ))
             
             # Task status
-            daily_task_running = self.daily_posting_task.is_running()
-            reminder_task_running = self.reminder_check_task.is_running()
+            scheduler_running = self.scheduler_task.is_running()
             
-            embed.add_field(
-                name="🔄 Task Status",
-                value=f"**Daily Task Running:** {'✅ YES' if daily_task_running else '❌ NO'}\n"
-                      f"**Reminder Task Running:** {'✅ YES' if reminder_task_running else '❌ NO'}\n"
-                      f"**Daily Task Cancelled:** {'❌ YES' if self.daily_posting_task.is_being_cancelled() else '✅ NO'}\n"
-                      f"**Reminder Task Cancelled:** {'❌ YES' if self.reminder_check_task.is_being_cancelled() else '✅ NO'}",
-                inline=False
-            )
+            fields.append((
+                "🔄 Task Status",
+                "\n".join([
+                    f"**Scheduler Running:** {'✅ YES' if scheduler_running else '❌ NO'}",
+                    f"**Scheduler Cancelled:** {'❌ YES' if self.scheduler_task.is_being_cancelled() else '✅ NO'}",
+                ]),
+                False
+            ))
             
             # Duplicate prevention status
             posting_tracked = guild_id in self.last_posted_times
-            reminder_4pm_tracked = (guild_id, '4pm') in self.last_reminder_times
-            reminder_1h_tracked = (guild_id, '1_hour') in self.last_reminder_times
-            reminder_15m_tracked = (guild_id, '15_minutes') in self.last_reminder_times
-            
-            embed.add_field(
-                name="🛡️ Duplicate Prevention",
-                value=f"**Daily Posting:** {'✅ Tracked' if posting_tracked else '⚪ Not tracked yet'}\n"
-                      f"**4PM Reminder:** {'✅ Tracked' if reminder_4pm_tracked else '⚪ Not tracked yet'}\n"
-                      f"**1H Reminder:** {'✅ Tracked' if reminder_1h_tracked else '⚪ Not tracked yet'}\n"
-                      f"**15M Reminder:** {'✅ Tracked' if reminder_15m_tracked else '⚪ Not tracked yet'}",
-                inline=False
-            )
+            guild_reminder_times = self.last_reminder_times.get(guild_id, {})
+            reminder_4pm_tracked = '4pm' in guild_reminder_times
+            reminder_1h_tracked = '1_hour' in guild_reminder_times
+            reminder_15m_tracked = '15_minutes' in guild_reminder_times
+            
+            fields.append((
+                "🛡️ Duplicate Prevention",
+                "\n".join([
+                    f"**Daily Posting:** {'✅ Tracked' if posting_tracked else '⚪ Not tracked yet'}",
+                    f"**4PM Reminder:** {'✅ Tracked' if reminder_4pm_tracked else '⚪ Not tracked yet'}",
+                    f"**1H Reminder:** {'✅ Tracked' if reminder_1h_tracked else '⚪ Not tracked yet'}",
+                    f"**15M Reminder:** {'✅ Tracked' if reminder_15m_tracked else '⚪ Not tracked yet'}",
+                ]),
+                False
+            ))
             
             # Recommendations
-            recommendations = []
-            if not guild_settings:
-                recommendations.append("• Configure guild settings first")
-            elif not guild_settings.get('event_channel_id'):
-                recommendations.append("• Set event channel with `/set_event_channel`")
-            if not schedule:
-                recommendations.append("• Set up weekly schedule with `/setup_weekly_schedule`")
-            if not is_current_week_setup:
-                recommendations.append("• Update current week's schedule")
-            if existing_post:
-                recommendations.append("• Today's post already exists - delete if testing")
-            if not daily_task_running or not reminder_task_running:
-                recommendations.append("• Restart the bot to fix task issues")
+            event_channel_id = guild_settings.get('event_channel_id') if guild_settings else None
+            recommendation_checks = [
+                (not guild_settings, "• Configure guild settings first"),
+                (bool(guild_settings) and not event_channel_id, "• Set event channel with `/set_event_channel`"),
+                (not schedule, "• Set up weekly schedule with `/setup_weekly_schedule`"),
+                (not is_current_week_setup, "• Update current week's schedule"),
+                (bool(existing_post), "• Today's post already exists - delete if testing"),
+                (not scheduler_running, "• Restart the bot to fix task issues"),
+            ]
+            recommendations = [message for condition, message in recommendation_checks if condition]
             
             if recommendations:
-                embed.add_field(
-                    name="💡 Recommendations",
-                    value="\n".join(recommendations),
-                    inline=False
-                )
+                fields.append((
+                    "💡 Recommendations",
+                    "\n".join(recommendations),
+                    False
+                ))
             
             # Test posting time calculation
             if guild_settings and guild_settings.get('post_time'):
-                next_post_time = now_local.replace(
-                    hour=guild_post_time.hour,
-                    minute=guild_post_time.minute,
-                    second=0,
-                    microsecond=0
-                )
+                next_post_time = self._at_time(now_local, guild_post_time)
                 
                 # If the time has already passed today, show tomorrow's time
                 if next_post_time <= now_local:
@@ -3483,13 +3597,16 @@ class ScheduleCog(commands.Cog):
                 hours, remainder = divmod(int(time_until.total_seconds()), 3600)
                 minutes, _ = divmod(remainder, 60)
                 
-                embed.add_field(
-                    name="⏳ Next Posting Time",
-                    value=f"**Next Post:** {next_post_time.strftime('%Y-%m-%d %I:%M %p')} ET\n"
-                          f"**Time Until:** {hours}h {minutes}m",
-                    inline=False
-                )
+                fields.append((
+                    "⏳ Next Posting Time",
+                    "\n".join([
+                        f"**Next Post:** {next_post_time.strftime('%Y-%m-%d %I:%M %p')} ET",
+                        f"**Time Until:** {hours}h {minutes}m",
+                    ]),
+                    False
+                ))
             
+            self._add_embed_fields(embed, fields)
             embed.set_footer(text="Use this information to troubleshoot automatic posting issues")
             
             await inter.edit_original_message(embed=embed)
@@ -3507,16 +3624,9 @@ class ScheduleCog(commands.Cog):
         name="debug_reminders",
         description="Debug why reminders are not being sent (admin only)"
     )
+    @admin_only()
     async def debug_reminders(self, inter: disnake.ApplicationCommandInteraction):
         """Debug the reminder system to identify issues"""
-        # Check permissions
-        if not check_admin_or_specific_user(inter):
-            await inter.response.send_message(
-                "❌ You don't have permission to use this command.",
-                ephemeral=True
-            )
-            return
-        
         await inter.response.defer(ephemeral=True)
         
         try:
@@ -3530,38 +3640,45 @@ class ScheduleCog(commands.Cog):
                 description=f"Diagnosing reminder issues for **{inter.guild.name}**",
                 color=disnake.Color.yellow()
             )
+            fields = []
             
             # Current time info
-            embed.add_field(
-                name="⏰ Current Time Information",
-                value=f"**{self.timezone_manager.display_name} Time:** {now_local.strftime('%Y-%m-%d %H:%M:%S %Z')}\n"
-                      f"**Today's Date:** {today.isoformat()}\n"
-                      f"**Current Hour:** {now_local.hour}\n"
-                      f"**Current Minute:** {now_local.minute}",
-                inline=False
-            )
+            fields.append((
+                "⏰ Current Time Information",
+                "\n".join([
+                    f"**{self.timezone_manager.display_name} Time:** {now_local.strftime('%Y-%m-%d %H:%M:%S %Z')}",
+                    f"**Today's Date:** {today.isoformat()}",
+                    f"**Current Hour:** {now_local.hour}",
+                    f"**Current Minute:** {now_local.minute}",
+                ]),
+                False
+            ))
             
             # Check reminder task status
-            reminder_task_running = self.reminder_check_task.is_running()
-            
-            embed.add_field(
-                name="🔄 Reminder Task Status",
-                value=f"**Task Running:** {'✅ YES' if reminder_task_running else '❌ NO'}\n"
-                      f"**Task Cancelled:** {'❌ YES' if self.reminder_check_task.is_being_cancelled() else '✅ NO'}\n"
-                      f"**Current Iteration:** {self.reminder_check_task.current_loop if hasattr(self.reminder_check_task, 'current_loop') else 'N/A'}\n"
-                      f"**Runs Every:** 5 minutes",
-                inline=False
-            )
+            reminder_task_running = self.scheduler_task.is_running()
+            
+            fields.append((
+                "🔄 Reminder Task Status",
+                "\n".join([
+                    f"**Task Running:** {'✅ YES' if reminder_task_running else '❌ NO'}",
+                    f"**Task Cancelled:** {'❌ YES' if self.scheduler_task.is_being_cancelled() else '✅ NO'}",
+                    f"**Current Iteration:** {self.scheduler_task.current_loop if hasattr(self.scheduler_task, 'current_loop') else 'N/A'}",
+                    "**Runs Every:** 5 minutes",
+                ]),
+                False
+            ))
             
             # Get guild settings
             guild_settings = await database.get_guild_settings(guild_id)
+            # (window start minute, label, window text, status) per REMINDER_WINDOWS entry
+            reminder_windows = []
             
             if not guild_settings:
-                embed.add_field(
-                    name="❌ Guild Settings",
-                    value="No guild settings found. Use `/configure_reminders` to set up.",
-                    inline=False
-                )
+                fields.append((
+                    "❌ Guild Settings",
+                    "No guild settings found. Use `/configure_reminders` to set up.",
+                    False
+                ))
             else:
                 # Display reminder settings
                 reminder_enabled = guild_settings.get('reminder_enabled', True)
@@ -3571,151 +3688,162 @@ class ScheduleCog(commands.Cog):
                 event_time_str = guild_settings.get('event_time', '20:00:00')
                 
                 try:
-                    event_time = datetime.strptime(event_time_str, '%H:%M:%S').time()
+                    event_time = parse_time_string(event_time_str)
                     event_time_display = event_time.strftime('%I:%M %p')
                 except:
                     event_time_display = f"ERROR: {event_time_str}"
                     event_time = None
                 
-                embed.add_field(
-                    name="🔔 Reminder Settings",
-                    value=f"**Reminders Enabled:** {'✅ YES' if reminder_enabled else '❌ NO'}\n"
-                          f"**4:00 PM Reminder:** {'✅ YES' if reminder_4pm else '❌ NO'}\n"
-                          f"**1 Hour Before:** {'✅ YES' if reminder_1_hour else '❌ NO'}\n"
-                          f"**15 Minutes Before:** {'✅ YES' if reminder_15_minutes else '❌ NO'}\n"
-                          f"**Event Time:** {event_time_display} ET ({event_time_str})",
-                    inline=False
-                )
-                
-                # Calculate reminder times with windows
+                fields.append((
+                    "🔔 Reminder Settings",
+                    "\n".join([
+                        f"**Reminders Enabled:** {'✅ YES' if reminder_enabled else '❌ NO'}",
+                        f"**4:00 PM Reminder:** {'✅ YES' if reminder_4pm else '❌ NO'}",
+                        f"**1 Hour Before:** {'✅ YES' if reminder_1_hour else '❌ NO'}",
+                        f"**15 Minutes Before:** {'✅ YES' if reminder_15_minutes else '❌ NO'}",
+                        f"**Event Time:** {event_time_display} ET ({event_time_str})",
+                    ]),
+                    False
+                ))
+                
+                # Calculate reminder windows with the same table and bounds check_guild_reminders uses
                 if event_time:
-                    event_today = now_local.replace(hour=event_time.hour, minute=event_time.minute, second=0, microsecond=0)
-                    one_hour_before = event_today - timedelta(hours=1)
-                    fifteen_min_before = event_today - timedelta(minutes=15)
+                    now_minutes = now_local.hour * 60 + now_local.minute
+                    for reminder_type, _, fixed_time, minutes_before in REMINDER_WINDOWS:
+                        window_start = reminder_window_start(fixed_time, minutes_before, event_time)
+                        window_end = window_start + REMINDER_WINDOW_MINUTES  # exclusive
+                        if window_start <= now_minutes < window_end:
+                            status = "🟡 IN WINDOW"
+                        elif now_minutes >= window_end:
+                            status = "🟢 PASSED"
+                        else:
+                            status = "⏳ UPCOMING"
+                        first_minute = time(*divmod(window_start % (24 * 60), 60))
+                        last_minute = time(*divmod((window_end - 1) % (24 * 60), 60))
+                        window_text = f"{first_minute.strftime('%I:%M')}-{last_minute.strftime('%I:%M %p')}"
+                        reminder_windows.append((window_start, REMINDER_WINDOW_LABELS.get(reminder_type, reminder_type), window_text, status))
+                    reminder_windows.sort()
                     
-                    # Check if we're in the reminder windows
-                    in_4pm_window = now_local.hour == 16 and now_local.minute < 5
-                    in_1h_window = one_hour_before <= now_local <= (one_hour_before + timedelta(minutes=4))
-                    in_15m_window = fifteen_min_before <= now_local <= (fifteen_min_before + timedelta(minutes=4))
-                    
-                    # Status for each reminder
-                    four_pm_status = "🟡 IN WINDOW" if in_4pm_window else ("🟢 PASSED" if now_local.hour > 16 or (now_local.hour == 16 and now_local.minute >= 5) else "⏳ UPCOMING")
-                    one_h_status = "🟡 IN WINDOW" if in_1h_window else ("🟢 PASSED" if now_local > (one_hour_before + timedelta(minutes=4)) else "⏳ UPCOMING")
-                    fifteen_m_status = "🟡 IN WINDOW" if in_15m_window else ("🟢 PASSED" if now_local > (fifteen_min_before + timedelta(minutes=4)) else "⏳ UPCOMING")
-                    
-                    embed.add_field(
-                        name="⏰ Reminder Times & Windows (Today)",
-                        value=f"**4:00 PM (4:00-4:04 PM):** {four_pm_status}\n"
-                              f"**1H Before ({one_hour_before.strftime('%I:%M')}-{(one_hour_before + timedelta(minutes=4)).strftime('%I:%M %p')}):** {one_h_status}\n"
-                              f"**15M Before ({fifteen_min_before.strftime('%I:%M')}-{(fifteen_min_before + timedelta(minutes=4)).strftime('%I:%M %p')}):** {fifteen_m_status}",
-                        inline=False
-                    )
+                    fields.append((
+                        "⏰ Reminder Times & Windows (Today)",
+                        "\n".join(
+                            f"**{label} ({window_text}):** {status}"
+                            for _, label, window_text, status in reminder_windows
+                        ),
+                        False
+                    ))
             
             # Check if guild shows up in reminder query
-            guilds_data = await database.get_guilds_needing_reminders()
-            guild_in_query = any(g['guild_id'] == guild_id for g in guilds_data)
-            
-            embed.add_field(
-                name="🔍 Database Query",
-                value=f"**Guild in Reminder Query:** {'✅ YES' if guild_in_query else '❌ NO'}\n"
-                      f"**Total Guilds in Query:** {len(guilds_data)}\n"
-                      f"**Note:** Guilds must have weekly_schedules entry to appear",
-                inline=False
+            guild_in_query, guilds_in_query_count = await asyncio.gather(
+                database.is_guild_in_reminder_query(guild_id),
+                database.count_guilds_needing_reminders()
             )
             
+            fields.append((
+                "🔍 Database Query",
+                "\n".join([
+                    f"**Guild in Reminder Query:** {'✅ YES' if guild_in_query else '❌ NO'}",
+                    f"**Total Guilds in Query:** {guilds_in_query_count}",
+                    "**Note:** Guilds must have a weekly_schedules entry and reminders enabled to appear",
+                ]),
+                False
+            ))
+            
             # Check today's post
-            post_data = await database.get_daily_post(guild_id, today)
+            post_data = await database.get_daily_post_summary(guild_id, today)
             
             if not post_data:
-                embed.add_field(
-                    name="❌ Today's Event Post",
-                    value="No daily post found for today. Reminders need an active event post.\n"
-                          "Use `/force_post_rsvp` to create today's post.",
-                    inline=False
-                )
+                fields.append((
+                    "❌ Today's Event Post",
+                    "\n".join([
+                        "No daily post found for today. Reminders need an active event post.",
+                        "Use `/force_post_rsvp` to create today's post.",
+                    ]),
+                    False
+                ))
             else:
-                embed.add_field(
-                    name="✅ Today's Event Post",
-                    value=f"**Post ID:** {post_data['id']}\n"
-                          f"**Event:** {post_data['event_data'].get('event_name', 'Unknown')}\n"
-                          f"**Channel:** <#{post_data['channel_id']}>\n"
-                          f"**Message ID:** {post_data['message_id']}",
-                    inline=False
-                )
+                fields.append((
+                    "✅ Today's Event Post",
+                    "\n".join([
+                        f"**Post ID:** {post_data['id']}",
+                        f"**Event:** {post_data.get('event_name') or 'Unknown'}",
+                        f"**Channel:** <#{post_data['channel_id']}>",
+                        f"**Message ID:** {post_data['message_id']}",
+                    ]),
+                    False
+                ))
                 
                 # Check which reminders have been sent
-                reminder_4pm_sent = await database.check_reminder_sent(post_data['id'], '4pm')
-                reminder_1h_sent = await database.check_reminder_sent(post_data['id'], '1_hour')
-                reminder_15m_sent = await database.check_reminder_sent(post_data['id'], '15_minutes')
-                
-                embed.add_field(
-                    name="📤 Reminders Already Sent",
-                    value=f"**4:00 PM:** {'✅ SENT' if reminder_4pm_sent else '❌ NOT SENT'}\n"
-                          f"**1 Hour Before:** {'✅ SENT' if reminder_1h_sent else '❌ NOT SENT'}\n"
-                          f"**15 Minutes Before:** {'✅ SENT' if reminder_15m_sent else '❌ NOT SENT'}",
-                    inline=False
-                )
+                sent_reminders = (await database.get_sent_reminders_bulk([post_data['id']])).get(post_data['id'], set())
+                reminder_4pm_sent = '4pm' in sent_reminders
+                reminder_1h_sent = '1_hour' in sent_reminders
+                reminder_15m_sent = '15_minutes' in sent_reminders
+                
+                fields.append((
+                    "📤 Reminders Already Sent",
+                    "\n".join([
+                        f"**4:00 PM:** {'✅ SENT' if reminder_4pm_sent else '❌ NOT SENT'}",
+                        f"**1 Hour Before:** {'✅ SENT' if reminder_1h_sent else '❌ NOT SENT'}",
+                        f"**15 Minutes Before:** {'✅ SENT' if reminder_15m_sent else '❌ NOT SENT'}",
+                    ]),
+                    False
+                ))
             
             # Check duplicate prevention tracking
-            tracking_4pm = (guild_id, '4pm') in self.last_reminder_times
-            tracking_1h = (guild_id, '1_hour') in self.last_reminder_times
-            tracking_15m = (guild_id, '15_minutes') in self.last_reminder_times
-            
-            embed.add_field(
-                name="🛡️ Duplicate Prevention",
-                value=f"**4PM Tracked:** {'✅ YES' if tracking_4pm else '❌ NO'}\n"
-                      f"**1H Tracked:** {'✅ YES' if tracking_1h else '❌ NO'}\n"
-                      f"**15M Tracked:** {'✅ YES' if tracking_15m else '❌ NO'}\n"
-                      f"**Note:** These reset when bot restarts",
-                inline=False
-            )
+            guild_reminder_times = self.last_reminder_times.get(guild_id, {})
+            tracking_4pm = '4pm' in guild_reminder_times
+            tracking_1h = '1_hour' in guild_reminder_times
+            tracking_15m = '15_minutes' in guild_reminder_times
+            
+            fields.append((
+                "🛡️ Duplicate Prevention",
+                "\n".join([
+                    f"**4PM Tracked:** {'✅ YES' if tracking_4pm else '❌ NO'}",
+                    f"**1H Tracked:** {'✅ YES' if tracking_1h else '❌ NO'}",
+                    f"**15M Tracked:** {'✅ YES' if tracking_15m else '❌ NO'}",
+                    "**Note:** Saved to disk, so these survive bot restarts; entries expire after a day",
+                ]),
+                False
+            ))
             
             # Provide recommendations
-            recommendations = []
-            if not reminder_task_running:
-                recommendations.append("• Restart the bot to fix the reminder task")
-            if not guild_settings:
-                recommendations.append("• Configure reminders with `/configure_reminders`")
-            elif not guild_settings.get('reminder_enabled', True):
-                recommendations.append("• Enable reminders with `/configure_reminders enabled:True`")
-            if not guild_in_query:
-                recommendations.append("• Set up weekly schedule with `/setup_weekly_schedule`")
-            if not post_data:
-                recommendations.append("• Create today's event post with `/force_post_rsvp`")
-            if not guild_settings or not guild_settings.get('event_channel_id'):
-                recommendations.append("• Set event channel with `/set_event_channel`")
+            reminder_enabled = guild_settings.get('reminder_enabled', True) if guild_settings else True
+            event_channel_id = guild_settings.get('event_channel_id') if guild_settings else None
+            recommendation_checks = [
+                (not reminder_task_running, "• Restart the bot to fix the reminder task"),
+                (not guild_settings, "• Configure reminders with `/configure_reminders`"),
+                (bool(guild_settings) and not reminder_enabled, "• Enable reminders with `/configure_reminders enabled:True`"),
+                (not guild_in_query, "• Set up weekly schedule with `/setup_weekly_schedule`"),
+                (not post_data, "• Create today's event post with `/force_post_rsvp`"),
+                (not event_channel_id, "• Set event channel with `/set_event_channel`"),
+            ]
+            recommendations = [message for condition, message in recommendation_checks if condition]
             
             if recommendations:
-                embed.add_field(
-                    name="💡 Recommendations",
-                    value="\n".join(recommendations),
-                    inline=False
-                )
+                fields.append((
+                    "💡 Recommendations",
+                    "\n".join(recommendations),
+                    False
+                ))
             else:
                 # If everything looks good, show next steps
-                next_reminder = "No more reminders today"
-                if event_time:
-                    event_today = now_local.replace(hour=event_time.hour, minute=event_time.minute, second=0, microsecond=0)
-                    
-                    # Check upcoming reminder windows
-                    if now_local.hour < 16:
-                        next_reminder = "4:00-4:04 PM today"
-                    elif now_local < (event_today - timedelta(hours=1)):
-                        one_hour_before = event_today - timedelta(hours=1)
-                        next_reminder = f"{one_hour_before.strftime('%I:%M')}-{(one_hour_before + timedelta(minutes=4)).strftime('%I:%M %p')} today (1 hour before)"
-                    elif now_local < (event_today - timedelta(minutes=15)):
-                        fifteen_min_before = event_today - timedelta(minutes=15)
-                        next_reminder = f"{fifteen_min_before.strftime('%I:%M')}-{(fifteen_min_before + timedelta(minutes=4)).strftime('%I:%M %p')} today (15 minutes before)"
-                
-                embed.add_field(
-                    name="✅ System Looks Good",
-                    value=f"Everything appears to be configured correctly.\n"
-                          f"**Next Reminder Window:** {next_reminder}\n"
-                          f"**Check Console:** Look for `[REMINDER]` logs every 5 minutes",
-                    inline=False
-                )
-            
-            embed.set_footer(text="Monitor console logs for [REMINDER] messages to see task activity")
+                next_reminder = next(
+                    (f"{window_text} today ({label})" for _, label, window_text, status in reminder_windows if status == "⏳ UPCOMING"),
+                    "No more reminders today"
+                )
+                
+                fields.append((
+                    "✅ System Looks Good",
+                    "\n".join([
+                        "Everything appears to be configured correctly.",
+                        f"**Next Reminder Window:** {next_reminder}",
+                        "**Check Console:** `[REMINDER]` logs appear when a reminder is sent; the 5-minute checks only log at DEBUG level",
+                    ]),
+                    False
+                ))
+            
+            self._add_embed_fields(embed, fields)
+            embed.set_footer(text="Console [REMINDER] logs show sent reminders; enable DEBUG logging to see every check")
             
             await inter.edit_original_message(embed=embed)
             
@@ -383,6 +383,31 @@ async def get_cached_guild_settings(guild_id: int) -> Optional[dict]:
     key = cache_manager._generate_key("guild_settings", guild_id)
     return await cache_manager.get(key)
 
+async def invalidate_guild_schedule_cache(guild_id: int) -> bool:
+    """Remove cached guild schedule data after the schedule changes"""
+    key = cache_manager._generate_key("guild_schedule", guild_id)
+    return await cache_manager.delete(key)
+
+async def invalidate_guild_settings_cache(guild_id: int) -> bool:
+    """Remove cached guild settings after the settings change"""
+    key = cache_manager._generate_key("guild_settings", guild_id)
+    return await cache_manager.delete(key)
+
+async def cache_guilds_with_schedules(guild_ids: List[int], ttl_seconds: int = 60) -> None:
+    """Cache the list of guilds with weekly schedules with 1-minute TTL"""
+    key = cache_manager._generate_key("guilds_with_schedules")
+    await cache_manager.set(key, guild_ids, ttl_seconds, CacheStrategy.FREQUENT_READ)
+
+async def get_cached_guilds_with_schedules() -> Optional[List[int]]:
+    """Retrieve the cached list of guilds with weekly schedules"""
+    key = cache_manager._generate_key("guilds_with_schedules")
+    return await cache_manager.get(key)
+
+async def invalidate_guilds_with_schedules_cache() -> bool:
+    """Remove the cached list of guilds with weekly schedules"""
+    key = cache_manager._generate_key("guilds_with_schedules")
+    return await cache_manager.delete(key)
+
 async def cache_daily_post(guild_id: int, event_date: str, post_data: dict, ttl_seconds: int = 900) -> None:
     """Cache daily post data with 15-minute TTL"""
     key = cache_manager._generate_key("daily_post", guild_id, event_date)
@@ -405,8 +430,12 @@ async def get_cached_rsvp_responses(post_id: str) -> Optional[List[dict]]:
 
 async def invalidate_guild_cache(guild_id: int) -> int:
     """Invalidate all cache entries for a specific guild"""
-    pattern = f"guild_{guild_id}"
-    return await cache_manager.invalidate_pattern(pattern)
+    # Keys are hashed, so settings/schedule entries have to be removed by exact key
+    invalidated = await cache_manager.invalidate_pattern(f"guild_{guild_id}")
+    invalidated += await invalidate_guild_settings_cache(guild_id)
+    invalidated += await invalidate_guild_schedule_cache(guild_id)
+    await invalidate_guilds_with_schedules_cache()
+    return invalidated
 
 async def invalidate_rsvp_cache(post_id: str) -> int:
     """
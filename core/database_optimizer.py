@@ -9,6 +9,7 @@ import json
 import logging
 import time
 from collections import defaultdict, deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -104,6 +105,8 @@ class DatabaseOptimizer:
         self._connection_info: Dict[str, ConnectionInfo] = {}
         self._available_connections: deque = deque()
         self._connection_lock = asyncio.Lock()
+        # Signalled whenever a connection is returned to the pool or closed, freeing capacity
+        self._connection_available = asyncio.Condition(self._connection_lock)
         
         # Query optimization
         self._query_cache: Dict[str, Tuple[Any, datetime]] = {}
@@ -171,7 +174,7 @@ class DatabaseOptimizer:
         # Close all connections
         async with self._connection_lock:
             for connection_id in list(self._connections.keys()):
-                await self._close_connection(connection_id)
+                self._close_connection_locked(connection_id)
         
         logger.info("Database optimizer stopped")
     
@@ -205,68 +208,74 @@ class DatabaseOptimizer:
             logger.error(f"Failed to create database connection: {e}")
             raise
     
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Borrow a pooled connection for the duration of an ``async with`` block.
+        The connection is always released when the block exits, and dropped from the pool if the block raised.
+        """
+        connection_id, connection = await self._get_connection()
+        success = False
+        try:
+            yield connection
+            success = True
+        finally:
+            await self._release_connection(connection_id, success)
+    
     async def _get_connection(self) -> Tuple[str, Client]:
-        """Get an available database connection"""
-        async with self._connection_lock:
-            # Try to get an available connection
-            if self._available_connections:
-                connection_id = self._available_connections.popleft()
-                connection = self._connections[connection_id]
+        """Get an available database connection, waiting for one to be released if the pool is at capacity"""
+        async with self._connection_available:
+            while True:
+                # Try to get an available connection
+                if self._available_connections:
+                    connection_id = self._available_connections.popleft()
+                    connection = self._connections[connection_id]
+                    
+                    # Update connection info
+                    self._connection_info[connection_id].last_used = datetime.now(timezone.utc)
+                    self._connection_info[connection_id].state = ConnectionState.ACTIVE
+                    
+                    return connection_id, connection
                 
-                # Update connection info
-                self._connection_info[connection_id].last_used = datetime.now(timezone.utc)
-                self._connection_info[connection_id].state = ConnectionState.ACTIVE
+                # Create new connection if under limit
+                if len(self._connections) < self._max_connections:
+                    connection_id = await self._create_connection()
+                    self._available_connections.remove(connection_id)
+                    connection = self._connections[connection_id]
+                    self._connection_info[connection_id].state = ConnectionState.ACTIVE
+                    return connection_id, connection
                 
-                return connection_id, connection
-            
-            # Create new connection if under limit
-            if len(self._connections) < self._max_connections:
-                connection_id = await self._create_connection()
-                connection = self._connections[connection_id]
-                self._connection_info[connection_id].state = ConnectionState.ACTIVE
-                return connection_id, connection
-            
-            # Wait for a connection to become available
-            while not self._available_connections:
-                await asyncio.sleep(0.1)
-            
-            connection_id = self._available_connections.popleft()
-            connection = self._connections[connection_id]
-            self._connection_info[connection_id].last_used = datetime.now(timezone.utc)
-            self._connection_info[connection_id].state = ConnectionState.ACTIVE
-            
-            return connection_id, connection
+                # Wait (releasing the lock) until a connection is released or closed
+                await self._connection_available.wait()
     
     async def _release_connection(self, connection_id: str, success: bool = True) -> None:
-        """Release a database connection back to the pool"""
-        async with self._connection_lock:
+        """Release a database connection back to the pool; connections whose query failed are closed instead"""
+        async with self._connection_available:
             if connection_id in self._connection_info:
                 info = self._connection_info[connection_id]
-                info.state = ConnectionState.IDLE
                 
                 if success:
                     info.query_count += 1
+                    info.state = ConnectionState.IDLE
+                    self._available_connections.append(connection_id)
                 else:
                     info.error_count += 1
-                    info.state = ConnectionState.ERROR
-                
-                # Add back to available connections if not in error state
-                if info.state != ConnectionState.ERROR:
-                    self._available_connections.append(connection_id)
-    
-    async def _close_connection(self, connection_id: str) -> None:
-        """Close a database connection"""
-        async with self._connection_lock:
-            if connection_id in self._connections:
-                del self._connections[connection_id]
+                    self._close_connection_locked(connection_id)
             
-            if connection_id in self._connection_info:
-                self._connection_info[connection_id].state = ConnectionState.CLOSED
-                del self._connection_info[connection_id]
-            
-            # Remove from available connections
-            if connection_id in self._available_connections:
-                self._available_connections.remove(connection_id)
+            self._connection_available.notify()
+    
+    def _close_connection_locked(self, connection_id: str) -> None:
+        """Close a database connection; the caller must hold _connection_lock"""
+        if connection_id in self._connections:
+            del self._connections[connection_id]
+        
+        if connection_id in self._connection_info:
+            self._connection_info[connection_id].state = ConnectionState.CLOSED
+            del self._connection_info[connection_id]
+        
+        # Remove from available connections
+        if connection_id in self._available_connections:
+            self._available_connections.remove(connection_id)
     
     def _generate_cache_key(self, query_type: QueryType, table: str, 
                           conditions: Dict[str, Any]) -> str:
@@ -314,64 +323,76 @@ class DatabaseOptimizer:
                         # Remove expired cache entry
                         del self._query_cache[cache_key]
         
-        # Get database connection
-        connection_id, connection = await self._get_connection()
-        success = False
-        error_message = None
-        rows_affected = 0
-        
-        try:
-            # Execute the query
-            result = await operation(connection)
-            
-            # Count rows affected for non-SELECT queries
-            if query_type != QueryType.SELECT:
-                if isinstance(result, dict) and 'data' in result:
-                    rows_affected = len(result['data'])
-                elif isinstance(result, list):
-                    rows_affected = len(result)
+        # Borrow a pooled connection; it is released (or dropped, if the query raised) when the block exits
+        async with self.acquire() as connection:
+            success = False
+            error_message = None
+            rows_affected = 0
             
-            success = True
-            
-            # Cache SELECT query results
-            if use_cache and query_type == QueryType.SELECT and cache_key and result is not None:
-                async with self._query_lock:
-                    # Check cache size limit
-                    if len(self._query_cache) >= self._query_cache_size:
-                        # Remove oldest entries
-                        oldest_key = min(self._query_cache.keys(), 
-                                       key=lambda k: self._query_cache[k][1])
-                        del self._query_cache[oldest_key]
-                    
-                    self._query_cache[cache_key] = (result, datetime.now(timezone.utc))
-            
-            if not cache_hit:
-                self._performance_stats['cache_misses'] += 1
-            
-            return result
-            
-        except Exception as e:
-            error_message = str(e)
-            self._performance_stats['connection_errors'] += 1
-            logger.error(f"Database query failed: {e}")
-            raise e
-            
-        finally:
-            # Record metrics
-            execution_time_ms = (time.time() - start_time) * 1000
-            self._performance_stats['total_queries'] += 1
-            
-            # Update average query time
-            total_queries = self._performance_stats['total_queries']
-            current_avg = self._performance_stats['avg_query_time_ms']
-            self._performance_stats['avg_query_time_ms'] = (
-                (current_avg * (total_queries - 1) + execution_time_ms) / total_queries
-            )
-            
-            # Record slow queries
-            if execution_time_ms > 1000:  # Queries taking more than 1 second
-                self._performance_stats['slow_queries'] += 1
-                slow_query = QueryMetrics(
+            try:
+                # Execute the query
+                result = await operation(connection)
+                
+                # Count rows affected for non-SELECT queries
+                if query_type != QueryType.SELECT:
+                    if isinstance(result, dict) and 'data' in result:
+                        rows_affected = len(result['data'])
+                    elif isinstance(result, list):
+                        rows_affected = len(result)
+                
+                success = True
+                
+                # Cache SELECT query results
+                if use_cache and query_type == QueryType.SELECT and cache_key and result is not None:
+                    async with self._query_lock:
+                        # Check cache size limit
+                        if len(self._query_cache) >= self._query_cache_size:
+                            # Remove oldest entries
+                            oldest_key = min(self._query_cache.keys(), 
+                                           key=lambda k: self._query_cache[k][1])
+                            del self._query_cache[oldest_key]
+                        
+                        self._query_cache[cache_key] = (result, datetime.now(timezone.utc))
+                
+                if not cache_hit:
+                    self._performance_stats['cache_misses'] += 1
+                
+                return result
+                
+            except Exception as e:
+                error_message = str(e)
+                self._performance_stats['connection_errors'] += 1
+                logger.error(f"Database query failed: {e}")
+                raise e
+                
+            finally:
+                # Record metrics
+                execution_time_ms = (time.time() - start_time) * 1000
+                self._performance_stats['total_queries'] += 1
+                
+                # Update average query time
+                total_queries = self._performance_stats['total_queries']
+                current_avg = self._performance_stats['avg_query_time_ms']
+                self._performance_stats['avg_query_time_ms'] = (
+                    (current_avg * (total_queries - 1) + execution_time_ms) / total_queries
+                )
+                
+                # Record slow queries
+                if execution_time_ms > 1000:  # Queries taking more than 1 second
+                    self._performance_stats['slow_queries'] += 1
+                    slow_query = QueryMetrics(
+                        query_type=query_type,
+                        execution_time_ms=execution_time_ms,
+                        timestamp=datetime.now(timezone.utc),
+                        success=success,
+                        error_message=error_message,
+                        rows_affected=rows_affected,
+                        cache_hit=cache_hit
+                    )
+                    self._slow_queries.append(slow_query)
+                
+                # Add to metrics
+                metrics = QueryMetrics(
                     query_type=query_type,
                     execution_time_ms=execution_time_ms,
                     timestamp=datetime.now(timezone.utc),
@@ -380,22 +401,7 @@ class DatabaseOptimizer:
                     rows_affected=rows_affected,
                     cache_hit=cache_hit
                 )
-                self._slow_queries.append(slow_query)
-            
-            # Add to metrics
-            metrics = QueryMetrics(
-                query_type=query_type,
-                execution_time_ms=execution_time_ms,
-                timestamp=datetime.now(timezone.utc),
-                success=success,
-                error_message=error_message,
-                rows_affected=rows_affected,
-                cache_hit=cache_hit
-            )
-            self._query_metrics.append(metrics)
-            
-            # Release connection
-            await self._release_connection(connection_id, success)
+                self._query_metrics.append(metrics)
     
     def _optimize_guild_schedule_query(self, conditions: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize guild schedule queries"""
@@ -485,8 +491,10 @@ class DatabaseOptimizer:
                     connections_to_close.append(idle_connections[i][0])
             
             for connection_id in connections_to_close:
-                await self._close_connection(connection_id)
+                self._close_connection_locked(connection_id)
                 logger.info(f"Closed idle connection: {connection_id}")
+            if connections_to_close:
+                self._connection_available.notify_all()
     
     async def _cleanup_cache(self) -> None:
         """Clean up expired cache entries with aggressive cleanup for memory efficiency"""
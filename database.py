@@ -1,7 +1,10 @@
 import os
 import json
+import asyncio
 from supabase import create_client, Client # type: ignore
-from typing import Dict, Optional, List
+from supabase.client import ClientOptions # type: ignore
+from typing import Dict, Optional, List, Set, Mapping, Union
+from dataclasses import dataclass, asdict
 from datetime import date, datetime
 import socket
 from urllib.error import URLError
@@ -15,6 +18,20 @@ except ImportError:
 from dotenv import load_dotenv # type: ignore
 load_dotenv()
 
+from core.cache_manager import (
+    cache_guild_schedule, get_cached_guild_schedule, invalidate_guild_schedule_cache,
+    cache_guild_settings, get_cached_guild_settings, invalidate_guild_settings_cache,
+    cache_guilds_with_schedules, get_cached_guilds_with_schedules, invalidate_guilds_with_schedules_cache,
+    invalidate_guild_cache
+)
+from utils.timezone_utils import WEEKDAY_NAMES
+
+# TTLs for lookups the background tasks repeat every tick; writes through this
+# module invalidate them immediately, so the TTL only bounds out-of-band edits
+GUILD_SETTINGS_CACHE_TTL = 300
+GUILD_SCHEDULE_CACHE_TTL = 300
+GUILDS_WITH_SCHEDULES_CACHE_TTL = 60
+
 # Load database configuration from environment variables
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
@@ -22,6 +39,9 @@ SUPABASE_KEY = os.getenv('SUPABASE_KEY')
 if not SUPABASE_URL or not SUPABASE_KEY:
     raise ValueError("SUPABASE_URL and SUPABASE_KEY environment variables must be set")
 
+# Per-request timeout (seconds) for PostgREST queries
+DB_QUERY_TIMEOUT = int(os.getenv('DB_QUERY_TIMEOUT', '30'))
+
 def handle_connection_error(error: Exception, operation: str = "database operation") -> str:
     """
     Handle connection errors and return user-friendly error messages.
@@ -112,33 +132,44 @@ Solutions:
 supabase_client: Optional[Client] = None
 
 async def init_db_pool():
-    """Initialize the Supabase client"""
-    global supabase_client
-    if supabase_client is None:
-        supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    return supabase_client
+    """Initialize the Supabase client and its pooled HTTP session"""
+    return get_supabase_client()
 
 async def close_db_pool():
-    """Close the Supabase client (placeholder for consistency)"""
+    """Close the Supabase client, releasing its pooled HTTP connections"""
     global supabase_client
-    # Supabase client doesn't need explicit closing like connection pools
+    if supabase_client is not None:
+        try:
+            supabase_client.postgrest.session.close()
+        except Exception as e:
+            print(f"Error closing Supabase HTTP session: {e}")
     supabase_client = None
 
 def get_supabase_client():
-    """Get the Supabase client with improved error handling"""
+    """
+    Get the shared Supabase client with improved error handling.
+    
+    The client is created once and reused so every query goes through the same
+    keep-alive HTTP connection pool instead of reconnecting per call.
+    """
     global supabase_client
     if supabase_client is None:
         try:
-            supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
+            supabase_client = create_client(
+                SUPABASE_URL,
+                SUPABASE_KEY,
+                options=ClientOptions(postgrest_client_timeout=DB_QUERY_TIMEOUT)
+            )
         except Exception as e:
             error_msg = handle_connection_error(e, "creating Supabase client")
             print(error_msg)
             raise
     return supabase_client
 
-def execute_supabase_query(query_func, operation_name: str, default_return=None):
+async def execute_supabase_query(query_func, operation_name: str, default_return=None):
     """
     Execute a Supabase query with improved error handling.
+    The synchronous Supabase client runs in a worker thread so the request doesn't block the event loop.
     
     Args:
         query_func: Function that performs the Supabase query
@@ -149,7 +180,7 @@ def execute_supabase_query(query_func, operation_name: str, default_return=None)
         Query result or default_return if query fails
     """
     try:
-        return query_func()
+        return await asyncio.to_thread(query_func)
     except (ConnectError, ReadTimeout, ConnectTimeout, URLError, socket.gaierror, OSError) as e:
         error_msg = handle_connection_error(e, operation_name)
         print(error_msg)
@@ -159,9 +190,10 @@ def execute_supabase_query(query_func, operation_name: str, default_return=None)
         return default_return
 
 # DRY Helper Methods
-def _handle_database_operation(operation_func, operation_name: str, default_return=None):
+async def _handle_database_operation(operation_func, operation_name: str, default_return=None):
     """
     Helper method to standardize database operation error handling.
+    The operation runs in a worker thread, since the Supabase client is synchronous and would block the event loop.
     
     Args:
         operation_func: Function that performs the database operation  
@@ -172,7 +204,7 @@ def _handle_database_operation(operation_func, operation_name: str, default_retu
         Operation result or default_return if operation fails
     """
     try:
-        return operation_func()
+        return await asyncio.to_thread(operation_func)
     except Exception as e:
         print(f"Error {operation_name}: {e}")
         return default_return
@@ -245,19 +277,34 @@ def _check_record_exists(table_name: str, conditions: dict) -> bool:
     """
     try:
         client = get_supabase_client()
-        query = client.table(table_name).select('id')
+        # HEAD request: only the match count comes back, no row payload
+        query = client.table(table_name).select('id', count='exact', head=True)
         
         for field, value in conditions.items():
             query = query.eq(field, value)
         
         result = query.execute()
-        return len(result.data) > 0
+        return bool(result.count)
         
     except Exception as e:
         print(f"Error checking record existence in {table_name}: {e}")
         return False
 
-async def save_day_data(guild_id: int, day: str, data: dict) -> bool:
+@dataclass(frozen=True)
+class DayData:
+    """Event details for one day of a guild's weekly schedule"""
+    __slots__ = ('event_name', 'outfit', 'vehicle')
+    event_name: str
+    outfit: str
+    vehicle: str
+
+def _serialize_day_data(data: Union[DayData, Mapping]) -> str:
+    """Serialize day data to the JSON stored in a weekly_schedules day column"""
+    if isinstance(data, DayData):
+        data = asdict(data)
+    return json.dumps(dict(data))
+
+async def save_day_data(guild_id: int, day: str, data: Union[DayData, Mapping]) -> bool:
     """
     Save day data for a guild's weekly schedule.
     Creates a new row if guild doesn't exist, updates existing row otherwise.
@@ -265,7 +312,7 @@ async def save_day_data(guild_id: int, day: str, data: dict) -> bool:
     Args:
         guild_id: Discord guild ID
         day: Day of the week (e.g., "monday", "tuesday")
-        data: Dictionary containing event data
+        data: DayData or mapping containing event data
     
     Returns:
         True on success, False on failure
@@ -275,19 +322,22 @@ async def save_day_data(guild_id: int, day: str, data: dict) -> bool:
         
         # Column name for the day (e.g., "monday_data", "tuesday_data")
         day_column = f"{day}_data"
+        day_json = _serialize_day_data(data)
         
         # First, check if the guild already exists
-        existing_result = client.table('weekly_schedules').select('guild_id').eq('guild_id', guild_id).execute()
+        existing_result = await asyncio.to_thread(client.table('weekly_schedules').select('guild_id', count='exact', head=True).eq('guild_id', guild_id).execute)
         
-        if existing_result.data:
+        if existing_result.count:
             # Guild exists, update the specific day column
-            update_data = {day_column: json.dumps(data), 'updated_at': 'now()'}
-            result = client.table('weekly_schedules').update(update_data).eq('guild_id', guild_id).execute()
+            update_data = {day_column: day_json, 'updated_at': 'now()'}
+            result = await asyncio.to_thread(client.table('weekly_schedules').update(update_data).eq('guild_id', guild_id).execute)
         else:
             # Guild doesn't exist, create new row
-            insert_data = {'guild_id': guild_id, day_column: json.dumps(data)}
-            result = client.table('weekly_schedules').insert(insert_data).execute()
+            insert_data = {'guild_id': guild_id, day_column: day_json}
+            result = await asyncio.to_thread(client.table('weekly_schedules').insert(insert_data).execute)
+            await invalidate_guilds_with_schedules_cache()
         
+        await invalidate_guild_schedule_cache(guild_id)
         return True
         
     except Exception as e:
@@ -304,6 +354,10 @@ async def get_guild_schedule(guild_id: int) -> dict:
     Returns:
         Dictionary containing all day data, empty dict if no schedule found
     """
+    cached_schedule = await get_cached_guild_schedule(guild_id)
+    if cached_schedule is not None:
+        return dict(cached_schedule)
+    
     def operation():
         client = get_supabase_client()
         result = client.table('weekly_schedules').select('*').eq('guild_id', guild_id).execute()
@@ -314,9 +368,7 @@ async def get_guild_schedule(guild_id: int) -> dict:
         # Extract day data from the row
         row = result.data[0]
         schedule_data = {}
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        
-        for day in days:
+        for day in WEEKDAY_NAMES:
             day_column = f"{day}_data"
             if day_column in row and row[day_column]:
                 # Parse JSON data
@@ -324,7 +376,12 @@ async def get_guild_schedule(guild_id: int) -> dict:
         
         return schedule_data
     
-    return _handle_database_operation(operation, f"getting guild schedule for guild {guild_id}", {})
+    schedule_data = await _handle_database_operation(operation, f"getting guild schedule for guild {guild_id}", None)
+    if schedule_data is None:
+        return {}
+    
+    await cache_guild_schedule(guild_id, schedule_data, GUILD_SCHEDULE_CACHE_TTL)
+    return dict(schedule_data)
 
 async def get_all_guilds_with_schedules() -> List[int]:
     """
@@ -333,6 +390,10 @@ async def get_all_guilds_with_schedules() -> List[int]:
     Returns:
         List of guild IDs
     """
+    cached_guild_ids = await get_cached_guilds_with_schedules()
+    if cached_guild_ids is not None:
+        return list(cached_guild_ids)
+    
     def operation():
         client = get_supabase_client()
         result = client.table('weekly_schedules').select('guild_id').execute()
@@ -342,7 +403,12 @@ async def get_all_guilds_with_schedules() -> List[int]:
         
         return [row['guild_id'] for row in result.data]
     
-    return _handle_database_operation(operation, "getting guilds with schedules", [])
+    guild_ids = await _handle_database_operation(operation, "getting guilds with schedules", None)
+    if guild_ids is None:
+        return []
+    
+    await cache_guilds_with_schedules(guild_ids, GUILDS_WITH_SCHEDULES_CACHE_TTL)
+    return list(guild_ids)
 
 async def save_guild_settings(guild_id: int, settings: dict) -> bool:
     """
@@ -360,28 +426,30 @@ async def save_guild_settings(guild_id: int, settings: dict) -> bool:
         print(f"Attempting to save guild settings for guild {guild_id}: {settings}")
         
         # First, ensure the guild exists in weekly_schedules (required by foreign key)
-        weekly_schedule_result = client.table('weekly_schedules').select('guild_id').eq('guild_id', guild_id).execute()
-        if not weekly_schedule_result.data:
+        weekly_schedule_result = await asyncio.to_thread(client.table('weekly_schedules').select('guild_id', count='exact', head=True).eq('guild_id', guild_id).execute)
+        if not weekly_schedule_result.count:
             # Create a placeholder entry in weekly_schedules
             placeholder_data = {'guild_id': guild_id}
-            client.table('weekly_schedules').insert(placeholder_data).execute()
+            await asyncio.to_thread(client.table('weekly_schedules').insert(placeholder_data).execute)
+            await invalidate_guilds_with_schedules_cache()
             print(f"Created placeholder weekly_schedules entry for guild {guild_id}")
         
         # Check if guild settings already exist
-        existing_result = client.table('guild_settings').select('guild_id').eq('guild_id', guild_id).execute()
-        print(f"Existing settings check result: {existing_result.data}")
+        existing_result = await asyncio.to_thread(client.table('guild_settings').select('guild_id', count='exact', head=True).eq('guild_id', guild_id).execute)
+        print(f"Existing settings check result: {existing_result.count}")
         
-        if existing_result.data:
+        if existing_result.count:
             # Update existing settings
             settings['updated_at'] = 'now()'
-            result = client.table('guild_settings').update(settings).eq('guild_id', guild_id).execute()
+            result = await asyncio.to_thread(client.table('guild_settings').update(settings).eq('guild_id', guild_id).execute)
             print(f"Updated existing settings: {result.data}")
         else:
             # Create new settings
             settings['guild_id'] = guild_id
-            result = client.table('guild_settings').insert(settings).execute()
+            result = await asyncio.to_thread(client.table('guild_settings').insert(settings).execute)
             print(f"Created new settings: {result.data}")
         
+        await invalidate_guild_settings_cache(guild_id)
         return True
         
     except Exception as e:
@@ -398,6 +466,10 @@ async def get_guild_settings(guild_id: int) -> dict:
     Returns:
         Dictionary containing guild settings, empty dict if not found
     """
+    cached_settings = await get_cached_guild_settings(guild_id)
+    if cached_settings is not None:
+        return dict(cached_settings)
+    
     def operation():
         client = get_supabase_client()
         result = client.table('guild_settings').select('*').eq('guild_id', guild_id).execute()
@@ -407,7 +479,55 @@ async def get_guild_settings(guild_id: int) -> dict:
         
         return result.data[0]
     
-    return _handle_database_operation(operation, f"getting guild settings for guild {guild_id}", {})
+    settings = await _handle_database_operation(operation, f"getting guild settings for guild {guild_id}", None)
+    if settings is None:
+        return {}
+    
+    await cache_guild_settings(guild_id, settings, GUILD_SETTINGS_CACHE_TTL)
+    return dict(settings)
+
+async def get_guild_settings_bulk(guild_ids: List[int]) -> Dict[int, dict]:
+    """
+    Get guild settings for many guilds with a single query.
+    
+    Cached settings are reused; only guilds missing from the cache are queried.
+    
+    Args:
+        guild_ids: Discord guild IDs
+    
+    Returns:
+        Dictionary mapping guild ID to its settings (guilds without settings are omitted)
+    """
+    settings_by_guild = {}
+    missing_guild_ids = []
+    for guild_id in guild_ids:
+        cached_settings = await get_cached_guild_settings(guild_id)
+        if cached_settings is None:
+            missing_guild_ids.append(guild_id)
+        elif cached_settings:
+            settings_by_guild[guild_id] = dict(cached_settings)
+    
+    if not missing_guild_ids:
+        return settings_by_guild
+    
+    def operation():
+        client = get_supabase_client()
+        result = client.table('guild_settings').select('*').in_('guild_id', missing_guild_ids).execute()
+        return result.data if result.data else []
+    
+    rows = await _handle_database_operation(operation, f"getting guild settings for {len(missing_guild_ids)} guilds", None)
+    if rows is None:
+        return settings_by_guild
+    
+    fetched = {row['guild_id']: row for row in rows}
+    for guild_id in missing_guild_ids:
+        # Cache misses too, matching get_guild_settings' empty-dict result
+        settings = fetched.get(guild_id, {})
+        await cache_guild_settings(guild_id, settings, GUILD_SETTINGS_CACHE_TTL)
+        if settings:
+            settings_by_guild[guild_id] = dict(settings)
+    
+    return settings_by_guild
 
 async def get_schedule_last_updated(guild_id: int) -> Optional[datetime]:
     """
@@ -422,7 +542,7 @@ async def get_schedule_last_updated(guild_id: int) -> Optional[datetime]:
     try:
         client = get_supabase_client()
         
-        result = client.table('weekly_schedules').select('updated_at').eq('guild_id', guild_id).execute()
+        result = await asyncio.to_thread(client.table('weekly_schedules').select('updated_at').eq('guild_id', guild_id).execute)
         
         if not result.data:
             return None
@@ -450,7 +570,7 @@ async def save_admin_notification_sent(guild_id: int, notification_date: date) -
         client = get_supabase_client()
         
         # Check if notification record already exists
-        existing_result = client.table('admin_notifications').select('id').eq('guild_id', guild_id).eq('notification_date', notification_date.isoformat()).execute()
+        existing_result = await asyncio.to_thread(client.table('admin_notifications').select('id').eq('guild_id', guild_id).eq('notification_date', notification_date.isoformat()).execute)
         
         if existing_result.data:
             return True  # Already recorded
@@ -462,7 +582,7 @@ async def save_admin_notification_sent(guild_id: int, notification_date: date) -
             'notification_type': 'schedule_not_setup'
         }
         
-        result = client.table('admin_notifications').insert(insert_data).execute()
+        result = await asyncio.to_thread(client.table('admin_notifications').insert(insert_data).execute)
         return True
         
     except Exception as e:
@@ -484,7 +604,7 @@ async def check_admin_notification_sent(guild_id: int, notification_date: date)
         'guild_id': guild_id,
         'notification_date': notification_date.isoformat()
     }
-    return _check_record_exists('admin_notifications', conditions)
+    return await asyncio.to_thread(_check_record_exists, 'admin_notifications', conditions)
 
 async def save_daily_post(guild_id: int, channel_id: int, message_id: int, event_date: date, day_of_week: str, event_data: dict) -> Optional[str]:
     """
@@ -513,7 +633,7 @@ async def save_daily_post(guild_id: int, channel_id: int, message_id: int, event
             'event_data': json.dumps(event_data)
         }
         
-        result = client.table('daily_posts').insert(insert_data).execute()
+        result = await asyncio.to_thread(client.table('daily_posts').insert(insert_data).execute)
         
         if result.data:
             return result.data[0]['id']
@@ -524,20 +644,21 @@ async def save_daily_post(guild_id: int, channel_id: int, message_id: int, event
         print(f"Error saving daily post for guild {guild_id}: {e}")
         return None
 
-async def get_daily_post(guild_id: int, event_date: date) -> Optional[dict]:
+async def get_daily_post(guild_id: int, event_date: date, columns: str = '*') -> Optional[dict]:
     """
     Get a daily post for a specific date.
     
     Args:
         guild_id: Discord guild ID
         event_date: Date of the event
+        columns: Comma-separated columns to select (defaults to all columns)
     
     Returns:
         Post data dictionary or None if not found
     """
     def operation():
         client = get_supabase_client()
-        result = client.table('daily_posts').select('*').eq('guild_id', guild_id).eq('event_date', event_date.isoformat()).execute()
+        result = client.table('daily_posts').select(columns).eq('guild_id', guild_id).eq('event_date', event_date.isoformat()).execute()
         
         if not result.data:
             return None
@@ -546,7 +667,71 @@ async def get_daily_post(guild_id: int, event_date: date) -> Optional[dict]:
         _parse_event_data_json(result.data)
         return result.data[0]
     
-    return _handle_database_operation(operation, f"getting daily post for guild {guild_id}, date {event_date}", None)
+    return await _handle_database_operation(operation, f"getting daily post for guild {guild_id}, date {event_date}", None)
+
+async def get_daily_post_summary(guild_id: int, event_date: date) -> Optional[dict]:
+    """
+    Get a daily post's metadata for a specific date without its event_data payload.
+    
+    Reads from the daily_posts_summary view, which exposes event_data's
+    event_name as a top-level column. Falls back to daily_posts if the view's
+    migration (migration_add_daily_posts_summary.sql) hasn't been run.
+    
+    Args:
+        guild_id: Discord guild ID
+        event_date: Date of the event
+    
+    Returns:
+        Post summary dictionary (including event_name) or None if not found
+    """
+    def operation():
+        client = get_supabase_client()
+        try:
+            result = client.table('daily_posts_summary').select('id, channel_id, message_id, event_name').eq('guild_id', guild_id).eq('event_date', event_date.isoformat()).limit(1).execute()
+            return result.data[0] if result.data else None
+        except Exception as e:
+            print(f"daily_posts_summary view unavailable, falling back to daily_posts: {e}")
+        
+        result = client.table('daily_posts').select('id, channel_id, message_id, event_data').eq('guild_id', guild_id).eq('event_date', event_date.isoformat()).limit(1).execute()
+        if not result.data:
+            return None
+        
+        post = _parse_event_data_json(result.data)[0]
+        event_data = post.pop('event_data', None)
+        post['event_name'] = event_data.get('event_name') if isinstance(event_data, dict) else None
+        return post
+    
+    return await _handle_database_operation(operation, f"getting daily post summary for guild {guild_id}, date {event_date}", None)
+
+async def get_daily_posts_bulk(guild_ids: List[int], event_date: date, columns: str = '*') -> Dict[int, dict]:
+    """
+    Get the daily posts for many guilds on a specific date with a single query.
+    
+    Args:
+        guild_ids: Discord guild IDs
+        event_date: Date of the event
+        columns: Comma-separated columns to select (must include guild_id)
+    
+    Returns:
+        Dictionary mapping guild ID to its post data (guilds without a post are omitted)
+    """
+    if not guild_ids:
+        return {}
+    
+    def operation():
+        client = get_supabase_client()
+        result = client.table('daily_posts').select(columns).in_('guild_id', guild_ids).eq('event_date', event_date.isoformat()).execute()
+        
+        if not result.data:
+            return {}
+        
+        # Use helper method to parse event_data JSON; keep the first post per guild like get_daily_post
+        posts_by_guild = {}
+        for post in _parse_event_data_json(result.data):
+            posts_by_guild.setdefault(post['guild_id'], post)
+        return posts_by_guild
+    
+    return await _handle_database_operation(operation, f"getting daily posts for {len(guild_ids)} guilds, date {event_date}", {})
 
 async def get_all_daily_posts_for_date(guild_id: int, event_date: date) -> List[dict]:
     """
@@ -572,7 +757,25 @@ async def get_all_daily_posts_for_date(guild_id: int, event_date: date) -> List[
         # Use helper method to parse event_data JSON for all posts
         return _parse_event_data_json(result.data)
     
-    return _handle_database_operation(operation, f"getting all daily posts for guild {guild_id}, date {event_date}", [])
+    return await _handle_database_operation(operation, f"getting all daily posts for guild {guild_id}, date {event_date}", [])
+
+async def list_recent_daily_posts(guild_id: int, limit: int = 5) -> List[dict]:
+    """
+    Get the most recent daily posts for a guild, newest event date first.
+    
+    Args:
+        guild_id: Discord guild ID
+        limit: Maximum number of posts to return
+    
+    Returns:
+        List of dictionaries with event_date, message_id and channel_id
+    """
+    def operation():
+        client = get_supabase_client()
+        result = client.table('daily_posts').select('event_date, message_id, channel_id').eq('guild_id', guild_id).order('event_date', desc=True).limit(limit).execute()
+        return result.data if result.data else []
+    
+    return await _handle_database_operation(operation, f"listing recent daily posts for guild {guild_id}", [])
 
 async def get_aggregated_rsvp_responses_for_date(guild_id: int, event_date: date) -> List[dict]:
     """
@@ -634,7 +837,7 @@ async def save_rsvp_response(post_id: str, user_id: int, guild_id: int, response
         client = get_supabase_client()
         
         # Check if user already has an RSVP for this post
-        existing_result = client.table('rsvp_responses').select('id').eq('post_id', post_id).eq('user_id', user_id).execute()
+        existing_result = await asyncio.to_thread(client.table('rsvp_responses').select('id').eq('post_id', post_id).eq('user_id', user_id).execute)
         
         if existing_result.data:
             # Update existing RSVP
@@ -642,7 +845,7 @@ async def save_rsvp_response(post_id: str, user_id: int, guild_id: int, response
                 'response_type': response_type,
                 'responded_at': 'now()'
             }
-            result = client.table('rsvp_responses').update(update_data).eq('post_id', post_id).eq('user_id', user_id).execute()
+            result = await asyncio.to_thread(client.table('rsvp_responses').update(update_data).eq('post_id', post_id).eq('user_id', user_id).execute)
         else:
             # Create new RSVP
             insert_data = {
@@ -651,7 +854,7 @@ async def save_rsvp_response(post_id: str, user_id: int, guild_id: int, response
                 'guild_id': guild_id,
                 'response_type': response_type
             }
-            result = client.table('rsvp_responses').insert(insert_data).execute()
+            result = await asyncio.to_thread(client.table('rsvp_responses').insert(insert_data).execute)
         
         # Invalidate cache entries related to this RSVP response
         try:
@@ -689,7 +892,7 @@ async def get_rsvp_responses(post_id: str) -> List[dict]:
         
         return result.data
     
-    return _handle_database_operation(operation, f"getting RSVP responses for post {post_id}", [])
+    return await _handle_database_operation(operation, f"getting RSVP responses for post {post_id}", [])
 
 async def save_reminder_sent(post_id: str, guild_id: int, reminder_type: str, event_date: date) -> bool:
     """
@@ -714,7 +917,7 @@ async def save_reminder_sent(post_id: str, guild_id: int, reminder_type: str, ev
             'event_date': event_date.isoformat()
         }
         
-        result = client.table('reminder_sends').insert(insert_data).execute()
+        result = await asyncio.to_thread(client.table('reminder_sends').insert(insert_data).execute)
         
         return True
         
@@ -722,6 +925,58 @@ async def save_reminder_sent(post_id: str, guild_id: int, reminder_type: str, ev
         print(f"Error saving reminder sent record for post {post_id}, type {reminder_type}: {e}")
         return False
 
+async def try_claim_reminder(post_id: str, guild_id: int, reminder_type: str, event_date) -> bool:
+    """
+    Record a reminder send unless one already exists, in a single atomic insert.
+    
+    Uses INSERT ... ON CONFLICT (post_id, reminder_type) DO NOTHING, so when several
+    callers race for the same reminder exactly one of them claims it.
+    
+    Args:
+        post_id: UUID of the daily post
+        guild_id: Discord guild ID
+        reminder_type: Type of reminder ('4pm', '1_hour', '15_minutes')
+        event_date: Date of the event (a date, or the ISO string stored on the post)
+    
+    Returns:
+        True if this call recorded the reminder, False if it was already claimed or the insert failed
+    """
+    insert_data = {
+        'post_id': post_id,
+        'guild_id': guild_id,
+        'reminder_type': reminder_type,
+        'event_date': str(event_date)
+    }
+    
+    def operation():
+        client = get_supabase_client()
+        result = client.table('reminder_sends').upsert(
+            insert_data, on_conflict='post_id,reminder_type', ignore_duplicates=True
+        ).execute()
+        
+        # Rows skipped by ON CONFLICT DO NOTHING are not returned
+        return bool(result.data)
+    
+    return await _handle_database_operation(operation, f"claiming {reminder_type} reminder for post {post_id}", False)
+
+async def release_reminder_claim(post_id: str, reminder_type: str) -> bool:
+    """
+    Delete a reminder send record so the reminder can be claimed again (used when sending fails).
+    
+    Args:
+        post_id: UUID of the daily post
+        reminder_type: Type of reminder ('4pm', '1_hour', '15_minutes')
+    
+    Returns:
+        True on success, False on failure
+    """
+    def operation():
+        client = get_supabase_client()
+        client.table('reminder_sends').delete().eq('post_id', post_id).eq('reminder_type', reminder_type).execute()
+        return True
+    
+    return await _handle_database_operation(operation, f"releasing {reminder_type} reminder for post {post_id}", False)
+
 async def check_reminder_sent(post_id: str, reminder_type: str) -> bool:
     """
     Check if a reminder of a specific type has already been sent for a post.
@@ -737,7 +992,31 @@ async def check_reminder_sent(post_id: str, reminder_type: str) -> bool:
         'post_id': post_id,
         'reminder_type': reminder_type
     }
-    return _check_record_exists('reminder_sends', conditions)
+    return await asyncio.to_thread(_check_record_exists, 'reminder_sends', conditions)
+
+async def get_sent_reminders_bulk(post_ids: List[str]) -> Dict[str, Set[str]]:
+    """
+    Get the reminder types already sent for many posts with a single query.
+    
+    Args:
+        post_ids: UUIDs of the daily posts
+    
+    Returns:
+        Dictionary mapping post ID to the set of reminder types sent (posts with none are omitted)
+    """
+    if not post_ids:
+        return {}
+    
+    def operation():
+        client = get_supabase_client()
+        result = client.table('reminder_sends').select('post_id, reminder_type').in_('post_id', post_ids).execute()
+        
+        sent_by_post = {}
+        for row in result.data or []:
+            sent_by_post.setdefault(row['post_id'], set()).add(row['reminder_type'])
+        return sent_by_post
+    
+    return await _handle_database_operation(operation, f"getting sent reminders for {len(post_ids)} posts", {})
 
 async def clear_reminder_tracking(post_id: str) -> bool:
     """
@@ -753,7 +1032,7 @@ async def clear_reminder_tracking(post_id: str) -> bool:
         client = get_supabase_client()
         
         # Delete all reminder records for this post
-        result = client.table('reminder_sends').delete().eq('post_id', post_id).execute()
+        result = await asyncio.to_thread(client.table('reminder_sends').delete().eq('post_id', post_id).execute)
         
         print(f"Cleared {len(result.data) if result.data else 0} reminder tracking records for post {post_id}")
         return True
@@ -766,6 +1045,8 @@ async def get_guilds_needing_reminders() -> List[dict]:
     """
     Get all guilds that have events today and need reminders sent.
     
+    Guilds with reminders disabled are filtered out by the query itself.
+    
     Returns:
         List of guild data with reminder settings
     """
@@ -773,23 +1054,62 @@ async def get_guilds_needing_reminders() -> List[dict]:
         client = get_supabase_client()
         result = client.table('weekly_schedules').select(
             'guild_id, guild_settings!inner(*)'
-        ).execute()
+        ).eq('guild_settings.reminder_enabled', True).execute()
         
         if not result.data:
             return []
         
         return result.data
     
-    return execute_supabase_query(query, "getting guilds needing reminders", [])
+    return await execute_supabase_query(query, "getting guilds needing reminders", [])
+
+async def is_guild_in_reminder_query(guild_id: int) -> bool:
+    """
+    Check whether a guild would be returned by get_guilds_needing_reminders().
+    
+    Uses a head-only count request so no row data is transferred.
+    
+    Args:
+        guild_id: Discord guild ID
+    
+    Returns:
+        True if the guild has a weekly schedule and reminders enabled, False otherwise
+    """
+    def query():
+        client = get_supabase_client()
+        result = client.table('weekly_schedules').select(
+            'guild_id, guild_settings!inner(guild_id)', count='exact', head=True
+        ).eq('guild_settings.reminder_enabled', True).eq('guild_id', guild_id).execute()
+        
+        return (result.count or 0) > 0
+    
+    return await execute_supabase_query(query, f"checking reminder query for guild {guild_id}", False)
 
-async def update_day_data(guild_id: int, day: str, data: dict) -> bool:
+async def count_guilds_needing_reminders() -> int:
+    """
+    Count the guilds that get_guilds_needing_reminders() would return.
+    
+    Returns:
+        Number of guilds with a weekly schedule and reminders enabled
+    """
+    def query():
+        client = get_supabase_client()
+        result = client.table('weekly_schedules').select(
+            'guild_id, guild_settings!inner(guild_id)', count='exact', head=True
+        ).eq('guild_settings.reminder_enabled', True).execute()
+        
+        return result.count or 0
+    
+    return await execute_supabase_query(query, "counting guilds needing reminders", 0)
+
+async def update_day_data(guild_id: int, day: str, data: Union[DayData, Mapping]) -> bool:
     """
     Update day data for a guild's weekly schedule.
     
     Args:
         guild_id: Discord guild ID
         day: Day of the week (e.g., "monday", "tuesday")
-        data: Dictionary containing updated event data
+        data: DayData or mapping containing updated event data
     
     Returns:
         True on success, False on failure
@@ -799,30 +1119,37 @@ async def update_day_data(guild_id: int, day: str, data: dict) -> bool:
         
         # Column name for the day (e.g., "monday_data", "tuesday_data")
         day_column = f"{day}_data"
+        day_json = _serialize_day_data(data)
         
         # Update the specific day column
-        update_data = {day_column: json.dumps(data), 'updated_at': 'now()'}
-        result = client.table('weekly_schedules').update(update_data).eq('guild_id', guild_id).execute()
+        update_data = {day_column: day_json, 'updated_at': 'now()'}
+        result = await asyncio.to_thread(client.table('weekly_schedules').update(update_data).eq('guild_id', guild_id).execute)
         
+        await invalidate_guild_schedule_cache(guild_id)
         return True
         
     except Exception as e:
         print(f"Error updating day data for guild {guild_id}, day {day}: {e}")
         return False
 
-async def get_old_daily_posts(cutoff_date: date) -> List[dict]:
+async def get_old_daily_posts(cutoff_date: date, guild_id: Optional[int] = None, columns: str = '*') -> List[dict]:
     """
-    Get all daily posts older than the cutoff date for cleanup.
+    Get daily posts older than the cutoff date for cleanup.
     
     Args:
         cutoff_date: Date before which posts should be deleted
+        guild_id: Only return this guild's posts (all guilds if None)
+        columns: Comma-separated columns to select
     
     Returns:
         List of post data dictionaries
     """
     def operation():
         client = get_supabase_client()
-        result = client.table('daily_posts').select('*').lt('event_date', cutoff_date.isoformat()).execute()
+        query = client.table('daily_posts').select(columns).lt('event_date', cutoff_date.isoformat())
+        if guild_id is not None:
+            query = query.eq('guild_id', guild_id)
+        result = query.execute()
         
         if not result.data:
             return []
@@ -830,7 +1157,7 @@ async def get_old_daily_posts(cutoff_date: date) -> List[dict]:
         # Use helper method to parse event_data JSON for each post
         return _parse_event_data_json(result.data)
     
-    return _handle_database_operation(operation, f"getting old daily posts before {cutoff_date}", [])
+    return await _handle_database_operation(operation, f"getting old daily posts before {cutoff_date}", [])
 
 async def delete_daily_post(post_id: str) -> bool:
     """
@@ -846,7 +1173,7 @@ async def delete_daily_post(post_id: str) -> bool:
     try:
         client = get_supabase_client()
         
-        result = client.table('daily_posts').delete().eq('id', post_id).execute()
+        result = await asyncio.to_thread(client.table('daily_posts').delete().eq('id', post_id).execute)
         
         return True
         
@@ -871,7 +1198,7 @@ async def get_rsvp_responses_for_date_range(guild_id: int, start_date: date, end
         client = get_supabase_client()
         
         # Get all posts in the date range
-        result = client.table('daily_posts').select('*').eq('guild_id', guild_id).gte('event_date', start_date.isoformat()).lte('event_date', end_date.isoformat()).order('event_date').execute()
+        result = await asyncio.to_thread(client.table('daily_posts').select('*').eq('guild_id', guild_id).gte('event_date', start_date.isoformat()).lte('event_date', end_date.isoformat()).order('event_date').execute)
         
         if not result.data:
             return []
@@ -921,7 +1248,7 @@ async def get_all_guilds_with_daily_posts() -> List[int]:
         guild_ids = list(set(post['guild_id'] for post in result.data))
         return guild_ids
     
-    return _handle_database_operation(operation, "getting guilds with daily posts", [])
+    return await _handle_database_operation(operation, "getting guilds with daily posts", [])
 
 async def get_all_stored_guild_ids() -> List[int]:
     """
@@ -955,7 +1282,7 @@ async def get_all_stored_guild_ids() -> List[int]:
         
         return list(all_guild_ids)
     
-    return _handle_database_operation(operation, "getting all stored guild IDs", [])
+    return await _handle_database_operation(operation, "getting all stored guild IDs", [])
 
 async def get_guilds_with_recent_activity(days_threshold: int = 21) -> List[int]:
     """
@@ -1007,7 +1334,7 @@ async def get_guilds_with_recent_activity(days_threshold: int = 21) -> List[int]
         
         return list(active_guild_ids)
     
-    return _handle_database_operation(operation, f"getting guilds with activity in last {days_threshold} days", [])
+    return await _handle_database_operation(operation, f"getting guilds with activity in last {days_threshold} days", [])
 
 async def cleanup_orphaned_guild_data(orphaned_guild_ids: List[int]) -> dict:
     """
@@ -1053,7 +1380,7 @@ async def cleanup_orphaned_guild_data(orphaned_guild_ids: List[int]) -> dict:
                 print(f"Cleaning {table_name} ({description})...")
                 
                 # Delete records for orphaned guilds
-                result = client.table(table_name).delete().in_(guild_id_column, orphaned_guild_ids).execute()
+                result = await asyncio.to_thread(client.table(table_name).delete().in_(guild_id_column, orphaned_guild_ids).execute)
                 
                 deleted_count = len(result.data) if result.data else 0
                 cleanup_stats["tables_cleaned"][table_name] = deleted_count
@@ -1069,12 +1396,16 @@ async def cleanup_orphaned_guild_data(orphaned_guild_ids: List[int]) -> dict:
                 print(f"  ❌ {error_msg}")
                 continue
         
+        # Drop cached settings/schedules for the removed guilds
+        for guild_id in orphaned_guild_ids:
+            await invalidate_guild_cache(guild_id)
+        
         # Step 2: Verify complete deletion
         print("\nVerifying complete deletion...")
         for table_name, guild_id_column, description in cleanup_tables:
             try:
                 # Check if any records still exist for these guilds
-                verification_result = client.table(table_name).select(guild_id_column).in_(guild_id_column, orphaned_guild_ids).execute()
+                verification_result = await asyncio.to_thread(client.table(table_name).select(guild_id_column).in_(guild_id_column, orphaned_guild_ids).execute)
                 remaining_count = len(verification_result.data) if verification_result.data else 0
                 
                 cleanup_stats["verification"][table_name] = {
@@ -0,0 +1,26 @@
+-- Migration: Add daily_posts_summary view
+-- Exposes event_data->>'event_name' as a top-level column so callers that only
+-- need post metadata don't have to fetch the whole event_data JSONB blob.
+-- Optional: without this view the bot reads event_name from daily_posts instead.
+
+-- Create (or refresh) the view with the scalar daily_posts columns
+CREATE OR REPLACE VIEW daily_posts_summary
+WITH (security_invoker = true) AS
+SELECT
+    id,
+    guild_id,
+    channel_id,
+    message_id,
+    event_date,
+    day_of_week,
+    -- save_daily_post stores event_data as a JSON-encoded string scalar, so unwrap it
+    -- before reading the key; ->> on a string scalar would always be NULL
+    CASE jsonb_typeof(event_data)
+        WHEN 'string' THEN (event_data #>> '{}')::jsonb ->> 'event_name'
+        ELSE event_data ->> 'event_name'
+    END AS event_name,
+    created_at
+FROM daily_posts;
+
+-- Add comment for documentation
+COMMENT ON VIEW daily_posts_summary IS 'daily_posts without the event_data JSONB payload, with event_name lifted to a column';
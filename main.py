@@ -71,7 +71,7 @@ reconnect_attempts = 0
 MAX_RECONNECT_ATTEMPTS = 5
 
 # Specific user IDs that have access to all admin commands
-ADMIN_USER_IDS = [300157754012860425, 1354616827380236409]
+ADMIN_USER_IDS = frozenset({300157754012860425, 1354616827380236409})
 
 # DRY Helper Methods
 def _check_admin_permissions(inter: disnake.ApplicationCommandInteraction) -> bool:
@@ -5,8 +5,9 @@ Follows SOLID, DRY, and KISS principles for maintainable code.
 """
 
 import os
-import pytz
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from typing import Optional
 import logging
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 from dotenv import load_dotenv
 load_dotenv()
 
+# Lowercase weekday names indexed by datetime.weekday(); locale-independent unlike strftime('%A')
+WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
 class TimezoneManager:
     """
     Centralized timezone management for the Discord RSVP Bot.
@@ -30,21 +34,25 @@ class TimezoneManager:
         self._display_name = os.getenv('TIMEZONE_DISPLAY_NAME', 'US East Coast')
         
         try:
-            self._timezone = pytz.timezone(self._timezone_name)
+            self._timezone = ZoneInfo(self._timezone_name)
             logger.info(f"Timezone initialized: {self._timezone_name} ({self._display_name})")
-        except pytz.exceptions.UnknownTimeZoneError:
+        except (ZoneInfoNotFoundError, ValueError):
             logger.error(f"Invalid timezone '{self._timezone_name}' in .env file. Falling back to America/New_York")
-            self._timezone = pytz.timezone('America/New_York')
+            self._timezone = ZoneInfo('America/New_York')
             self._timezone_name = 'America/New_York'
             self._display_name = 'US East Coast'
+        
+        # today() cache: the local date and the epoch time of the next local midnight, when it expires
+        self._today = None
+        self._today_expires_at = 0.0
     
     @property
-    def timezone(self) -> pytz.BaseTzInfo:
+    def timezone(self) -> ZoneInfo:
         """
         Get the configured timezone object.
         
         Returns:
-            pytz timezone object
+            ZoneInfo timezone object
         """
         return self._timezone
     
@@ -80,11 +88,17 @@ class TimezoneManager:
     def today(self) -> datetime.date:
         """
         Get today's date in the configured timezone.
+        The date is cached until the next local midnight, so repeated calls skip the timezone conversion.
         
         Returns:
             Today's date
         """
-        return self.now().date()
+        if time.time() >= self._today_expires_at:
+            today = self.now().date()
+            next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), tzinfo=self._timezone)
+            self._today = today
+            self._today_expires_at = next_midnight.timestamp()
+        return self._today
     
     def localize(self, dt: datetime) -> datetime:
         """
@@ -96,7 +110,7 @@ class TimezoneManager:
         Returns:
             Localized datetime object
         """
-        return self._timezone.localize(dt)
+        return dt.replace(tzinfo=self._timezone)
     
     def to_utc(self, dt: datetime) -> datetime:
         """
@@ -171,7 +185,7 @@ class TimezoneManager:
         """
         if dt is None:
             dt = self.now()
-        return dt.strftime('%A').lower()
+        return WEEKDAY_NAMES[dt.weekday()]
     
     def is_dst_active(self, dt: Optional[datetime] = None) -> bool:
         """
@@ -208,7 +222,7 @@ class TimezoneManager:
 timezone_manager = TimezoneManager()
 
 # Convenience functions for backward compatibility
-def get_bot_timezone() -> pytz.BaseTzInfo:
+def get_bot_timezone() -> ZoneInfo:
     """Get the configured timezone object."""
     return timezone_manager.timezone
 